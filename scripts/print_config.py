@@ -0,0 +1,28 @@
+"""Prints the bot's trading configuration after it has been validated.
+
+Typical usage (from the project root):
+    PYTHONPATH=src python3 scripts/print_config.py
+
+Expects API keys to be set as environment variables as specified in config.py.
+"""
+
+from trading import config
+
+
+def main() -> None:
+    """Prints each trading pair's settings and its candle granularity."""
+    print("API Key Loaded:", bool(config.COINBASE_API_KEY))
+    print("Log Level:", config.LOG_LEVEL)
+    for pair_id, pair_config in config.TRADING_PAIRS.items():
+        print(f"\nConfiguration for {pair_id}:")
+        for key, value in pair_config.items():
+            print(f"  {key}: {value}")
+        granularity = pair_config["candle_granularity_api_name"]
+        seconds = config.CANDLE_GRANULARITY_SECONDS[granularity]
+        print(f"  Candle Granularity (seconds): {seconds}")
+
+    print("\nConfig loaded and validated successfully.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Startup smoke test of the Coinbase API for every configured trading pair.
+
+Requests accounts, candles and order books concurrently via
+CoinbaseClient.health_check and exits non-zero if any of them fails.
+
+Typical usage (from the project root):
+    PYTHONPATH=src python3 scripts/smoke_client.py
+
+Expects API keys to be set as environment variables as specified in config.py.
+"""
+
+import asyncio
+import sys
+
+from trading import config
+from trading.coinbase_client import CoinbaseClient
+from trading.logger import LoggerDirectoryError, setup_logging
+
+
+def main() -> int:
+    """Runs the health check, prints each result and returns the exit code."""
+    try:
+        setup_logging(
+            level=config.LOG_LEVEL,
+            log_file=config.LOG_FILE,
+            persistence_dir=config.PERSISTENCE_DIR,
+        )
+    except (LoggerDirectoryError, ValueError) as e:
+        sys.stderr.write(f"CRITICAL: Logger initialization failed: {e}\n")
+        sys.stderr.flush()
+        return 1
+
+    checks = asyncio.run(CoinbaseClient().health_check())
+    for check, ok in checks.items():
+        print(f"{check}: {'OK' if ok else 'FAILED'}")
+    return 0 if all(checks.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,20 +9,33 @@ Typical usage:
 Expects API keys to be set as environment variables as specified in config.py.
 """
 
+import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import FrameType
+from typing import Final, List, Optional
 
-# Local application imports
-from trading import (
-    coinbase_client,
-    config,
-    order_calculator,
-    signal_analyzer,
-    technical_analysis,
-)
-from trading.logger import LoggerDirectoryError, get_logger, setup_logging
-from trading.persistence import PersistenceManager
-from trading.trade_manager import TradeManager
+# Local application imports. The trading components (and the pandas, numpy
+# and HTTP stacks behind them) are imported in run_bot once logging is set up,
+# so a run that fails on configuration exits without paying for them.
+from trading import config
+from trading.logger import LoggerDirectoryError, setup_logging
+
+# Trade cycles for different pairs are independent and spend most of their time
+# waiting on the API, so up to this many run at once.
+MAX_CONCURRENT_TRADE_CYCLES: Final[int] = 8
+
+
+def _exit_on_signal(signum: int, frame: Optional[FrameType]) -> None:
+    """Turns a termination signal into a normal exit with the shell's status.
+
+    The default SIGTERM action kills the process outright, losing any log
+    records still buffered. Exiting via SystemExit instead runs run_bot's
+    cleanup and logging's own atexit shutdown, which flushes and closes the
+    handlers.
+    """
+    sys.exit(128 + signum)
 
 
 def run_bot() -> None:
@@ -34,23 +47,32 @@ def run_bot() -> None:
     Includes comprehensive error handling and logging.
     """
     try:
-        setup_logging(
+        logger = setup_logging(
             level=config.LOG_LEVEL,
             log_file=config.LOG_FILE,
             persistence_dir=config.PERSISTENCE_DIR,
         )
-        logger = get_logger()
     except (LoggerDirectoryError, ValueError) as e:
-        print(f"CRITICAL: Logger initialization failed: {e}", file=sys.stderr)
+        sys.stderr.write(f"CRITICAL: Logger initialization failed: {e}\n")
+        sys.stderr.flush()
         sys.exit(1)
 
     logger.info("--- Starting v6 crypto trading bot run ---")
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
 
     try:
         # Assert that the configuration is valid before proceeding.
         assert config.TRADING_PAIRS, "Configuration error: TRADING_PAIRS is empty."
 
+        from trading import (
+            coinbase_client,
+            order_calculator,
+            signal_analyzer,
+            technical_analysis,
+        )
+        from trading.persistence import PersistenceManager
+        from trading.trade_manager import TradeManager
+
         client = coinbase_client.CoinbaseClient()
         persistence_manager = PersistenceManager(logger=logger)
         trade_manager = TradeManager(
@@ -63,31 +85,53 @@ def run_bot() -> None:
             order_calculator=order_calculator,
         )
 
-        logger.info(f"Processing {len(config.TRADING_PAIRS)} configured trading pairs.")
-        for asset_id in config.TRADING_PAIRS:
-            logger.info(f"--- Starting trade cycle for {asset_id} ---")
-            try:
-                trade_manager.process_asset_trade_cycle(asset_id=asset_id)
-            except Exception as e:
-                logger.error(
-                    f"An unexpected error occurred while processing {asset_id}: {e}",
-                    exc_info=True,
-                )
-            finally:
-                logger.info(f"--- Completed trade cycle for {asset_id} ---")
+        pairs = tuple(config.TRADING_PAIRS)
+        process_asset_trade_cycle = trade_manager.process_asset_trade_cycle
+        logger.info("Processing %d configured trading pairs.", len(pairs))
+        # One request for every pair's product details; the per-asset cycles
+        # below are then served from the client's product cache.
+        client.get_products(list(pairs))
+        failed: List[str] = []
+        workers = min(len(pairs), MAX_CONCURRENT_TRADE_CYCLES)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="trade-cycle"
+        ) as executor:
+            futures = {}
+            for asset_id in pairs:
+                logger.debug("--- Starting trade cycle for %s ---", asset_id)
+                future = executor.submit(process_asset_trade_cycle, asset_id=asset_id)
+                futures[future] = asset_id
+            for future in as_completed(futures):
+                asset_id = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(
+                        "An unexpected error occurred while processing %s: %s",
+                        asset_id,
+                        e,
+                        exc_info=True,
+                    )
+                    failed.append(asset_id)
+        logger.info(
+            "Trade cycles complete: %d succeeded, %d failed.",
+            len(pairs) - len(failed),
+            len(failed),
+        )
 
     except (AssertionError, RuntimeError) as e:
-        logger.critical(f"A critical error halted the bot: {e}", exc_info=True)
+        logger.critical("A critical error halted the bot: %s", e, exc_info=True)
         sys.exit(1)
     except Exception as e:
         logger.critical(
-            f"An unhandled exception occurred at the top level: {e}", exc_info=True
+            "An unhandled exception occurred at the top level: %s", e, exc_info=True
         )
         sys.exit(1)
     finally:
-        execution_time = time.time() - start_time
-        logger.info(f"--- Trading bot run finished in {execution_time:.2f} seconds ---")
+        execution_time = (time.monotonic_ns() - start_ns) / 1e9
+        logger.info("--- Trading bot run finished in %.2f seconds ---", execution_time)
 
 
 if __name__ == "__main__":
+    signal.signal(signal.SIGTERM, _exit_on_signal)
     run_bot()
@@ -0,0 +1,69 @@
+"""A small thread-safe, in-memory TTL cache for API responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Caches values for a fixed time-to-live, evicting the oldest entry when full.
+
+    Expired entries are kept until evicted so that callers can fall back to the
+    last known value (see get_stale) when a fresh fetch fails.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            ttl: Seconds an entry is considered fresh.
+            maxsize: Maximum number of entries held before evicting the oldest.
+        """
+        assert ttl >= 0, "ttl must be non-negative."
+        assert maxsize > 0, "maxsize must be positive."
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the cached value if it is still fresh, otherwise None."""
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            return None
+        return value
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Returns the last cached value for key regardless of its age."""
+        with self._lock:
+            entry = self._data.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Stores value under key, evicting the oldest entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes key from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,119 @@
+"""A thread-safe circuit breaker that sheds calls to a failing endpoint."""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Final, Optional, Tuple
+
+# Defaults: trip when more than half of at least four calls in the last 30s
+# failed, then reject calls for 30s before letting a single trial through.
+DEFAULT_WINDOW_SECONDS: Final[float] = 30.0
+DEFAULT_FAILURE_RATIO: Final[float] = 0.5
+DEFAULT_MIN_CALLS: Final[int] = 4
+DEFAULT_COOLDOWN_SECONDS: Final[float] = 30.0
+
+
+class CircuitBreaker:
+    """
+    Tracks recent call outcomes and stops calls while the error rate is high.
+
+    The breaker is closed while calls mostly succeed. Once more than
+    `failure_ratio` of the calls in the last `window_seconds` failed (with at
+    least `min_calls` observed) it opens, and allow() rejects calls for
+    `cooldown_seconds`. After that one trial call is let through: success
+    closes the breaker again, failure reopens it for another cooldown.
+
+    Every state change starts a new generation. allow() hands out the current
+    generation as a ticket and record() ignores outcomes whose ticket is from
+    an earlier one, so a slow call admitted while the breaker was closed
+    cannot decide the trial that follows its opening.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        failure_ratio: float = DEFAULT_FAILURE_RATIO,
+        min_calls: int = DEFAULT_MIN_CALLS,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+    ) -> None:
+        """
+        Initializes a closed breaker.
+
+        Args:
+            window_seconds: How far back call outcomes are considered.
+            failure_ratio: Fraction of failed calls above which the breaker opens.
+            min_calls: Calls required in the window before it can open.
+            cooldown_seconds: How long calls are rejected once it opens.
+        """
+        assert window_seconds > 0, "window_seconds must be positive."
+        assert 0 <= failure_ratio < 1, "failure_ratio must be in [0, 1)."
+        assert min_calls > 0, "min_calls must be positive."
+        assert cooldown_seconds >= 0, "cooldown_seconds must be non-negative."
+        self.window_seconds = window_seconds
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.cooldown_seconds = cooldown_seconds
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the breaker is currently rejecting calls."""
+        with self._lock:
+            return self._opened_at is not None
+
+    def _prune(self, now: float) -> None:
+        """Drops outcomes older than the window."""
+        cutoff = now - self.window_seconds
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, ok = self._outcomes.popleft()
+            if not ok:
+                self._failures -= 1
+
+    def allow(self) -> Optional[int]:
+        """
+        Returns a ticket if a call may proceed now, otherwise None.
+
+        The ticket must be passed to record() with the call's outcome.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return self._generation
+            if self._trial_in_flight:
+                return None
+            if time.monotonic() - self._opened_at < self.cooldown_seconds:
+                return None
+            self._trial_in_flight = True
+            self._generation += 1
+            return self._generation
+
+    def record(self, ticket: int, success: bool) -> None:
+        """Records the outcome of a call that allow() admitted with ticket."""
+        with self._lock:
+            if ticket != self._generation:
+                return  # Admitted under a state that has since changed.
+            now = time.monotonic()
+            if self._opened_at is not None:
+                # The outcome of the trial call decides the breaker's state.
+                self._trial_in_flight = False
+                self._generation += 1
+                if success:
+                    self._opened_at = None
+                    self._outcomes.clear()
+                    self._failures = 0
+                else:
+                    self._opened_at = now
+                return
+
+            self._outcomes.append((now, success))
+            if not success:
+                self._failures += 1
+            self._prune(now)
+            calls = len(self._outcomes)
+            if calls >= self.min_calls and self._failures / calls > self.failure_ratio:
+                self._opened_at = now
+                self._generation += 1
@@ -1,18 +1,482 @@
 """Handles all interactions with the Coinbase Advanced Trade API."""
 
+import asyncio
+import functools
+import importlib.util
+import inspect
 import json
+import os
+import random
+import threading
 import time
-import uuid
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Union
-
+from decimal import Decimal, InvalidOperation
+from email.utils import parsedate_to_datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, RequestException
+from urllib3.util.retry import Retry
 
 from coinbase.rest import RESTClient
 
+try:  # orjson parses JSON several times faster; fall back to the stdlib.
+    import orjson as _json
+except ImportError:  # pragma: no cover - depends on the environment
+    _json = json  # type: ignore[misc]
+
 from . import config
 from . import logger
+from .cache import TTLCache
+from .circuit_breaker import CircuitBreaker
+from .rate_limiter import TokenBucket
+
+# --- HTTP Connection Pooling ---
+# Every call goes to the same host, so a single keep-alive session with a deep
+# per-host pool lets consecutive requests reuse the TCP+TLS connection instead
+# of paying a fresh handshake each time. The SDK's transport is requests, which
+# speaks HTTP/1.1 only, so concurrent calls each hold one pooled connection;
+# the pool is sized so the async and cancel fan-outs never wait for a socket.
+HTTP_POOL_CONNECTIONS: Final[int] = 4
+HTTP_POOL_MAXSIZE: Final[int] = 32
+# Failures to connect happen before anything is sent, so the adapter retries
+# them on the spot; everything else is left to _call_with_retry, which also
+# rate-limits and honors Retry-After.
+HTTP_CONNECT_RETRIES: Final[int] = 2
+HTTP_CONNECT_BACKOFF_SECONDS: Final[float] = 0.2
+
+# Upper bound on concurrent in-flight requests for the async fan-out helpers.
+# Kept below HTTP_POOL_MAXSIZE so concurrent calls never queue for a socket.
+ASYNC_MAX_CONCURRENCY: Final[int] = 16
+
+# Seconds to wait for a connection or for response data. The SDK's default is
+# no timeout, which lets a pooled socket the server silently dropped block a
+# call forever instead of failing over to a fresh connection via the retries.
+HTTP_TIMEOUT_SECONDS: Final[int] = 10
+
+# --- Response Caching ---
+# Product metadata (increments, min sizes) is effectively static and account
+# listings change only when we trade, so both are served from memory within
+# these windows. On API failure the last cached value is returned instead.
+PRODUCT_CACHE_TTL_SECONDS: Final[float] = 60.0
+ACCOUNTS_CACHE_TTL_SECONDS: Final[float] = 10.0
+# List Accounts is cursor-paginated; each cursor comes from the previous page,
+# so pages are fetched in sequence at the largest page size the API allows.
+ACCOUNTS_PAGE_SIZE: Final[int] = 250
+ACCOUNTS_MAX_PAGES: Final[int] = 100
+_ACCOUNTS_CACHE_KEY: Final[tuple] = ()
+# Candles are cached per (product_id, granularity, start, end) for one candle
+# period: within that window a repeated request cannot contain a new candle.
+CANDLES_CACHE_MAXSIZE: Final[int] = 64
+# A window without an end includes the candle still forming, whose close and
+# volume change with every trade, so such responses are only reused briefly.
+OPEN_CANDLES_CACHE_TTL_SECONDS: Final[float] = 5.0
+# Order books go stale within seconds; their TTL is config.ORDER_BOOK_CACHE_TTL_SECONDS.
+BOOK_CACHE_MAXSIZE: Final[int] = 64
+# Candles returned per request; the API rejects windows much larger than this.
+CANDLES_PAGE_SIZE: Final[int] = 300
+# Granularities get_public_candles accepts, checked with one set lookup.
+_VALID_GRANULARITIES: Final[frozenset] = frozenset(config.CANDLE_GRANULARITY_SECONDS)
+
+# --- Rate Limiting and Retries ---
+# Coinbase allows 30 requests/second on private endpoints. The token bucket
+# throttles proactively and adapts to the x-ratelimit-* headers.
+RATE_LIMIT_REQUESTS_PER_SECOND: Final[float] = 30.0
+# Transient failures (rate limiting, gateway errors, dropped connections) are
+# retried with capped exponential backoff plus jitter, stretched to any
+# Retry-After the server sends (still bounded by the cap).
+RETRYABLE_STATUS_CODES: Final[frozenset] = frozenset({429, 500, 502, 503, 504})
+RETRY_MAX_RETRIES: Final[int] = 5
+RETRY_BACKOFF_BASE_SECONDS: Final[float] = 0.5
+RETRY_BACKOFF_CAP_SECONDS: Final[float] = 30.0
+
+# --- Order Cancellation ---
+# The batch_cancel endpoint accepts at most this many order IDs per request.
+# Larger requests are split into chunks that are sent concurrently.
+CANCEL_ORDERS_BATCH_SIZE: Final[int] = 100
+CANCEL_ORDERS_MAX_WORKERS: Final[int] = 8
+# failure_reason reported for orders whose batch_cancel request itself failed.
+CANCEL_REQUEST_FAILED: Final[str] = "REQUEST_FAILED"
+
+# --- Candle Arrays ---
+# Column layout for get_public_candles_np. Field names match the API's candle
+# keys, so pd.DataFrame(array) yields the same columns as the list-of-dicts form.
+CANDLE_DTYPE: Final[np.dtype] = np.dtype(
+    [
+        ("start", "i8"),
+        ("low", "f8"),
+        ("high", "f8"),
+        ("open", "f8"),
+        ("close", "f8"),
+        ("volume", "f8"),
+    ]
+)
+_CANDLE_FIELDS: Final[Tuple[str, ...]] = tuple(CANDLE_DTYPE.names or ())
+
+# --- Order Sides ---
+# Accepted side spellings -> (API value, log value), so placing an order does
+# no per-call case conversion.
+_SIDE_CANON: Final[Dict[str, Tuple[str, str]]] = {
+    "BUY": ("BUY", "buy"),
+    "buy": ("BUY", "buy"),
+    "SELL": ("SELL", "sell"),
+    "sell": ("SELL", "sell"),
+}
+
+# --- Client Order IDs ---
+# IDs are generated in batches from a single os.urandom read and handed out
+# from a pool, so order submission does not pay a syscall per order.
+CLIENT_ORDER_ID_POOL_SIZE: Final[int] = 1024
+
+# Shared by all clients. A forked child starts with an empty pool: IDs copied
+# from the parent would otherwise be handed out by both processes.
+_order_id_pool: "deque[str]" = deque()
+_order_id_lock = threading.Lock()
+
+
+def _reset_client_order_ids() -> None:
+    """Discards pooled client order IDs and replaces the pool's lock."""
+    global _order_id_lock
+    _order_id_pool.clear()
+    _order_id_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch - absent on Windows
+    os.register_at_fork(after_in_child=_reset_client_order_ids)
+
+
+class CircuitOpenError(RequestException):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+
+def _is_transient(error: RequestException) -> bool:
+    """
+    Returns whether a request error is worth retrying.
+
+    Dropped connections and timeouts are; HTTP errors only for the statuses
+    in RETRYABLE_STATUS_CODES (rate limiting and gateway errors), since other
+    4xx responses would fail the same way again.
+    """
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, HTTPError):
+        return getattr(error.response, "status_code", None) in RETRYABLE_STATUS_CODES
+    return True
+
+
+def _retry_after_seconds(error: HTTPError) -> Optional[float]:
+    """
+    Returns the Retry-After delay of an HTTP error's response, if any.
+
+    Both forms allowed by RFC 9110 are accepted: delay-seconds and an
+    HTTP-date. Missing or unparseable values yield None.
+    """
+    headers = getattr(error.response, "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get("Retry-After")
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _accept_encoding() -> str:
+    """
+    Returns the Accept-Encoding value to advertise.
+
+    Candle payloads are repetitive JSON that compresses well. Brotli is only
+    advertised when a decoder is installed, since urllib3 cannot otherwise
+    decompress a br-encoded body.
+    """
+    encodings = ["gzip", "deflate"]
+    if any(importlib.util.find_spec(m) for m in ("brotli", "brotlicffi")):
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+def _memoize_json(response: requests.Response, *args: Any, **kwargs: Any) -> None:
+    """
+    Response hook that parses the body at most once, from bytes.
+
+    The SDK calls response.json() twice per request (once for a debug log),
+    so the parsed body is cached on the response. Parsing goes through _json
+    (orjson when installed) on the raw bytes; bodies it rejects fall back to
+    requests' own parser so callers see the usual exceptions.
+    """
+    parsed: List[Any] = []
+
+    def json_(**json_kwargs: Any) -> Any:
+        if not parsed:
+            try:
+                parsed.append(_json.loads(response.content))
+            except ValueError:
+                parsed.append(requests.Response.json(response, **json_kwargs))
+        return parsed[0]
+
+    response.json = json_  # type: ignore[method-assign]
+
+
+class _Session(requests.Session):
+    """
+    Session that serializes JSON request bodies through _json.
+
+    The SDK passes order payloads as json=..., which requests encodes with the
+    stdlib to a str and then to bytes. With orjson installed the body is
+    emitted as bytes in one step; the SDK already sets the Content-Type.
+    """
+
+    def prepare_request(self, request: requests.Request) -> requests.PreparedRequest:
+        if request.json is not None and not request.data and _json is not json:
+            request.data = _json.dumps(request.json)
+            request.json = None
+        return super().prepare_request(request)
+
+
+def _build_session() -> requests.Session:
+    """Builds a keep-alive requests.Session with a pooled HTTPS adapter."""
+    session = _Session()
+    # pool_block=False: a burst beyond the pool opens a temporary extra
+    # connection rather than stalling the caller until a socket frees up.
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        pool_block=False,
+        max_retries=Retry(
+            total=HTTP_CONNECT_RETRIES,
+            connect=HTTP_CONNECT_RETRIES,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=HTTP_CONNECT_BACKOFF_SECONDS,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    session.headers["Accept-Encoding"] = _accept_encoding()
+    session.hooks["response"].append(_memoize_json)
+    return session
+
+
+# Every worker thread that can issue requests concurrently gets its own pooled
+# connection, so steady-state traffic never falls back to fresh handshakes.
+assert (
+    HTTP_POOL_MAXSIZE >= ASYNC_MAX_CONCURRENCY + CANCEL_ORDERS_MAX_WORKERS
+), "HTTP_POOL_MAXSIZE must cover all concurrent request workers."
+
+# Shared by all CoinbaseClient instances so pooled connections outlive them.
+_SESSION: Final[requests.Session] = _build_session()
+
+# Runs blocking SDK calls for the async helpers. Sized to the concurrency cap
+# so fan-out is not throttled by the event loop's small default executor.
+_ASYNC_EXECUTOR: Final[ThreadPoolExecutor] = ThreadPoolExecutor(
+    max_workers=ASYNC_MAX_CONCURRENCY, thread_name_prefix="coinbase-io"
+)
+
+# Sends the chunks of a large cancel_orders call. Kept apart from
+# _ASYNC_EXECUTOR so a cancel issued from an async helper's worker cannot wait
+# on the pool it is running in.
+_CANCEL_EXECUTOR: Final[ThreadPoolExecutor] = ThreadPoolExecutor(
+    max_workers=CANCEL_ORDERS_MAX_WORKERS, thread_name_prefix="coinbase-cancel"
+)
+
+
+def _return_as_is(response: Any) -> Any:
+    """Returns a response that needs no conversion."""
+    return response
+
+
+def _call_to_dict(response: Any) -> Any:
+    """Converts an SDK response model to a dictionary."""
+    return response.to_dict()
+
+
+def _decode_json_str(response: Union[str, bytes]) -> Any:
+    """Parses a JSON str or bytes response, returning it unchanged if invalid."""
+    try:
+        return _json.loads(response)
+    except ValueError:  # json and orjson decode errors both subclass ValueError
+        # Let the caller handle the error by returning the original string
+        return response
+
+
+def _resolve_response_decoder(response: Any) -> Callable[[Any], Any]:
+    """Picks the conversion for a response type; run once per type."""
+    if isinstance(response, dict):
+        return _return_as_is
+    # Prefer the class's own to_dict function: calling it with the response
+    # skips the per-call instance lookup and bound-method creation.
+    class_to_dict = getattr(type(response), "to_dict", None)
+    if inspect.isfunction(class_to_dict):
+        return class_to_dict
+    if getattr(response, "to_dict", None) is not None:
+        return _call_to_dict
+    if isinstance(response, (str, bytes)):
+        return _decode_json_str
+    return _return_as_is
+
+
+_TYPE_DESCRIPTIONS: Final[Dict[type, str]] = {dict: "a dictionary", list: "a list"}
+
+
+def _extract(
+    response: Any, key: str, method_name: str, expected_type: type = dict
+) -> Any:
+    """
+    Returns response[key], validating the shapes the SDK contract promises.
+
+    The well-formed case costs a single subscript and type check. A missing
+    key raises ValueError and a wrongly typed value raises TypeError; callers
+    log either like any other API failure.
+    Unlike assert statements, these checks still run under `python -O`.
+    """
+    try:
+        value = response[key]
+    except KeyError:
+        raise ValueError(f"'{key}' key missing in response.") from None
+    except TypeError:
+        raise TypeError(f"{method_name} response should be a dictionary.") from None
+    if not isinstance(value, expected_type):
+        if value is None:
+            raise ValueError(f"'{key}' key missing in response.")
+        raise TypeError(f"'{key}' must be {_TYPE_DESCRIPTIONS[expected_type]}.")
+    return value
+
+
+def _cancel_failure_reason(result: Dict[str, Any]) -> Any:
+    """Returns the reason a batch_cancel result reports for not cancelling."""
+    error_details = result.get("error_response", {})
+    return error_details.get("message", result.get("failure_reason", "Unknown reason"))
+
+
+def _validate_positive_decimal_str(name: str, value: Any) -> Decimal:
+    """
+    Parses an order amount sent to the API as a decimal string.
+
+    Raises:
+        ValueError: If value is not a string holding a positive, finite number.
+    """
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a string, got {type(value).__name__}.")
+    try:
+        parsed = Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"{name} must be a decimal string, got {value!r}.") from None
+    if not parsed.is_finite() or parsed <= 0:
+        raise ValueError(f"{name} must be positive, got {value!r}.")
+    return parsed
+
+
+def _require_product_id(self: Any, product_id: str, *args: Any, **kwargs: Any) -> None:
+    """Precondition for the product endpoints."""
+    assert product_id, "Product ID must be a non-empty string."
+
+
+# Keys the SDK merges into every response from the x-ratelimit-* headers.
+# They describe the request, not the product, so cached details omit them.
+_RATE_LIMIT_KEYS: Final[frozenset] = frozenset(
+    {"rate_limit_limit", "rate_limit_remaining", "rate_limit_reset"}
+)
+
+
+def _product_to_dict(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the product fields of a Get Product response."""
+    return {k: v for k, v in response.items() if k not in _RATE_LIMIT_KEYS}
+
+
+def _api_call(
+    context: str,
+    exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+    fallback: Optional[Callable[..., Any]] = None,
+    precondition: Optional[Callable[..., None]] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Wraps a client method with the standard API error handling.
+
+    Any of `exceptions` raised by the method is logged via _log_api_error and
+    the method returns `fallback(self, *args, **kwargs)`, or None if no
+    fallback is given.
+
+    Args:
+        context: Label for the error log, formatted with the method's
+            arguments by name, e.g. "get_order for {order_id}".
+        exceptions: Exception types to handle; anything else propagates.
+        fallback: Optional callable taking the client and the method's
+            arguments, used on failure.
+        precondition: Optional callable taking the same arguments, run before
+            the error handling so that caller mistakes raise instead of being
+            logged as API failures.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if precondition is not None:
+                precondition(self, *args, **kwargs)
+            try:
+                return fn(self, *args, **kwargs)
+            except exceptions as e:
+                # Arguments are only bound on the failure path.
+                bound = signature.bind(self, *args, **kwargs)
+                bound.apply_defaults()
+                self._log_api_error(context.format(**bound.arguments), e)
+                if fallback is None:
+                    return None
+                return fallback(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Failures that are part of normal operation (network errors, HTTP error
+# statuses, malformed payloads) and are logged without a traceback.
+_EXPECTED_API_ERRORS: Final[Tuple[Type[Exception], ...]] = (
+    RequestException,
+    ValueError,
+    TypeError,
+    KeyError,
+)
+
+
+# Response type -> decoder. The SDK returns a handful of model classes, so after
+# the first call per class the conversion is a single dict lookup. Builtin
+# payload types are seeded so they never go through the resolver.
+_RESPONSE_DECODERS: Dict[type, Callable[[Any], Any]] = {
+    dict: _return_as_is,
+    str: _decode_json_str,
+    bytes: _decode_json_str,
+    type(None): _return_as_is,
+}
 
 
 class CoinbaseClient:
@@ -48,226 +512,536 @@ class CoinbaseClient:
             self.client: Optional[RESTClient] = RESTClient(
                 api_key=self.api_key,
                 api_secret=self.api_secret,
+                timeout=HTTP_TIMEOUT_SECONDS,
                 rate_limit_headers=True,
             )
+            # Route every SDK request through the shared pooled session,
+            # releasing the private one the SDK created for itself.
+            self.client.session.close()
+            self.client.session = _SESSION
+            # Bind the SDK endpoints once so each call skips the client
+            # attribute lookup and bound-method construction.
+            self._sdk_get_accounts = self.client.get_accounts
+            self._sdk_get_public_candles = self.client.get_public_candles
+            self._sdk_get_product_book = self.client.get_product_book
+            self._sdk_get_product = self.client.get_product
+            self._sdk_get_products = self.client.get_products
+            self._sdk_create_order = self.client.create_order
+            self._sdk_get_order = self.client.get_order
+            self._sdk_cancel_orders = self.client.cancel_orders
             self.logger.info(
                 "Coinbase RESTClient initialized successfully for the live API."
             )
         except Exception as e:
             self.logger.error(
-                f"Failed to initialize Coinbase RESTClient: {e}", exc_info=True
+                "Failed to initialize Coinbase RESTClient: %s", e, exc_info=True
             )
             raise RuntimeError(f"Coinbase RESTClient initialization failed: {e}") from e
 
+        self._product_cache = TTLCache(ttl=PRODUCT_CACHE_TTL_SECONDS, maxsize=256)
+        self._accounts_cache = TTLCache(ttl=ACCOUNTS_CACHE_TTL_SECONDS, maxsize=1)
+        self._book_cache = TTLCache(
+            ttl=config.ORDER_BOOK_CACHE_TTL_SECONDS, maxsize=BOOK_CACHE_MAXSIZE
+        )
+        self._candles_caches: Dict[str, TTLCache] = {
+            granularity: TTLCache(ttl=seconds, maxsize=CANDLES_CACHE_MAXSIZE)
+            for granularity, seconds in config.CANDLE_GRANULARITY_SECONDS.items()
+        }
+        self._open_candles_cache = TTLCache(
+            ttl=OPEN_CANDLES_CACHE_TTL_SECONDS, maxsize=CANDLES_CACHE_MAXSIZE
+        )
+        self._limiter = TokenBucket(rate=RATE_LIMIT_REQUESTS_PER_SECOND)
+        self._breakers: Dict[Callable[..., Any], CircuitBreaker] = {}
+
+    def _refill_client_order_ids(self) -> None:
+        """Refills the client order ID pool with 128-bit random hex strings."""
+        # One urandom read and one C-level hex conversion for the whole batch;
+        # each ID is then a 32-char slice. Coinbase treats client_order_id as
+        # an opaque string, so the UUID version/variant bits are not needed.
+        digits = os.urandom(16 * CLIENT_ORDER_ID_POOL_SIZE).hex()
+        _order_id_pool.extend(digits[i : i + 32] for i in range(0, len(digits), 32))
+
     def _generate_client_order_id(self) -> str:
-        """Generates a unique client order ID."""
-        raw_id = uuid.uuid4()
-        assert isinstance(
-            raw_id, uuid.UUID
-        ), "uuid.uuid4() did not return a UUID object."
-        order_id = str(raw_id)
-        assert len(order_id) > 0, "Generated client_order_id is empty."
-        return order_id
+        """Returns a unique client order ID from the preallocated pool."""
+        with _order_id_lock:
+            if not _order_id_pool:
+                self._refill_client_order_ids()
+            return _order_id_pool.popleft()
 
     def _handle_api_response(self, response: Any) -> Any:
         """Converts API response to a dictionary, handling various formats."""
-        if isinstance(response, dict):
-            return response
-        if hasattr(response, "to_dict"):
-            return response.to_dict()
-        if isinstance(response, str):
+        decoder = _RESPONSE_DECODERS.get(type(response))
+        if decoder is None:
+            decoder = _resolve_response_decoder(response)
+            _RESPONSE_DECODERS[type(response)] = decoder
+        return decoder(response)
+
+    def _call_with_retry(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        max_retries: int = RETRY_MAX_RETRIES,
+        base: float = RETRY_BACKOFF_BASE_SECONDS,
+        cap: float = RETRY_BACKOFF_CAP_SECONDS,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Calls fn, retrying transient failures with exponential backoff and jitter.
+
+        Retries HTTP errors whose status is in RETRYABLE_STATUS_CODES and
+        non-HTTP request errors such as connection resets, waiting at least as
+        long as any Retry-After header asks (up to cap). Anything else, or
+        the last failure once max_retries is exhausted, propagates.
+        """
+        attempt = 0
+        while True:
             try:
-                return json.loads(response)
-            except json.JSONDecodeError:
-                # Let the caller handle the error by returning the original string
-                return response
-        return response
+                return fn(*args, **kwargs)
+            except RequestException as e:
+                if not _is_transient(e) or attempt >= max_retries:
+                    raise
+                retry_after = (
+                    _retry_after_seconds(e) if isinstance(e, HTTPError) else None
+                )
+                delay = min(cap, base * (2**attempt)) + random.uniform(0, base)
+                if retry_after is not None:
+                    delay = max(delay, min(cap, retry_after))
+                self.logger.warning(
+                    "Attempt %d of %d failed: %s. Retrying in %.2fs.",
+                    attempt + 1,
+                    max_retries + 1,
+                    e,
+                    delay,
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    def _send(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """Sends one rate-limited request and normalizes its response."""
+        self._limiter.acquire()
+        response_dict = self._handle_api_response(method(**kwargs))
+        if isinstance(response_dict, dict):
+            self._limiter.update_from_headers(
+                response_dict.get("rate_limit_limit"),
+                response_dict.get("rate_limit_remaining"),
+                response_dict.get("rate_limit_reset"),
+            )
+        return response_dict
+
+    def _call_api(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        Calls an SDK method with rate limiting and transient-error retries.
+
+        Each endpoint has its own circuit breaker. Only calls that still fail
+        transiently after their retries (the errors _is_transient would retry)
+        count against it; any other outcome shows the endpoint answering.
+        While it is open the endpoint is not called at all: CircuitOpenError
+        is raised at once, so callers fall back (e.g. to stale cache entries)
+        without waiting out another full retry sequence.
+        """
+        breaker = self._breakers.get(method)
+        if breaker is None:
+            breaker = self._breakers.setdefault(method, CircuitBreaker())
+        ticket = breaker.allow()
+        if ticket is None:
+            name = getattr(method, "__name__", "request")
+            raise CircuitOpenError(f"Circuit open for {name}; request skipped.")
+
+        failed = False
+        try:
+            return self._call_with_retry(self._send, method, **kwargs)
+        except RequestException as e:
+            failed = _is_transient(e)
+            raise
+        finally:
+            breaker.record(ticket, not failed)
 
     def _log_api_error(self, method_name: str, error: Exception) -> None:
         """Logs a standardized error message for API call failures."""
-        self.logger.error(f"An error occurred in {method_name}: {error}", exc_info=True)
+        # Network failures and malformed responses are expected in operation;
+        # their message says it all. Only unexpected errors get a traceback.
+        message = f"An error occurred in {method_name}: {error}"
+        if isinstance(error, _EXPECTED_API_ERRORS):
+            self.logger.error(message)
+        else:
+            self.logger.error(message, exc_info=True)
+
+    def _stale_fallback(self, cache: TTLCache, key: Any, description: str) -> Any:
+        """Returns the last cached value for key after a failed call, if any."""
+        stale = cache.get_stale(key)
+        if stale is not None:
+            self.logger.warning("Serving stale cached %s.", description)
+        return stale
+
+    def _stale_accounts(self) -> Optional[List[Dict[str, Any]]]:
+        """Returns the last cached account listing, if any."""
+        return self._stale_fallback(
+            self._accounts_cache, _ACCOUNTS_CACHE_KEY, "accounts"
+        )
+
+    def _stale_product(self, product_id: str) -> Optional[Dict[str, Any]]:
+        """Returns the last cached details for product_id, if any."""
+        return self._stale_fallback(
+            self._product_cache, product_id, f"product {product_id}"
+        )
 
+    def invalidate_product(self, product_id: str) -> None:
+        """Drops the cached details for product_id, e.g. after a trade."""
+        self._product_cache.invalidate(product_id)
+
+    def invalidate_candles(self) -> None:
+        """Drops all cached candles."""
+        for cache in self._candles_caches.values():
+            cache.clear()
+        self._open_candles_cache.clear()
+
+    def invalidate_accounts(self) -> None:
+        """Drops the cached account listing, e.g. after a trade."""
+        self._accounts_cache.invalidate(_ACCOUNTS_CACHE_KEY)
+
+    @_api_call("get_accounts", fallback=_stale_accounts)
     def get_accounts(self) -> Optional[List[Dict[str, Any]]]:
         """Retrieves a list of all trading accounts."""
-        self.logger.debug("Attempting to retrieve accounts.")
-        try:
-            assert self.client is not None, "RESTClient not initialized."
-            response = self.client.get_accounts()
-            response_dict = self._handle_api_response(response)
+        cached = self._accounts_cache.get(_ACCOUNTS_CACHE_KEY)
+        if cached is not None:
+            self.logger.debug("Returning cached accounts.")
+            return cached
 
-            if not isinstance(response_dict, dict):
-                self.logger.error(
-                    f"An error occurred in get_accounts: Response was not a dictionary. Response: {response_dict}"
-                )
-                return None
-
-            accounts = response_dict.get("accounts")
+        self.logger.debug("Attempting to retrieve accounts.")
+        assert self.client is not None, "RESTClient not initialized."
+        accounts: List[Dict[str, Any]] = []
+        cursor: Optional[str] = None
+        for _ in range(ACCOUNTS_MAX_PAGES):
+            response_dict = self._call_api(
+                self._sdk_get_accounts, limit=ACCOUNTS_PAGE_SIZE, cursor=cursor
+            )
 
-            if not isinstance(accounts, list):
-                self.logger.error(
-                    f"An error occurred in get_accounts: 'accounts' key must be a list. Response: {response_dict}"
-                )
-                return None
+            page = _extract(response_dict, "accounts", "get_accounts", list)
+            # Spot-check the shape once per page rather than per account.
+            assert not page or isinstance(
+                page[0], dict
+            ), "Each item in 'accounts' should be a dictionary."
+            accounts.extend(page)
+            next_cursor = response_dict.get("cursor")
+            if not response_dict.get("has_next") or not next_cursor:
+                break
+            if next_cursor == cursor:
+                self.logger.warning("get_accounts pagination cursor did not advance.")
+                break
+            cursor = next_cursor
+        else:
+            self.logger.warning(
+                "get_accounts stopped after %d pages.", ACCOUNTS_MAX_PAGES
+            )
 
-            self.logger.info(f"Successfully retrieved {len(accounts)} accounts.")
-            return accounts
-        except (HTTPError, RequestException, Exception) as e:
-            self._log_api_error("get_accounts", e)
-            return None
+        self._accounts_cache.set(_ACCOUNTS_CACHE_KEY, accounts)
+        self.logger.info("Successfully retrieved %d accounts.", len(accounts))
+        return accounts
 
+    @_api_call(
+        "get_public_candles for {product_id}",
+        exceptions=(HTTPError, RequestException, ValueError, TypeError),
+        precondition=_require_product_id,
+    )
     def get_public_candles(
         self,
         product_id: str,
         granularity: str,
         start: Optional[Union[str, datetime]] = None,
         end: Optional[Union[str, datetime]] = None,
+        use_cache: bool = True,
     ) -> Optional[List[Dict[str, Any]]]:
-        """Fetches historical candle data for a product."""
-        try:
-            assert self.client is not None, "RESTClient not initialized."
-            assert product_id, "Product ID must be a non-empty string."
-
-            # 1. Determine end datetime object (end_dt)
-            if end is None:
-                end_dt = datetime.now(timezone.utc)
-            elif isinstance(end, datetime):
-                end_dt = end
-            else:
-                try:
-                    end_dt = datetime.fromtimestamp(int(end), tz=timezone.utc)
-                except (ValueError, TypeError):
-                    self.logger.error(f"Invalid format for end time: {end}")
-                    return None
+        """
+        Fetches historical candle data for a product.
 
-            # 2. Determine start datetime object (start_dt)
-            if start is None:
-                granularity_map = {
-                    "ONE_MINUTE": timedelta(minutes=1),
-                    "FIVE_MINUTE": timedelta(minutes=5),
-                    "FIFTEEN_MINUTE": timedelta(minutes=15),
-                    "THIRTY_MINUTE": timedelta(minutes=30),
-                    "ONE_HOUR": timedelta(hours=1),
-                    "TWO_HOUR": timedelta(hours=2),
-                    "SIX_HOUR": timedelta(hours=6),
-                    "ONE_DAY": timedelta(days=1),
-                }
-                candle_duration = granularity_map.get(granularity)
-                if not candle_duration:
-                    self.logger.error(f"Unsupported granularity: {granularity}")
-                    return None
-                start_dt = end_dt - (candle_duration * 300)
-            elif isinstance(start, datetime):
-                start_dt = start
-            else:
-                try:
-                    start_dt = datetime.fromtimestamp(int(start), tz=timezone.utc)
-                except (ValueError, TypeError):
-                    self.logger.error(f"Invalid format for start time: {start}")
-                    return None
+        With use_cache=False the response is neither looked up in nor stored
+        in the candle cache, for one-off reads such as paging through history.
+        """
+        assert self.client is not None, "RESTClient not initialized."
+        if granularity not in _VALID_GRANULARITIES:
+            self.logger.error("Unsupported granularity: %s", granularity)
+            return None
+
+        # 1. Determine end datetime object (end_dt)
+        if end is None:
+            end_dt = datetime.now(timezone.utc)
+        elif isinstance(end, datetime):
+            end_dt = end
+        else:
+            try:
+                end_dt = datetime.fromtimestamp(int(end), tz=timezone.utc)
+            except (ValueError, TypeError):
+                self.logger.error("Invalid format for end time: %s", end)
+                return None
+
+        # 2. Determine start datetime object (start_dt)
+        if start is None:
+            candle_seconds = config.CANDLE_GRANULARITY_SECONDS[granularity]
+            start_dt = end_dt - timedelta(seconds=candle_seconds * CANDLES_PAGE_SIZE)
+        elif isinstance(start, datetime):
+            start_dt = start
+        else:
+            try:
+                start_dt = datetime.fromtimestamp(int(start), tz=timezone.utc)
+            except (ValueError, TypeError):
+                self.logger.error("Invalid format for start time: %s", start)
+                return None
 
-            # 3. Convert to string timestamps for the API call
-            start_ts = str(int(start_dt.timestamp()))
-            end_ts = str(int(end_dt.timestamp()))
+        # 3. Convert to string timestamps for the API call
+        start_ts = str(int(start_dt.timestamp()))
+        end_ts = str(int(end_dt.timestamp()))
 
-            # 4. Make the API call
-            response = self.client.get_public_candles(
-                product_id=product_id,
-                start=start_ts,
-                end=end_ts,
-                granularity=granularity,
+        cache_key: Tuple[Any, ...]
+        if end is None:
+            # An open-ended window ends "now", which would give every poll a
+            # unique key. Key it on the current candle period instead so that
+            # the entry rolls over at the next candle boundary, and keep it in
+            # the short-lived cache since the forming candle keeps changing.
+            bucket = (
+                int(end_dt.timestamp())
+                // config.CANDLE_GRANULARITY_SECONDS[granularity]
             )
-            self.logger.info(f"Raw response from get_product_candles: {response}")
-            response_dict = self._handle_api_response(response)
+            cache = self._open_candles_cache
+            cache_key = (
+                product_id,
+                granularity,
+                start_ts if start is not None else None,
+                bucket,
+            )
+        else:
+            cache = self._candles_caches[granularity]
+            cache_key = (product_id, start_ts, end_ts)
+        if use_cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("Candle cache hit for %s.", product_id)
+                return cached
+            self.logger.debug("Candle cache miss for %s.", product_id)
 
-            if not isinstance(response_dict, dict):
-                self.logger.error(
-                    f"An error occurred in get_public_candles for {product_id}: Response was not a dictionary.",
-                    exc_info=True,
-                )
-                return None
+        # 4. Make the API call
+        response_dict = self._call_api(
+            self._sdk_get_public_candles,
+            product_id=product_id,
+            start=start_ts,
+            end=end_ts,
+            granularity=granularity,
+        )
+        self.logger.debug("Raw response from get_public_candles: %s", response_dict)
+
+        candles = _extract(response_dict, "candles", "get_public_candles", list)
+
+        if use_cache:
+            cache.set(cache_key, candles)
+        self.logger.info(
+            "Successfully retrieved %d candles for %s.", len(candles), product_id
+        )
+        return candles
+
+    def iter_public_candles(
+        self,
+        product_id: str,
+        granularity: str,
+        start: Union[int, datetime],
+        end: Optional[Union[int, datetime]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields candles oldest-first over an arbitrarily long window.
+
+        The window is fetched one CANDLES_PAGE_SIZE page at a time, bypassing
+        the candle cache, so only a single page is held in memory however long
+        the window is. Iteration
+        stops early (after logging a warning) if a page cannot be fetched.
+
+        Args:
+            product_id: The product to fetch candles for.
+            granularity: A key of config.CANDLE_GRANULARITY_SECONDS.
+            start: Window start, as epoch seconds or an aware datetime.
+            end: Window end, as epoch seconds or an aware datetime; now if None.
+        """
+        assert product_id, "Product ID must be a non-empty string."
+        assert (
+            granularity in _VALID_GRANULARITIES
+        ), f"Unsupported granularity: {granularity}"
 
-            candles = response_dict.get("candles")
+        def to_epoch(value: Union[int, datetime]) -> int:
+            return int(value.timestamp()) if isinstance(value, datetime) else int(value)
 
-            if not isinstance(candles, list):
-                self.logger.error(
-                    f"An error occurred in get_public_candles for {product_id}: 'candles' key must be a list.",
-                    exc_info=True,
+        page_start = to_epoch(start)
+        end_ts = to_epoch(end) if end is not None else int(time.time())
+        page_span = config.CANDLE_GRANULARITY_SECONDS[granularity] * CANDLES_PAGE_SIZE
+
+        last_start = -1
+        while page_start < end_ts:
+            page_end = min(page_start + page_span, end_ts)
+            candles = self.get_public_candles(
+                product_id,
+                granularity,
+                str(page_start),
+                str(page_end),
+                use_cache=False,
+            )
+            if candles is None:
+                self.logger.warning(
+                    "Stopped iterating candles for %s at %d.", product_id, page_start
                 )
-                return None
+                return
+            # The API returns each page newest-first, and a candle starting on
+            # a page boundary can appear in both neighbouring pages.
+            for candle in sorted(candles, key=lambda candle: int(candle["start"])):
+                candle_start = int(candle["start"])
+                if candle_start > last_start:
+                    last_start = candle_start
+                    yield candle
+            page_start = page_end
 
-            self.logger.info(
-                f"Successfully retrieved {len(candles)} candles for {product_id}."
+    def get_public_candles_np(
+        self,
+        product_id: str,
+        granularity: str,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Fetches candles as a NumPy structured array with CANDLE_DTYPE fields.
+
+        Fields are typed int64/float64, so indicator code can operate on e.g.
+        `candles["close"]` without per-candle dict lookups. Records are stored
+        row by row; use get_public_candles_columns for contiguous columns.
+        """
+        candles = self.get_public_candles(product_id, granularity, start, end)
+        if candles is None:
+            return None
+        try:
+            return np.fromiter(
+                (
+                    (
+                        int(c["start"]),
+                        float(c["low"]),
+                        float(c["high"]),
+                        float(c["open"]),
+                        float(c["close"]),
+                        float(c["volume"]),
+                    )
+                    for c in candles
+                ),
+                dtype=CANDLE_DTYPE,
+                count=len(candles),
             )
-            return candles
-        except (HTTPError, RequestException, ValueError) as e:
-            self._log_api_error(f"get_public_candles for {product_id}", e)
+        except (KeyError, TypeError, ValueError) as e:
+            self._log_api_error(f"get_public_candles_np for {product_id}", e)
             return None
 
+    def get_public_candles_columns(
+        self,
+        product_id: str,
+        granularity: str,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Fetches candles as one contiguous NumPy array per CANDLE_DTYPE field.
+
+        A field of the structured array is a strided view over whole records;
+        copying each into its own array gives vectorized indicator math
+        (EMA, RSI, rolling windows) unit-stride, cache-friendly input.
+        """
+        candles = self.get_public_candles_np(product_id, granularity, start, end)
+        if candles is None:
+            return None
+        return {name: np.ascontiguousarray(candles[name]) for name in _CANDLE_FIELDS}
+
+    @_api_call("get_product_book for {product_id}", precondition=_require_product_id)
     def get_product_book(
         self, product_id: str, limit: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """Retrieves the order book for a specific product."""
-        self.logger.debug(f"Attempting to retrieve order book for {product_id}.")
-        assert product_id, "Product ID must be a non-empty string."
-        try:
-            assert self.client is not None, "RESTClient not initialized."
+        cache_key = (product_id, limit)
+        cached = self._book_cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Returning cached order book for %s.", product_id)
+            return cached
 
-            response = self.client.get_product_book(product_id=product_id, limit=limit)
-            response_dict = self._handle_api_response(response)
+        self.logger.debug("Attempting to retrieve order book for %s.", product_id)
+        assert self.client is not None, "RESTClient not initialized."
 
-            assert isinstance(
-                response_dict, dict
-            ), "get_product_book response should be a dictionary."
-            pricebook = response_dict.get("pricebook")
+        response_dict = self._call_api(
+            self._sdk_get_product_book, product_id=product_id, limit=limit
+        )
 
-            assert pricebook is not None, "'pricebook' key missing in response."
-            assert isinstance(pricebook, dict), "'pricebook' must be a dictionary."
+        pricebook = _extract(response_dict, "pricebook", "get_product_book")
 
-            self.logger.info(f"Successfully retrieved order book for {product_id}.")
-            return pricebook
-        except (HTTPError, RequestException, Exception) as e:
-            self._log_api_error(f"get_product_book for {product_id}", e)
-            return None
+        self._book_cache.set(cache_key, pricebook)
+        self.logger.info("Successfully retrieved order book for %s.", product_id)
+        return pricebook
 
-    def get_product(
-        self, product_id: str, max_retries: int = 3, base_delay: float = 1.0
-    ) -> Optional[Dict[str, Any]]:
-        """Retrieves details for a single product with retry logic."""
-        self.logger.debug(f"Attempting to retrieve product details for {product_id}.")
-        assert product_id, "Product ID must be a non-empty string."
-        assert max_retries > 0, "max_retries must be positive."
-        assert base_delay > 0, "base_delay must be positive."
+    @_api_call(
+        "get_product for {product_id}",
+        fallback=_stale_product,
+        precondition=_require_product_id,
+    )
+    def get_product(self, product_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieves details for a single product."""
+        cached = self._product_cache.get(product_id)
+        if cached is not None:
+            self.logger.debug("Returning cached product details for %s.", product_id)
+            return cached
 
-        for attempt in range(max_retries):
-            try:
-                assert self.client is not None, "RESTClient not initialized."
-                response = self.client.get_product(product_id=product_id)
-                response_dict = self._handle_api_response(response)
+        self.logger.debug("Attempting to retrieve product details for %s.", product_id)
+        assert self.client is not None, "RESTClient not initialized."
+        response_dict = self._call_api(self._sdk_get_product, product_id=product_id)
 
-                assert isinstance(
-                    response_dict, dict
-                ), "get_product response should be a dictionary."
+        if not isinstance(response_dict, dict):
+            raise TypeError("get_product response should be a dictionary.")
 
-                self.logger.info(f"Successfully retrieved product {product_id}.")
-                return response_dict
+        product = _product_to_dict(response_dict)
+        self._product_cache.set(product_id, product)
+        self.logger.info("Successfully retrieved product %s.", product_id)
+        return product
 
-            except (HTTPError, RequestException) as e:
-                self.logger.warning(
-                    f"Attempt {attempt + 1} of {max_retries} failed for get_product({product_id}). Error: {e}"
-                )
-                if attempt < max_retries - 1:
-                    delay = base_delay * (2**attempt)
-                    self.logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
-                else:
-                    self._log_api_error(f"get_product for {product_id}", e)
-                    return None
-            except Exception as e:
-                self._log_api_error(f"get_product for {product_id}", e)
-                return None
+    @_api_call("get_products for {product_ids}")
+    def get_products(self, product_ids: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves details for several products in a single request.
 
-        return None  # Should not be reached if logic is correct
+        Products still fresh in the product cache are served from it and only
+        the rest are requested. Every product fetched is stored in the cache,
+        so fetching all trading pairs up front turns the per-pair get_product
+        calls of a cycle into cache hits.
 
+        Returns:
+            Product details keyed by product_id. IDs the API did not return
+            are absent.
+        """
+        assert (
+            isinstance(product_ids, list) and product_ids
+        ), "product_ids must be a non-empty list."
+
+        products: Dict[str, Any] = {}
+        missing: List[str] = []
+        for product_id in dict.fromkeys(product_ids):
+            cached = self._product_cache.get(product_id)
+            if cached is not None:
+                products[product_id] = cached
+            else:
+                missing.append(product_id)
+        if not missing:
+            self.logger.debug("Returning cached products.")
+            return products
+
+        self.logger.debug("Attempting to retrieve products: %s", missing)
+        assert self.client is not None, "RESTClient not initialized."
+        response_dict = self._call_api(self._sdk_get_products, product_ids=missing)
+
+        products_list = _extract(response_dict, "products", "get_products", list)
+        for product in products_list:
+            if isinstance(product, dict) and product.get("product_id"):
+                products[product["product_id"]] = product
+                self._product_cache.set(product["product_id"], product)
+
+        self.logger.info("Successfully retrieved %d products.", len(products))
+        return products
+
+    @_api_call("limit_order for {product_id}")
     def limit_order(
         self,
         side: str,
@@ -280,149 +1054,361 @@ class CoinbaseClient:
         if client_order_id is None:
             client_order_id = self._generate_client_order_id()
 
+        # Exact spellings hit the table directly; other casings are rare.
+        canon = _SIDE_CANON.get(side) or _SIDE_CANON.get(side.upper())
+        assert canon is not None, "Side must be 'BUY' or 'SELL'."
+        api_side, log_side = canon
+
         self.logger.debug(
-            f"Attempting to place {side.lower()} limit order for {base_size} of {product_id} at {limit_price}."
+            "Attempting to place %s limit order for %s of %s at %s.",
+            log_side,
+            base_size,
+            product_id,
+            limit_price,
         )
-        try:
-            assert side.upper() in ["BUY", "SELL"], "Side must be 'BUY' or 'SELL'."
-            assert product_id, "Product ID must be a non-empty string."
-            assert self.client is not None, "RESTClient not initialized."
-
-            order_configuration = {
-                "limit_limit_gtc": {
-                    "base_size": base_size,
-                    "limit_price": limit_price,
-                    "post_only": False,
-                }
+        assert product_id, "Product ID must be a non-empty string."
+        assert self.client is not None, "RESTClient not initialized."
+        _validate_positive_decimal_str("base_size", base_size)
+        _validate_positive_decimal_str("limit_price", limit_price)
+
+        order_configuration = {
+            "limit_limit_gtc": {
+                "base_size": base_size,
+                "limit_price": limit_price,
+                "post_only": False,
             }
+        }
+
+        response_dict = self._call_api(
+            self._sdk_create_order,
+            side=api_side,
+            client_order_id=client_order_id,
+            product_id=product_id,
+            order_configuration=order_configuration,
+        )
+
+        if not isinstance(response_dict, dict):
+            raise TypeError("limit_order response should be a dictionary.")
 
-            response = self.client.limit_order(
-                side=side.upper(),
-                client_order_id=client_order_id,
-                product_id=product_id,
-                order_configuration=order_configuration,
+        if response_dict.get("success"):
+            self.logger.info(
+                "Successfully placed %s order for %s. Order ID: %s",
+                log_side,
+                product_id,
+                response_dict.get("order_id"),
+            )
+        else:
+            reason = response_dict.get("failure_reason")
+            if not reason:
+                error_details = response_dict.get("error_response", {})
+                reason = error_details.get("message", "Unknown reason")
+            self.logger.error(
+                "Failed to place %s order for %s. Reason: %s",
+                log_side,
+                product_id,
+                reason,
             )
-            response_dict = self._handle_api_response(response)
 
-            assert isinstance(
-                response_dict, dict
-            ), "limit_order response should be a dictionary."
+        return response_dict
+
+    # BUY/SELL shortcuts: same signature as limit_order minus `side`.
+    limit_order_buy = functools.partialmethod(limit_order, "BUY")
+    limit_order_sell = functools.partialmethod(limit_order, "SELL")
+
+    @_api_call("get_order for {order_id}")
+    def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieves a single order by its ID."""
+        self.logger.debug("Attempting to retrieve order %s.", order_id)
+        assert self.client is not None, "RESTClient not initialized."
+        assert order_id, "Order ID must be a non-empty string."
+
+        response_dict = self._call_api(self._sdk_get_order, order_id=order_id)
+
+        order_details = _extract(response_dict, "order", "get_order")
+
+        self.logger.info("Successfully retrieved order %s.", order_id)
+        return order_details
+
+    def _cancel_chunk(self, order_ids: List[str]) -> List[Dict[str, Any]]:
+        """Sends one batch_cancel request and returns its per-order results."""
+        response_dict = self._call_api(self._sdk_cancel_orders, order_ids=order_ids)
+        chunk_results = _extract(response_dict, "results", "cancel_orders", list)
+        # Spot-check the shape once per response rather than per item.
+        assert not chunk_results or isinstance(
+            chunk_results[0], dict
+        ), "Each item in 'results' should be a dictionary."
+        return chunk_results
+
+    def _cancel_order_chunks(
+        self, chunks: List[List[str]]
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Sends one batch_cancel request per chunk, concurrently if several.
+
+        A lone chunk's errors propagate. With several, each chunk is settled
+        on its own: a failed request is logged and leaves None in its slot, so
+        the orders the other chunks cancelled are still reported.
+        """
+        if len(chunks) == 1:
+            return [self._cancel_chunk(chunks[0])]
+
+        futures = [_CANCEL_EXECUTOR.submit(self._cancel_chunk, c) for c in chunks]
+        outcomes: List[Optional[List[Dict[str, Any]]]] = []
+        for chunk, future in zip(chunks, futures):
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                self._log_api_error(f"cancel_orders for {chunk}", e)
+                outcomes.append(None)
+        return outcomes
+
+    @_api_call("cancel_orders for {order_ids}")
+    def cancel_orders(self, order_ids: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """Cancels the given open orders; an empty list makes no request."""
+        assert isinstance(order_ids, list), "order_ids must be a list."
+        if not order_ids:
+            self.logger.debug("No orders to cancel.")
+            return []
+        self.logger.debug("Attempting to cancel orders: %s", order_ids)
+        assert self.client is not None, "RESTClient not initialized."
+
+        # Drop duplicate IDs (keeping order) and split into as few API-sized
+        # chunks as possible, evenly sized so the concurrent requests finish
+        # together instead of waiting on one full chunk beside a small tail.
+        unique_ids = list(dict.fromkeys(order_ids))
+        num_chunks = -(-len(unique_ids) // CANCEL_ORDERS_BATCH_SIZE)
+        chunk_size = -(-len(unique_ids) // num_chunks)
+        chunks = [
+            unique_ids[i : i + chunk_size]
+            for i in range(0, len(unique_ids), chunk_size)
+        ]
+        outcomes = self._cancel_order_chunks(chunks)
+        if all(outcome is None for outcome in outcomes):
+            return None
 
-            if response_dict.get("success"):
-                self.logger.info(
-                    f"Successfully placed {side.lower()} order for {product_id}. Order ID: {response_dict.get('order_id')}"
+        results: List[Dict[str, Any]] = []
+        for chunk, chunk_results in zip(chunks, outcomes):
+            if chunk_results is None:
+                # The request failed, so these orders are reported as not
+                # cancelled, in the same shape as a rejected cancel.
+                results.extend(
+                    {
+                        "order_id": order_id,
+                        "success": False,
+                        "failure_reason": CANCEL_REQUEST_FAILED,
+                    }
+                    for order_id in chunk
                 )
             else:
-                reason = response_dict.get("failure_reason")
-                if not reason:
-                    error_details = response_dict.get("error_response", {})
-                    reason = error_details.get("message", "Unknown reason")
-                self.logger.error(
-                    f"Failed to place {side.lower()} order for {product_id}. Reason: {reason}"
-                )
+                results.extend(chunk_results)
 
-            return response_dict
-        except (HTTPError, RequestException, Exception) as e:
-            self._log_api_error(f"limit_order for {product_id}", e)
-            return None
+        # Partition once and report each outcome in a single line rather than
+        # dispatching a log record per order.
+        cancelled = [item.get("order_id") for item in results if item.get("success")]
+        failures = [
+            f"{item.get('order_id')} ({_cancel_failure_reason(item)})"
+            for item in results
+            if not item.get("success")
+        ]
+        self.logger.info(
+            "Cancelled %d of %d order(s): %s", len(cancelled), len(results), cancelled
+        )
+        if failures:
+            self.logger.error(
+                "Failed to cancel %d order(s): %s", len(failures), ", ".join(failures)
+            )
+
+        return results
+
+    # --- Async Fan-out ---
+    # The SDK is synchronous, so the coroutines below run the blocking calls on
+    # a dedicated thread pool. Concurrent calls share the pooled session,
+    # turning an N-product poll from N sequential round-trips into roughly one.
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Runs fn(*args) on the shared I/O executor without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_ASYNC_EXECUTOR, functools.partial(fn, *args))
+
+    async def _gather(
+        self,
+        keys: List[str],
+        fetch: Callable[[str], Awaitable[Any]],
+        max_concurrency: int,
+    ) -> Dict[str, Any]:
+        """Awaits fetch(key) for every key, at most max_concurrency at a time."""
+        assert max_concurrency > 0, "max_concurrency must be positive."
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-    def limit_order_buy(
+        async def bounded(key: str) -> Any:
+            async with semaphore:
+                return await fetch(key)
+
+        results = await asyncio.gather(*(bounded(key) for key in keys))
+        return dict(zip(keys, results))
+
+    async def aget_accounts(self) -> Optional[List[Dict[str, Any]]]:
+        """Async variant of get_accounts."""
+        return await self._run_blocking(self.get_accounts)
+
+    async def aget_public_candles(
         self,
         product_id: str,
-        base_size: str,
-        limit_price: str,
-        client_order_id: Optional[str] = None,
+        granularity: str,
+        start: Optional[Union[str, datetime]] = None,
+        end: Optional[Union[str, datetime]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Async variant of get_public_candles."""
+        return await self._run_blocking(
+            self.get_public_candles, product_id, granularity, start, end
+        )
+
+    async def aget_product_book(
+        self, product_id: str, limit: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
-        """A wrapper for limit_order specific to BUY orders."""
-        return self.limit_order(
-            side="BUY",
-            product_id=product_id,
-            base_size=base_size,
-            limit_price=limit_price,
-            client_order_id=client_order_id,
+        """Async variant of get_product_book."""
+        return await self._run_blocking(self.get_product_book, product_id, limit)
+
+    async def aget_product(self, product_id: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_product."""
+        return await self._run_blocking(self.get_product, product_id)
+
+    async def aget_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_order."""
+        return await self._run_blocking(self.get_order, order_id)
+
+    async def acancel_orders(
+        self, order_ids: List[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Async variant of cancel_orders."""
+        return await self._run_blocking(self.cancel_orders, order_ids)
+
+    async def gather_public_candles(
+        self,
+        product_ids: List[str],
+        granularity: str,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Fetches candles for several products concurrently.
+
+        Args:
+            product_ids: The products to fetch candles for.
+            granularity: The candle granularity, e.g. "FIFTEEN_MINUTE".
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            A dict mapping each product_id to its candles (or None on failure).
+        """
+        return await self._gather(
+            product_ids,
+            lambda product_id: self.aget_public_candles(product_id, granularity),
+            max_concurrency,
         )
 
-    def limit_order_sell(
+    async def gather_product_books(
         self,
-        product_id: str,
-        base_size: str,
-        limit_price: str,
-        client_order_id: Optional[str] = None,
-    ) -> Optional[Dict[str, Any]]:
-        """A wrapper for limit_order specific to SELL orders."""
-        return self.limit_order(
-            side="SELL",
-            product_id=product_id,
-            base_size=base_size,
-            limit_price=limit_price,
-            client_order_id=client_order_id,
+        product_ids: List[str],
+        limit: Optional[int] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetches order books for several products concurrently.
+
+        Args:
+            product_ids: The products to fetch order books for.
+            limit: Optional number of price levels per side.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            A dict mapping each product_id to its pricebook (or None on failure).
+        """
+        return await self._gather(
+            product_ids,
+            lambda product_id: self.aget_product_book(product_id, limit),
+            max_concurrency,
         )
 
-    def get_order(self, order_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieves a single order by its ID."""
-        self.logger.debug(f"Attempting to retrieve order {order_id}.")
-        try:
-            assert self.client is not None, "RESTClient not initialized."
-            assert order_id, "Order ID must be a non-empty string."
+    async def gather_orders(
+        self,
+        order_ids: List[str],
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetches several orders concurrently, e.g. to poll all open orders.
 
-            response = self.client.get_order(order_id=order_id)
-            response_dict = self._handle_api_response(response)
+        Args:
+            order_ids: The orders to fetch.
+            max_concurrency: Maximum number of requests in flight at once.
 
-            assert isinstance(
-                response_dict, dict
-            ), "get_order response should be a dictionary."
-            order_details = response_dict.get("order")
+        Returns:
+            A dict mapping each order_id to its details (or None on failure).
+        """
+        return await self._gather(order_ids, self.aget_order, max_concurrency)
 
-            assert order_details is not None, "'order' key missing in response."
-            assert isinstance(order_details, dict), "'order' must be a dictionary."
+    async def gather_candles(
+        self,
+        product_ids: Optional[List[str]] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Fetches candles for configured trading pairs concurrently.
 
-            self.logger.info(f"Successfully retrieved order {order_id}.")
-            return order_details
-        except (HTTPError, RequestException, Exception) as e:
-            self._log_api_error(f"get_order for {order_id}", e)
-            return None
+        Each pair uses its own candle_granularity_api_name from config.
 
-    def cancel_orders(self, order_ids: List[str]) -> Optional[List[Dict[str, Any]]]:
-        """Cancels one or more open orders."""
-        self.logger.debug(f"Attempting to cancel orders: {order_ids}")
-        try:
-            assert self.client is not None, "RESTClient not initialized."
+        Args:
+            product_ids: Pairs to fetch; defaults to all of config.TRADING_PAIRS.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            A dict mapping each product_id to its candles (or None on failure).
+        """
+        if product_ids is None:
+            product_ids = list(config.TRADING_PAIRS)
+        for product_id in product_ids:
             assert (
-                isinstance(order_ids, list) and order_ids
-            ), "order_ids must be a non-empty list."
+                product_id in config.TRADING_PAIRS
+            ), f"{product_id} is not a configured trading pair."
 
-            response = self.client.cancel_orders(order_ids=order_ids)
-            response_dict = self._handle_api_response(response)
+        return await self._gather(
+            product_ids,
+            lambda product_id: self.aget_public_candles(
+                product_id,
+                config.TRADING_PAIRS[product_id]["candle_granularity_api_name"],
+            ),
+            max_concurrency,
+        )
 
-            assert isinstance(
-                response_dict, dict
-            ), "cancel_orders response should be a dictionary."
+    async def health_check(
+        self,
+        product_ids: Optional[List[str]] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ) -> Dict[str, bool]:
+        """
+        Probes every endpoint the bot depends on, all concurrently.
 
-            results = response_dict.get("results")
-            assert results is not None, "'results' key missing in response."
-            assert isinstance(results, list), "'results' key should be a list."
+        Accounts, candles and order books for every pair are requested at once,
+        so the check takes about one round trip regardless of the pair count.
 
-            self.logger.info(
-                f"Successfully processed cancel orders request for {order_ids}."
-            )
-            for item in results:
-                assert isinstance(
-                    item, dict
-                ), "Each item in 'results' should be a dictionary."
-                if item.get("success"):
-                    self.logger.info(
-                        f"Successfully cancelled order {item.get('order_id')}."
-                    )
-                else:
-                    error_details = item.get("error_response", {})
-                    reason = error_details.get(
-                        "message", item.get("failure_reason", "Unknown reason")
-                    )
-                    self.logger.error(
-                        f"Failed to cancel order {item.get('order_id')}. Reason: {reason}"
-                    )
+        Args:
+            product_ids: Pairs to check; defaults to all of config.TRADING_PAIRS.
+            max_concurrency: Maximum number of candle or book requests in flight.
 
-            return results
-        except (HTTPError, RequestException, Exception) as e:
-            self._log_api_error(f"cancel_orders for {order_ids}", e)
-            return None
+        Returns:
+            A dict mapping each check ("accounts", "candles:<id>", "book:<id>")
+            to whether it returned data.
+        """
+        if product_ids is None:
+            product_ids = list(config.TRADING_PAIRS)
+
+        accounts, candles, books = await asyncio.gather(
+            self.aget_accounts(),
+            self.gather_candles(product_ids, max_concurrency),
+            self.gather_product_books(product_ids, 1, max_concurrency),
+        )
+
+        results = {"accounts": accounts is not None}
+        for product_id in product_ids:
+            results[f"candles:{product_id}"] = candles[product_id] is not None
+            results[f"book:{product_id}"] = books[product_id] is not None
+        return results
@@ -13,10 +13,25 @@ loaded by python-dotenv.
 
 import os
 from typing import List, Dict, Union, Final, Literal, TypedDict
-from dotenv import load_dotenv
+
+
+def _load_env() -> None:
+    """
+    Loads variables from a .env file if the API keys are not already set.
+
+    A .env file never overrides variables already in the environment, so when
+    both keys are present there is nothing to load; python-dotenv is then not
+    imported at all, nor is the file searched for.
+    """
+    if os.getenv("COINBASE_API_KEY") and os.getenv("COINBASE_API_SECRET"):
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
 
 # Load environment variables from .env file if it exists
-load_dotenv()
+_load_env()
 
 # --- API Configuration ---
 COINBASE_API_KEY: Final[str] = os.getenv("COINBASE_API_KEY", "")
@@ -41,6 +56,12 @@ PROJECT_ROOT: Final[str] = os.path.dirname(os.path.dirname(os.path.abspath(__fil
 # Using an absolute path prevents ambiguity with the current working directory.
 PERSISTENCE_DIR: Final[str] = os.path.join(PROJECT_ROOT, "bot_data")
 
+# --- API Response Caching ---
+# Seconds an order book snapshot is reused for repeated requests of the same
+# product and depth, e.g. several indicators in one cycle. 0 disables it.
+ORDER_BOOK_CACHE_TTL_SECONDS: Final[float] = 1.0
+assert ORDER_BOOK_CACHE_TTL_SECONDS >= 0, "ORDER_BOOK_CACHE_TTL_SECONDS must be >= 0."
+
 
 # --- Trading Pair Configuration ---
 # Structure for defining profit tiers for sell orders.
@@ -162,93 +183,86 @@ TRADING_PAIRS: Final[Dict[str, TradingPairConfig]] = {
     },
 }
 
+
 # --- Sanity Checks for Configuration ---
 # Rule: Use a minimum of two runtime assertions per function/module setup.
-for pair, config_data in TRADING_PAIRS.items():
-    assert isinstance(
-        config_data["product_id"], str
-    ), f"product_id for {pair} must be a string."
-    assert (
-        isinstance(config_data["rsi_period"], int) and config_data["rsi_period"] > 0
-    ), f"rsi_period for {pair} must be a positive integer."
-    assert (
-        isinstance(config_data["rsi_oversold_threshold"], int)
-        and 0 < config_data["rsi_oversold_threshold"] < 100
-    ), f"rsi_oversold_threshold for {pair} must be between 0 and 100."
-    assert (
-        isinstance(config_data["fixed_buy_usd_amount"], float)
-        and config_data["fixed_buy_usd_amount"] > 0
-    ), f"fixed_buy_usd_amount for {pair} must be a positive float."
-    assert (
-        config_data["candle_granularity_api_name"] in CANDLE_GRANULARITY_SECONDS
-    ), f"candle_granularity_api_name for {pair} is not recognized."
-    assert (
-        isinstance(config_data["max_candle_history_needed"], int)
-        and config_data["max_candle_history_needed"] >= config_data["rsi_period"]
-    ), f"max_candle_history_needed for {pair} is insufficient."
-
-    tiers = config_data["profit_tiers"]
-    assert (
-        isinstance(tiers, list) and len(tiers) > 0
-    ), f"profit_tiers for {pair} must be a non-empty list."
-    cumulative_portion = 0.0
-    has_all_remaining = False
-    for tier in tiers:
+def _validate_config(trading_pairs: Dict[str, TradingPairConfig]) -> None:
+    """Asserts that every trading pair's configuration is well-formed."""
+    for pair, config_data in trading_pairs.items():
+        assert isinstance(
+            config_data["product_id"], str
+        ), f"product_id for {pair} must be a string."
         assert (
-            isinstance(tier["profit_pct"], (int, float)) and tier["profit_pct"] > 0
-        ), f"Tier profit_pct for {pair} must be positive."
-        sell_portion = tier["sell_portion_initial"]
-        if isinstance(sell_portion, (int, float)):
-            assert (
-                sell_portion > 0 and sell_portion <= 1.0
-            ), f"Tier sell_portion_initial for {pair} must be between 0 and 1 (exclusive of 0)."
-            cumulative_portion += sell_portion
-        elif sell_portion == "all_remaining":
-            has_all_remaining = True
-        else:
+            isinstance(config_data["rsi_period"], int) and config_data["rsi_period"] > 0
+        ), f"rsi_period for {pair} must be a positive integer."
+        assert (
+            isinstance(config_data["rsi_oversold_threshold"], int)
+            and 0 < config_data["rsi_oversold_threshold"] < 100
+        ), f"rsi_oversold_threshold for {pair} must be between 0 and 100."
+        assert (
+            isinstance(config_data["fixed_buy_usd_amount"], float)
+            and config_data["fixed_buy_usd_amount"] > 0
+        ), f"fixed_buy_usd_amount for {pair} must be a positive float."
+        assert (
+            config_data["candle_granularity_api_name"] in CANDLE_GRANULARITY_SECONDS
+        ), f"candle_granularity_api_name for {pair} is not recognized."
+        assert (
+            isinstance(config_data["max_candle_history_needed"], int)
+            and config_data["max_candle_history_needed"] >= config_data["rsi_period"]
+        ), f"max_candle_history_needed for {pair} is insufficient."
+
+        tiers = config_data["profit_tiers"]
+        assert (
+            isinstance(tiers, list) and len(tiers) > 0
+        ), f"profit_tiers for {pair} must be a non-empty list."
+        cumulative_portion = 0.0
+        has_all_remaining = False
+        for tier in tiers:
             assert (
-                False
-            ), f"Invalid sell_portion_initial value in {pair}: {sell_portion}"
-    assert (
-        has_all_remaining
-    ), f"The last profit tier for {pair} must have 'sell_portion_initial': 'all_remaining'."
-    # Rule: Avoid complex flow constructs. (Assertions are simple checks here)
-    # Allow cumulative portion to be slightly over 1 due to float precision if not using 'all_remaining' for all but last.
-    # However, with 'all_remaining' as the typical last tier, this check is more about ensuring other portions are reasonable.
-    assert (
-        cumulative_portion <= 1.0001 or has_all_remaining
-    ), f"Sum of sell_portion_initial for {pair} exceeds 100% before 'all_remaining'. Current sum: {cumulative_portion}"
-
-    # Add assertions for min_base_trade_size, min_quote_trade_size, base_increment, quote_increment
-    assert (
-        isinstance(config_data.get("min_base_trade_size"), float)
-        and config_data["min_base_trade_size"] > 0
-    ), f"min_base_trade_size for {pair} must be a positive float."
-    assert (
-        isinstance(config_data.get("min_quote_trade_size"), float)
-        and config_data["min_quote_trade_size"] > 0
-    ), f"min_quote_trade_size for {pair} must be a positive float."
-    assert (
-        isinstance(config_data.get("base_increment"), str)
-        and float(config_data["base_increment"]) > 0
-    ), f"base_increment for {pair} must be a string representing a positive float."
-    assert (
-        isinstance(config_data.get("quote_increment"), str)
-        and float(config_data["quote_increment"]) > 0
-    ), f"quote_increment for {pair} must be a string representing a positive float."
-
-
-if __name__ == "__main__":
-    # Example of how to access configuration (for testing/demonstration)
-    print("API Key Loaded:", bool(COINBASE_API_KEY))
-    print("Log Level:", LOG_LEVEL)
-    for pair_id, pair_config in TRADING_PAIRS.items():
-        print(f"\nConfiguration for {pair_id}:")
-        for key, value in pair_config.items():
-            print(f"  {key}: {value}")
-        # Calculate candle granularity in seconds
-        granularity_name = pair_config["candle_granularity_api_name"]
-        seconds = CANDLE_GRANULARITY_SECONDS.get(granularity_name)
-        print(f"  Candle Granularity (seconds): {seconds}")
-
-    print("\nConfig loaded and validated successfully.")
+                isinstance(tier["profit_pct"], (int, float)) and tier["profit_pct"] > 0
+            ), f"Tier profit_pct for {pair} must be positive."
+            sell_portion = tier["sell_portion_initial"]
+            if isinstance(sell_portion, (int, float)):
+                assert (
+                    sell_portion > 0 and sell_portion <= 1.0
+                ), f"Tier sell_portion_initial for {pair} must be between 0 and 1 (exclusive of 0)."
+                cumulative_portion += sell_portion
+            elif sell_portion == "all_remaining":
+                has_all_remaining = True
+            else:
+                assert (
+                    False
+                ), f"Invalid sell_portion_initial value in {pair}: {sell_portion}"
+        assert (
+            has_all_remaining
+        ), f"The last profit tier for {pair} must have 'sell_portion_initial': 'all_remaining'."
+        # Rule: Avoid complex flow constructs. (Assertions are simple checks here)
+        # Allow cumulative portion to be slightly over 1 due to float precision if not using 'all_remaining' for all but last.
+        # However, with 'all_remaining' as the typical last tier, this check is more about ensuring other portions are reasonable.
+        assert (
+            cumulative_portion <= 1.0001 or has_all_remaining
+        ), f"Sum of sell_portion_initial for {pair} exceeds 100% before 'all_remaining'. Current sum: {cumulative_portion}"
+
+        # Add assertions for min_base_trade_size, min_quote_trade_size, base_increment, quote_increment
+        assert (
+            isinstance(config_data.get("min_base_trade_size"), float)
+            and config_data["min_base_trade_size"] > 0
+        ), f"min_base_trade_size for {pair} must be a positive float."
+        assert (
+            isinstance(config_data.get("min_quote_trade_size"), float)
+            and config_data["min_quote_trade_size"] > 0
+        ), f"min_quote_trade_size for {pair} must be a positive float."
+        assert (
+            isinstance(config_data.get("base_increment"), str)
+            and float(config_data["base_increment"]) > 0
+        ), f"base_increment for {pair} must be a string representing a positive float."
+        assert (
+            isinstance(config_data.get("quote_increment"), str)
+            and float(config_data["quote_increment"]) > 0
+        ), f"quote_increment for {pair} must be a string representing a positive float."
+
+
+# The checks are pure assertions, so under `python -O` the whole pass over the
+# pairs is skipped rather than iterating with every assert stripped.
+if __debug__:
+    _validate_config(TRADING_PAIRS)
@@ -6,8 +6,15 @@ It removes import-time side effects and dependencies, making it testable.
 
 import logging
 import os
+import queue
 import sys
-from typing import Final, Optional
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
+from typing import Final, List, Optional
 
 
 # Custom exception for logger directory issues
@@ -17,14 +24,100 @@ class LoggerDirectoryError(Exception):
     pass
 
 
+class _QueueHandler(QueueHandler):
+    """
+    Hands records to a background listener that owns the real handlers.
+
+    Logging calls only enqueue the record; formatting the final line and the
+    console and file writes happen on the listener's thread. Closing this
+    handler drains the queue and closes the handlers it feeds, so the usual
+    handler cleanup (including logging.shutdown at exit) loses no records.
+    """
+
+    def __init__(self, handlers: List[logging.Handler]) -> None:
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        super().__init__(log_queue)
+        self.listener: Optional[QueueListener] = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self.listener.start()
+
+    def close(self) -> None:
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                # A buffering handler flushes into its target on close but
+                # leaves the target open.
+                target = getattr(handler, "target", None)
+                handler.close()
+                if target is not None:
+                    target.close()
+        super().close()
+
+
 # The root logger name for the application
 APP_LOGGER_NAME: Final[str] = "CryptoBotV6"
 
+# Record layouts. Source location (module, function, line) costs a stack walk
+# per record, so it is only captured and shown when logging at DEBUG.
+LOG_FORMAT: Final[str] = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEBUG_LOG_FORMAT: Final[str] = (
+    "%(asctime)s - %(name)s - %(levelname)s - "
+    "%(module)s.%(funcName)s:%(lineno)d - %(message)s"
+)
+LOG_DATE_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+# Formatters are stateless, so one instance per layout is shared by every
+# handler and every setup_logging call.
+_FORMATTER: Final[logging.Formatter] = logging.Formatter(
+    LOG_FORMAT, datefmt=LOG_DATE_FORMAT
+)
+_DEBUG_FORMATTER: Final[logging.Formatter] = logging.Formatter(
+    DEBUG_LOG_FORMAT, datefmt=LOG_DATE_FORMAT
+)
+
+# File records are buffered and written in batches of this many; ERROR and
+# above flush the buffer immediately so failures reach disk without delay.
+LOG_BUFFER_CAPACITY: Final[int] = 1024
+# The log file rolls over at this size, keeping this many old files.
+LOG_FILE_MAX_BYTES: Final[int] = 10_000_000
+LOG_FILE_BACKUP_COUNT: Final[int] = 5
+
 # Global variable to hold the configured logger instance.
 # This is checked to ensure setup_logging is called only once.
 _logger_instance: Optional[logging.Logger] = None
 
 
+def _set_caller_lookup(enabled: bool) -> None:
+    """
+    Enables or disables the stack walk logging does to find each record's caller.
+
+    The logging module skips findCaller() while its `_srcfile` is None; the
+    enabled value is the path logging itself computes at import.
+    """
+    logging._srcfile = (
+        os.path.normcase(logging.addLevelName.__code__.co_filename) if enabled else None
+    )
+
+
+def _clear_handlers(logger: logging.Logger) -> None:
+    """
+    Detaches and closes every handler of the given logger.
+
+    The list is swapped out under the logging module's lock in one step, and
+    the handlers are closed afterwards so a slow or failing close (such as a
+    queue draining) neither holds the lock nor stops the others closing.
+    """
+    with logging._lock:  # type: ignore[attr-defined]
+        old_handlers = logger.handlers[:]
+        logger.handlers.clear()
+    for handler in old_handlers:
+        try:
+            handler.close()
+        except Exception:
+            pass
+
+
 def setup_logging(level: str, log_file: str, persistence_dir: str) -> logging.Logger:
     """
     Configures and returns the application's root logger.
@@ -42,7 +135,7 @@ def setup_logging(level: str, log_file: str, persistence_dir: str) -> logging.Lo
         logging.Logger: The configured logger instance.
 
     Raises:
-        LoggerDirectoryError: If the log directory cannot be created or is not writable.
+        LoggerDirectoryError: If the log directory cannot be created.
         ValueError: If the provided log level is invalid.
     """
     global _logger_instance
@@ -56,12 +149,10 @@ def setup_logging(level: str, log_file: str, persistence_dir: str) -> logging.Lo
 
     # 2. Create log directory
     log_directory = os.path.join(persistence_dir, "logs")
+    # Writability is not probed separately: opening the log file below is the
+    # real test, and if it fails logging falls back to the console only.
     try:
         os.makedirs(log_directory, exist_ok=True)
-        if not os.access(log_directory, os.W_OK):
-            raise LoggerDirectoryError(
-                f"Log directory '{log_directory}' is not writable."
-            )
     except OSError as e:
         raise LoggerDirectoryError(
             f"Failed to create log directory '{log_directory}': {e}"
@@ -73,30 +164,45 @@ def setup_logging(level: str, log_file: str, persistence_dir: str) -> logging.Lo
     logger.propagate = False
 
     # Clear any existing handlers to prevent duplicate logs in test environments
-    if logger.hasHandlers():
-        for handler in list(logger.handlers):
-            logger.removeHandler(handler)
-            handler.close()
+    _clear_handlers(logger)
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s:%(lineno)d - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    verbose = numeric_level <= logging.DEBUG
+    _set_caller_lookup(verbose)
+    # No format consumes thread or process details, so skip collecting them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    formatter = _DEBUG_FORMATTER if verbose else _FORMATTER
 
-    # 4. Create and add console handler
+    # 4. Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
 
-    # 5. Create and add file handler
+    # 5. Create file handler
     log_file_path = os.path.join(log_directory, log_file)
+    file_error: Optional[IOError] = None
     try:
-        file_handler = logging.FileHandler(log_file_path, mode="a")
+        file_handler = RotatingFileHandler(
+            log_file_path,
+            mode="a",
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+        )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(
+            MemoryHandler(
+                LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+            )
+        )
     except IOError as e:
+        file_error = e
+
+    # 6. Attach them behind a queue so logging never blocks on console or disk
+    logger.addHandler(_QueueHandler(handlers))
+    if file_error is not None:
         logger.error(
-            f"Could not open log file '{log_file_path}': {e}. File logging will be disabled."
+            f"Could not open log file '{log_file_path}': {file_error}. File logging will be disabled."
         )
 
     _logger_instance = logger
@@ -132,11 +238,13 @@ def _reset_logger() -> None:
     logger setup to be tested multiple times without interference.
     """
     global _logger_instance
-    if _logger_instance:
-        logger = logging.getLogger(APP_LOGGER_NAME)
-        for handler in list(logger.handlers):
-            logger.removeHandler(handler)
-            handler.close()
-        # Reset propagate to its default value
+    logger = _logger_instance
+    if logger is not None:
+        _clear_handlers(logger)
+        # Reset propagate and the record attributes to their defaults
         logger.propagate = True
+        _set_caller_lookup(True)
+        logging.logThreads = True
+        logging.logProcesses = True
+        logging.logMultiprocessing = True
         _logger_instance = None
@@ -1,16 +1,39 @@
 """Handles saving and loading of persistent bot state, like buy prices."""
 
+import contextlib
 import json
 import os
 import time
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Set, cast
+
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - depends on the environment
+    _json = json  # type: ignore[misc]
 
 from .config import PERSISTENCE_DIR
 from .logger import get_logger
 
 
+def _fsync_directory(directory: str) -> None:
+    """Flushes a directory's entries to disk, making a rename in it durable."""
+    if not hasattr(os, "O_DIRECTORY"):  # pragma: no cover - non-POSIX platforms
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 class PersistenceManager:
-    """Manages reading and writing the bot's trade state to the filesystem."""
+    """
+    Manages reading and writing the bot's trade state to the filesystem.
+
+    Each asset has its own state file and bookkeeping, so different assets
+    may be handled from different threads. Calls for the same asset must not
+    run concurrently.
+    """
 
     def __init__(
         self, persistence_dir: Optional[str] = None, logger: Optional[Any] = None
@@ -25,15 +48,26 @@ class PersistenceManager:
         """
         self.persistence_dir = persistence_dir if persistence_dir else PERSISTENCE_DIR
         self.logger = logger if logger else get_logger()
+        # Assets known to have no state file. Only this manager creates state
+        # files, so the answer holds until it saves one.
+        self._absent: Set[str] = set()
+        # State file path per asset; the set of traded assets is small and fixed.
+        self._path_cache: Dict[str, str] = {}
 
     def _get_file_path(self, asset_id: str) -> str:
         """Constructs the file path for the asset's state file."""
-        return os.path.join(self.persistence_dir, f"{asset_id}_trade_state.json")
+        path = self._path_cache.get(asset_id)
+        if path is None:
+            path = os.path.join(self.persistence_dir, f"{asset_id}_trade_state.json")
+            self._path_cache[asset_id] = path
+        return path
 
     def save_trade_state(self, asset_id: str, state_data: Dict[str, Any]) -> None:
         """
         Saves the provided state_data dictionary to a JSON file.
 
+        The file is replaced atomically and synced to disk before returning.
+
         Args:
             asset_id: The identifier for the asset (e.g., 'BTC-USD').
             state_data: A dictionary containing the trade state to save.
@@ -41,6 +75,7 @@ class PersistenceManager:
         Raises:
             IOError: If there is an error writing to the file.
             TypeError: If arguments have incorrect types or content is not serializable.
+            ValueError: If state_data contains a NaN or Infinity float.
         """
         assert (
             isinstance(asset_id, str) and asset_id
@@ -52,14 +87,30 @@ class PersistenceManager:
             self.persistence_dir
         ), "File path construction seems incorrect."
 
+        tmp_path = f"{file_path}.tmp"
         try:
             os.makedirs(self.persistence_dir, exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(state_data, f, indent=4)
+            # Encode first, then hand the file a single write; json.dump issues
+            # one write per token. NaN and Infinity are rejected because they
+            # are not valid JSON and load_trade_state could not read them back.
+            data = json.dumps(state_data, indent=4, allow_nan=False)
+            # Write a temporary file, force it to disk, then rename it over the
+            # old state and sync the directory so the rename itself survives a
+            # crash. At any point either the previous or the new state is on
+            # disk, never a truncated file.
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+            _fsync_directory(self.persistence_dir)
+            self._absent.discard(asset_id)
             self.logger.debug(
-                f"Successfully saved trade state for {asset_id} to {file_path}"
+                "Successfully saved trade state for %s to %s", asset_id, file_path
             )
         except (IOError, OSError) as e:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
             self.logger.error(f"Error writing to {file_path}: {e}", exc_info=True)
             raise IOError(f"Failed to write to {file_path}.") from e
         except TypeError as e:
@@ -68,6 +119,14 @@ class PersistenceManager:
                 exc_info=True,
             )
             raise TypeError("state_data contains non-serializable content.") from e
+        except ValueError as e:
+            self.logger.error(
+                f"Non-finite number in state_data for {asset_id}: {e}",
+                exc_info=True,
+            )
+            raise ValueError(
+                "state_data contains a non-finite number (NaN or Infinity)."
+            ) from e
 
     def load_trade_state(self, asset_id: str) -> Dict[str, Any]:
         """
@@ -82,22 +141,33 @@ class PersistenceManager:
         assert (
             isinstance(asset_id, str) and asset_id
         ), "asset_id must be a non-empty string."
+        if asset_id in self._absent:
+            return {}
         file_path = self._get_file_path(asset_id)
 
         if not os.path.exists(file_path):
+            self._absent.add(asset_id)
             return {}
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                state_data = json.load(f)
-                if not isinstance(state_data, dict):
-                    self.logger.error(
-                        f"Corrupted state file for {asset_id}: content is not a dict."
-                    )
-                    return {}
-                self.logger.debug(f"Successfully loaded trade state for {asset_id}")
-                return state_data
-        except json.JSONDecodeError as e:
+            # State files are small: read the bytes in one call and parse them
+            # in one pass rather than letting json.load stream the file.
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            try:
+                state_data = _json.loads(raw)
+            except ValueError:
+                # Files written before saves rejected NaN and Infinity may hold
+                # those tokens; orjson refuses them but the json module accepts.
+                state_data = json.loads(raw)
+            if not isinstance(state_data, dict):
+                self.logger.error(
+                    f"Corrupted state file for {asset_id}: content is not a dict."
+                )
+                return {}
+            self.logger.debug("Successfully loaded trade state for %s", asset_id)
+            return state_data
+        except ValueError as e:  # JSON and UTF-8 decode errors
             self.logger.error(
                 f"Error decoding JSON from {file_path}: {e}", exc_info=True
             )
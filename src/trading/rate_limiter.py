@@ -0,0 +1,116 @@
+"""A thread-safe token-bucket rate limiter driven by API rate-limit headers."""
+
+import threading
+import time
+from typing import Any, Final, Optional
+
+# Below this fraction of the server-reported budget, the refill rate is scaled
+# down proportionally so we slow down before the server starts returning 429s.
+LOW_BUDGET_FRACTION: Final[float] = 0.2
+# Never pause longer than this when the server reports an exhausted budget.
+MAX_RESET_PAUSE_SECONDS: Final[float] = 60.0
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Parses a header value into a float, returning None if it is unusable."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Proactively throttles outgoing requests.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    request consumes one. The rate adapts to the `x-ratelimit-*` headers the
+    server returns, shrinking when the remaining budget is low and recovering
+    to the base rate when it is plentiful.
+    """
+
+    def __init__(
+        self, rate: float, capacity: Optional[float] = None, min_rate: float = 1.0
+    ) -> None:
+        """
+        Initializes the bucket full.
+
+        Args:
+            rate: The base refill rate in tokens (requests) per second.
+            capacity: Maximum burst size. Defaults to one second's worth of rate.
+            min_rate: Floor for the adaptive refill rate.
+        """
+        assert rate > 0, "rate must be positive."
+        assert 0 < min_rate <= rate, "min_rate must be positive and <= rate."
+        self.base_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity if capacity is not None else rate
+        assert self.capacity >= 1, "capacity must allow at least one request."
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Adds tokens for the time elapsed since the last refill."""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def acquire(self) -> float:
+        """
+        Blocks until a token is available and consumes it.
+
+        Returns:
+            The number of seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._paused_until:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+                else:
+                    delay = self._paused_until - now
+            time.sleep(delay)
+            waited += delay
+
+    def update_from_headers(self, limit: Any, remaining: Any, reset: Any) -> None:
+        """
+        Adjusts the refill rate from the server's rate-limit headers.
+
+        Args:
+            limit: Value of `x-ratelimit-limit` (requests per window).
+            remaining: Value of `x-ratelimit-remaining`.
+            reset: Value of `x-ratelimit-reset` (epoch seconds or seconds left).
+        """
+        limit_f = _to_float(limit)
+        remaining_f = _to_float(remaining)
+        if limit_f is None or remaining_f is None or limit_f <= 0:
+            return
+
+        with self._lock:
+            fraction = max(0.0, remaining_f) / limit_f
+            if fraction < LOW_BUDGET_FRACTION:
+                scaled = self.base_rate * fraction / LOW_BUDGET_FRACTION
+                self.rate = max(self.min_rate, scaled)
+            else:
+                self.rate = self.base_rate
+            # Never hold more tokens than the server says we have left.
+            self._tokens = min(self._tokens, max(0.0, remaining_f))
+
+            reset_f = _to_float(reset)
+            if remaining_f <= 0 and reset_f is not None:
+                # Large values are absolute epoch timestamps; small ones are
+                # seconds until the window resets.
+                pause = reset_f - time.time() if reset_f > 1e9 else reset_f
+                pause = min(max(pause, 0.0), MAX_RESET_PAUSE_SECONDS)
+                self._paused_until = time.monotonic() + pause
@@ -67,7 +67,9 @@ def calculate_rsi(candles_df: pd.DataFrame, period: int = 14) -> Optional[pd.Ser
     assert isinstance(period, int) and period > 0, "period must be a positive integer."
 
     logger.debug(
-        f"Attempting to calculate RSI with period {period} on DataFrame with {len(candles_df)} rows."
+        "Attempting to calculate RSI with period %d on DataFrame with %d rows.",
+        period,
+        len(candles_df),
     )
 
     if not _validate_candles_df(candles_df, "RSI"):
@@ -134,7 +136,9 @@ def calculate_sma(candles_df: pd.DataFrame, period: int = 20) -> Optional[pd.Ser
     assert isinstance(period, int) and period > 0, "period must be a positive integer."
 
     logger.debug(
-        f"Attempting to calculate SMA with period {period} on DataFrame with {len(candles_df)} rows."
+        "Attempting to calculate SMA with period %d on DataFrame with %d rows.",
+        period,
+        len(candles_df),
     )
 
     if not _validate_candles_df(candles_df, "SMA"):
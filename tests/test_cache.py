@@ -0,0 +1,73 @@
+"""Unit tests for the trading.cache module."""
+
+import unittest
+from unittest.mock import patch
+
+from trading.cache import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Tests for the TTLCache class."""
+
+    @patch("trading.cache.time.monotonic")
+    def test_get_returns_fresh_value(self, mock_monotonic):
+        """Test a value is returned while it is within its TTL."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(ttl=10.0)
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 109.9
+        self.assertEqual(cache.get("key"), "value")
+
+    @patch("trading.cache.time.monotonic")
+    def test_get_returns_none_when_expired(self, mock_monotonic):
+        """Test an expired value is not returned by get but is by get_stale."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(ttl=10.0)
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 110.0
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get_stale("key"), "value")
+
+    def test_get_missing_key(self):
+        """Test missing keys return None from both accessors."""
+        cache = TTLCache(ttl=10.0)
+        self.assertIsNone(cache.get("missing"))
+        self.assertIsNone(cache.get_stale("missing"))
+
+    def test_set_evicts_oldest_when_full(self):
+        """Test the oldest entry is evicted once maxsize is exceeded."""
+        cache = TTLCache(ttl=10.0, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get_stale("a"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_invalidate_and_clear(self):
+        """Test invalidate removes one key and clear removes all."""
+        cache = TTLCache(ttl=10.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        cache.invalidate("not-there")
+        self.assertIsNone(cache.get_stale("a"))
+        self.assertEqual(len(cache), 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_arguments(self):
+        """Test that invalid ttl and maxsize values are rejected."""
+        with self.assertRaises(AssertionError):
+            TTLCache(ttl=-1.0)
+        with self.assertRaises(AssertionError):
+            TTLCache(ttl=1.0, maxsize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
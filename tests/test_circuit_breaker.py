@@ -0,0 +1,99 @@
+"""Unit tests for the trading.circuit_breaker module."""
+
+import unittest
+from unittest.mock import patch
+
+from trading.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests for the CircuitBreaker class."""
+
+    def _call(self, breaker, success):
+        """Runs one admitted call through the breaker with the given outcome."""
+        ticket = breaker.allow()
+        self.assertIsNotNone(ticket)
+        breaker.record(ticket, success)
+
+    @patch("trading.circuit_breaker.time.monotonic", return_value=100.0)
+    def test_opens_when_failure_ratio_exceeded(self, _):
+        """Test the breaker opens once most calls in the window fail."""
+        breaker = CircuitBreaker(min_calls=4, failure_ratio=0.5)
+        for success in (True, False, False):
+            self._call(breaker, success)
+        self.assertFalse(breaker.is_open)  # Too few calls to judge.
+
+        self._call(breaker, False)
+        self.assertTrue(breaker.is_open)
+        self.assertIsNone(breaker.allow())
+
+    @patch("trading.circuit_breaker.time.monotonic", return_value=100.0)
+    def test_stays_closed_at_failure_ratio(self, _):
+        """Test the breaker only opens above the failure ratio, not at it."""
+        breaker = CircuitBreaker(min_calls=4, failure_ratio=0.5)
+        for success in (True, False, True, False):
+            self._call(breaker, success)
+        self.assertFalse(breaker.is_open)
+        self.assertIsNotNone(breaker.allow())
+
+    @patch("trading.circuit_breaker.time.monotonic")
+    def test_old_failures_leave_the_window(self, mock_monotonic):
+        """Test failures older than the window no longer count."""
+        breaker = CircuitBreaker(window_seconds=30.0, min_calls=2)
+        mock_monotonic.return_value = 100.0
+        self._call(breaker, False)
+
+        mock_monotonic.return_value = 131.0
+        self._call(breaker, False)
+        self.assertFalse(breaker.is_open)
+
+    @patch("trading.circuit_breaker.time.monotonic")
+    def test_trial_call_after_cooldown(self, mock_monotonic):
+        """Test one trial is allowed after the cooldown and decides the state."""
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(min_calls=1, cooldown_seconds=30.0)
+        self._call(breaker, False)
+        self.assertIsNone(breaker.allow())
+
+        mock_monotonic.return_value = 130.0
+        trial = breaker.allow()
+        self.assertIsNotNone(trial)
+        self.assertIsNone(breaker.allow())  # Only one trial at a time.
+        breaker.record(trial, False)
+        self.assertIsNone(breaker.allow())  # Reopened for another cooldown.
+
+        mock_monotonic.return_value = 160.0
+        self._call(breaker, True)
+        self.assertFalse(breaker.is_open)
+        self.assertIsNotNone(breaker.allow())
+
+    @patch("trading.circuit_breaker.time.monotonic")
+    def test_late_result_does_not_decide_trial(self, mock_monotonic):
+        """Test a call admitted before the breaker opened cannot close it."""
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(min_calls=1, cooldown_seconds=30.0)
+        slow_call = breaker.allow()
+        self._call(breaker, False)  # Opens the breaker.
+
+        mock_monotonic.return_value = 130.0
+        trial = breaker.allow()
+        breaker.record(slow_call, True)  # Finishes during the trial.
+        self.assertTrue(breaker.is_open)
+
+        breaker.record(trial, False)
+        self.assertIsNone(breaker.allow())  # The trial decided: still open.
+
+    def test_invalid_arguments(self):
+        """Test that invalid configuration values are rejected."""
+        with self.assertRaises(AssertionError):
+            CircuitBreaker(window_seconds=0)
+        with self.assertRaises(AssertionError):
+            CircuitBreaker(failure_ratio=1.0)
+        with self.assertRaises(AssertionError):
+            CircuitBreaker(min_calls=0)
+        with self.assertRaises(AssertionError):
+            CircuitBreaker(cooldown_seconds=-1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
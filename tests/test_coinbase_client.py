@@ -1,14 +1,20 @@
 """Unit tests for the CoinbaseClient class."""
 
 
+import asyncio
+import threading
 import unittest
 from unittest.mock import ANY, patch, MagicMock, call
 import uuid
+import requests
 from requests.exceptions import HTTPError, RequestException
 from datetime import datetime, timezone, timedelta
 
 # Now that the path is set, we can import the class to be tested
+from trading import coinbase_client  # noqa: E402
+from trading import config as real_config  # noqa: E402
 from trading.coinbase_client import CoinbaseClient  # noqa: E402
+from coinbase.rest import RESTClient  # noqa: E402
 
 
 class MockResponse:
@@ -27,20 +33,31 @@ class TestCoinbaseClient(unittest.TestCase):
         patcher_rest_client = patch("trading.coinbase_client.RESTClient")
         patcher_config = patch("trading.coinbase_client.config")
         patcher_logger = patch("trading.coinbase_client.logger")
+        # Transient errors are retried with backoff; never really sleep in tests.
+        patcher_sleep = patch("trading.coinbase_client.time.sleep")
 
         self.mock_rest_client_class = patcher_rest_client.start()
         self.mock_config_module = patcher_config.start()
         self.mock_logger_module = patcher_logger.start()
+        self.mock_sleep = patcher_sleep.start()
 
         self.addCleanup(patcher_rest_client.stop)
         self.addCleanup(patcher_config.stop)
         self.addCleanup(patcher_logger.stop)
+        self.addCleanup(patcher_sleep.stop)
 
         self.mock_logger_instance = self.mock_logger_module.get_logger.return_value
         self.mock_rest_client_instance = self.mock_rest_client_class.return_value
 
         self.mock_config_module.COINBASE_API_KEY = "test_api_key"
         self.mock_config_module.COINBASE_API_SECRET = "test_api_secret"  # nosec
+        self.mock_config_module.CANDLE_GRANULARITY_SECONDS = (
+            real_config.CANDLE_GRANULARITY_SECONDS
+        )
+        self.mock_config_module.TRADING_PAIRS = real_config.TRADING_PAIRS
+        self.mock_config_module.ORDER_BOOK_CACHE_TTL_SECONDS = (
+            real_config.ORDER_BOOK_CACHE_TTL_SECONDS
+        )
 
         # Common HTTP/Request exception mocks
         mock_response = MagicMock()
@@ -48,6 +65,11 @@ class TestCoinbaseClient(unittest.TestCase):
         mock_response.text = "Not Found"
         self.mock_http_error = HTTPError("Test HTTP Error", response=mock_response)
         self.mock_request_exception = RequestException("Test Request Exception")
+        mock_server_response = MagicMock()
+        mock_server_response.status_code = 503
+        self.mock_server_error = HTTPError(
+            "Test Server Error", response=mock_server_response
+        )
 
         # Instantiate the client here, so it uses all the mocks set up above
         self.client = CoinbaseClient()
@@ -61,7 +83,7 @@ class TestCoinbaseClient(unittest.TestCase):
         ).side_effect = self.mock_http_error
         result = getattr(self.client, method_name)(**api_args)
         self.assertIsNone(result)
-        self.mock_logger_instance.error.assert_called_with(log_message, exc_info=True)
+        self.mock_logger_instance.error.assert_called_with(log_message)
 
     def _test_api_call_request_exception(
         self, method_name, rest_method_name, api_args, log_message
@@ -72,7 +94,7 @@ class TestCoinbaseClient(unittest.TestCase):
         ).side_effect = self.mock_request_exception
         result = getattr(self.client, method_name)(**api_args)
         self.assertIsNone(result)
-        self.mock_logger_instance.error.assert_called_with(log_message, exc_info=True)
+        self.mock_logger_instance.error.assert_called_with(log_message)
 
     # --- Test Initialization ---
 
@@ -82,6 +104,7 @@ class TestCoinbaseClient(unittest.TestCase):
         self.mock_rest_client_class.assert_called_once_with(
             api_key="test_api_key",
             api_secret="test_api_secret",  # nosec
+            timeout=coinbase_client.HTTP_TIMEOUT_SECONDS,
             rate_limit_headers=True,
         )
         self.mock_logger_instance.info.assert_called_with(
@@ -97,12 +120,118 @@ class TestCoinbaseClient(unittest.TestCase):
         self.mock_rest_client_class.assert_called_once_with(
             api_key="direct_key",
             api_secret="direct_secret",  # nosec
+            timeout=coinbase_client.HTTP_TIMEOUT_SECONDS,
             rate_limit_headers=True,
         )
         self.mock_logger_instance.info.assert_called_with(
             "Coinbase RESTClient initialized successfully for the live API."
         )
 
+    def test_initialization_uses_shared_pooled_session(self):
+        """Test that the RESTClient is wired to the shared keep-alive session."""
+        self.assertIs(self.client.client.session, coinbase_client._SESSION)
+        adapter = coinbase_client._SESSION.get_adapter("https://api.coinbase.com")
+        self.assertEqual(adapter._pool_maxsize, coinbase_client.HTTP_POOL_MAXSIZE)
+        self.assertFalse(adapter._pool_block)
+        self.assertEqual(
+            adapter.max_retries.connect, coinbase_client.HTTP_CONNECT_RETRIES
+        )
+        self.assertEqual(adapter.max_retries.read, 0)
+        self.assertEqual(adapter.max_retries.status, 0)
+        self.assertEqual(coinbase_client._SESSION.headers["Connection"], "keep-alive")
+        self.assertEqual(
+            coinbase_client._SESSION.headers["Accept-Encoding"],
+            coinbase_client._accept_encoding(),
+        )
+
+    def test_initialization_binds_sdk_endpoints(self):
+        """Test the SDK endpoints are bound once at construction."""
+        for name in (
+            "get_accounts",
+            "get_public_candles",
+            "get_product_book",
+            "get_product",
+            "get_products",
+            "create_order",
+            "get_order",
+            "cancel_orders",
+        ):
+            # The real SDK class must provide every endpoint that is bound.
+            self.assertTrue(hasattr(RESTClient, name), name)
+            self.assertIs(
+                getattr(self.client, f"_sdk_{name}"),
+                getattr(self.mock_rest_client_instance, name),
+            )
+
+    def test_initialization_closes_sdk_private_session(self):
+        """Test the session the SDK created for itself is closed when replaced."""
+        sdk_session = MagicMock()
+        self.mock_rest_client_instance.session = sdk_session
+
+        client = CoinbaseClient()
+
+        sdk_session.close.assert_called_once()
+        self.assertIs(client.client.session, coinbase_client._SESSION)
+
+    def _make_response(self, body):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        return response
+
+    def test_memoize_json_parses_body_once(self):
+        """Test the response hook parses the body once and reuses the result."""
+        self.assertIn(
+            coinbase_client._memoize_json,
+            coinbase_client._SESSION.hooks["response"],
+        )
+        response = self._make_response(b'{"candles": [{"close": "1.5"}]}')
+        coinbase_client._memoize_json(response)
+
+        with patch(
+            "trading.coinbase_client._json.loads", wraps=coinbase_client._json.loads
+        ) as mock_loads:
+            first = response.json()
+            second = response.json()
+
+        self.assertEqual(first, {"candles": [{"close": "1.5"}]})
+        self.assertIs(first, second)
+        mock_loads.assert_called_once_with(response.content)
+
+    def test_memoize_json_invalid_body_raises_requests_error(self):
+        """Test an unparseable body still raises requests' JSONDecodeError."""
+        response = self._make_response(b"<html>bad gateway</html>")
+        coinbase_client._memoize_json(response)
+
+        with self.assertRaises(requests.exceptions.JSONDecodeError):
+            response.json()
+
+    def test_session_serializes_json_body_once(self):
+        """Test JSON request bodies are pre-serialized to bytes by _json."""
+        payload = {"side": "BUY", "order_configuration": {"limit_limit_gtc": {}}}
+        request = requests.Request(
+            "POST",
+            "https://api.coinbase.com/api/v3/brokerage/orders",
+            json=payload,
+            headers={"Content-Type": "application/json"},
+        )
+
+        prepared = coinbase_client._SESSION.prepare_request(request)
+
+        self.assertEqual(coinbase_client._json.loads(prepared.body), payload)
+        self.assertEqual(prepared.headers["Content-Type"], "application/json")
+        if coinbase_client._json is not coinbase_client.json:
+            self.assertIsInstance(prepared.body, bytes)
+
+    def test_accept_encoding_advertises_brotli_only_when_available(self):
+        """Test br is requested only if a brotli decoder can be imported."""
+        with patch("trading.coinbase_client.importlib.util.find_spec") as mock_find:
+            mock_find.return_value = None
+            self.assertEqual(coinbase_client._accept_encoding(), "gzip, deflate")
+
+            mock_find.side_effect = lambda name: object() if name == "brotli" else None
+            self.assertEqual(coinbase_client._accept_encoding(), "gzip, deflate, br")
+
     def test_initialization_failure(self):
         """Test initialization failure if RESTClient instantiation fails."""
         self.mock_rest_client_class.side_effect = Exception("Connection Failed")
@@ -111,7 +240,9 @@ class TestCoinbaseClient(unittest.TestCase):
         ):
             CoinbaseClient()
         self.mock_logger_instance.error.assert_called_with(
-            "Failed to initialize Coinbase RESTClient: Connection Failed", exc_info=True
+            "Failed to initialize Coinbase RESTClient: %s",
+            self.mock_rest_client_class.side_effect,
+            exc_info=True,
         )
 
     def test_initialization_no_api_key(self):
@@ -146,43 +277,38 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsInstance(order_id, str)
         self.assertTrue(len(order_id) > 0)
 
-    def test_generate_client_order_id_single_char_id(self):
-        """Test that a single-character ID is handled correctly."""
-        test_uuid = uuid.uuid4()
-        with patch("trading.coinbase_client.uuid.uuid4", return_value=test_uuid):
-            client_order_id = self.client._generate_client_order_id()
-            self.assertEqual(client_order_id, str(test_uuid))
-
-    def test_generate_client_order_id_uuid_error(self):
-        """Test that an error is raised when uuid.uuid4 returns a non-UUID type."""
-        with patch("trading.coinbase_client.uuid.uuid4", return_value="not-a-uuid"):
-            try:
-                self.client._generate_client_order_id()
-                self.fail("AssertionError was not raised by _generate_client_order_id")
-            except AssertionError as e:
-                expected_msg = "uuid.uuid4() did not return a UUID object."
-                self.assertEqual(str(e), expected_msg)
-
-    def test_generate_client_order_id_empty_string(self):
-        """Test that an error is raised when the generated order_id is an empty string."""
-        mock_uuid = MagicMock(spec=uuid.UUID)
-        mock_uuid.__str__.return_value = ""
-
-        with patch("trading.coinbase_client.uuid.uuid4", return_value=mock_uuid):
-            try:
+    def test_generate_client_order_id_is_unique_hex(self):
+        """Test pooled IDs are distinct, dash-free 128-bit hex strings."""
+        ids = [self.client._generate_client_order_id() for _ in range(2000)]
+
+        self.assertEqual(len(set(ids)), len(ids))
+        for order_id in ids[:5] + ids[-5:]:
+            self.assertEqual(len(order_id), 32)
+            int(order_id, 16)
+
+    def test_generate_client_order_id_refills_pool_on_underflow(self):
+        """Test the pool is filled with one urandom read and refilled when empty."""
+        pool_size = coinbase_client.CLIENT_ORDER_ID_POOL_SIZE
+        coinbase_client._reset_client_order_ids()
+        with patch(
+            "trading.coinbase_client.os.urandom", wraps=coinbase_client.os.urandom
+        ) as mock_urandom:
+            for _ in range(pool_size):
                 self.client._generate_client_order_id()
-                self.fail("AssertionError was not raised for empty client_order_id")
-            except AssertionError as e:
-                self.assertEqual(str(e), "Generated client_order_id is empty.")
+            mock_urandom.assert_called_once_with(16 * pool_size)
+
+            self.client._generate_client_order_id()
+            self.assertEqual(mock_urandom.call_count, 2)
 
-    def test_generate_client_order_id_length_one(self):
-        """Test that _generate_client_order_id handles a one-character string."""
-        mock_uuid = MagicMock(spec=uuid.UUID)
-        mock_uuid.__str__.return_value = "a"
+    def test_reset_client_order_ids_discards_pooled_ids(self):
+        """Test the fork hook empties the pool so a child draws fresh IDs."""
+        self.client._generate_client_order_id()
+        self.assertTrue(coinbase_client._order_id_pool)
 
-        with patch("trading.coinbase_client.uuid.uuid4", return_value=mock_uuid):
-            order_id = self.client._generate_client_order_id()
-            self.assertEqual(order_id, "a")
+        coinbase_client._reset_client_order_ids()
+
+        self.assertFalse(coinbase_client._order_id_pool)
+        self.assertEqual(len(self.client._generate_client_order_id()), 32)
 
     # --- Test _handle_api_response ---
 
@@ -208,8 +334,130 @@ class TestCoinbaseClient(unittest.TestCase):
         mock_response.to_dict.assert_called_once()
         self.assertEqual(result, {"key": "value"})
 
+    def test_handle_api_response_other_formats(self):
+        """Test dicts pass through, JSON strings are parsed and bad JSON is kept."""
+        payload = {"key": "value"}
+        self.assertIs(self.client._handle_api_response(payload), payload)
+        self.assertEqual(self.client._handle_api_response('{"a": 1}'), {"a": 1})
+        self.assertEqual(self.client._handle_api_response("not json"), "not json")
+        self.assertEqual(self.client._handle_api_response(b'{"a": 1}'), {"a": 1})
+        self.assertIsNone(self.client._handle_api_response(None))
+
+    def test_handle_api_response_resolves_decoder_once_per_type(self):
+        """Test the decoder for a response type is resolved only on first use."""
+
+        class Model:
+            def to_dict(self):
+                return {"ok": True}
+
+        with patch(
+            "trading.coinbase_client._resolve_response_decoder",
+            wraps=coinbase_client._resolve_response_decoder,
+        ) as mock_resolve:
+            for _ in range(3):
+                self.assertEqual(
+                    self.client._handle_api_response(Model()), {"ok": True}
+                )
+        mock_resolve.assert_called_once()
+
+    def test_handle_api_response_uses_class_to_dict_and_seeded_types(self):
+        """Test model classes decode via their to_dict function; builtins are seeded."""
+
+        class Model:
+            def to_dict(self):
+                return {"ok": True}
+
+        self.assertIs(coinbase_client._resolve_response_decoder(Model()), Model.to_dict)
+        with patch("trading.coinbase_client._resolve_response_decoder") as mock_resolve:
+            self.client._handle_api_response({"a": 1})
+            self.client._handle_api_response('{"a": 1}')
+            self.client._handle_api_response(b"{}")
+            self.client._handle_api_response(None)
+        mock_resolve.assert_not_called()
+
+    # --- Test _api_call ---
+
+    def test_api_call_logs_with_bound_arguments_and_uses_fallback(self):
+        """Test handled errors are logged with formatted context and fall back."""
+
+        @coinbase_client._api_call(
+            "probe for {product_id} ({limit})",
+            fallback=lambda client, product_id: f"stale {product_id}",
+        )
+        def probe(client, product_id, limit=5):
+            raise ValueError("boom")
+
+        self.assertEqual(probe(self.client, "BTC-USD"), "stale BTC-USD")
+        self.assertEqual(probe.__name__, "probe")
+        self.mock_logger_instance.error.assert_called_once_with(
+            "An error occurred in probe for BTC-USD (5): boom"
+        )
+
+    def test_api_call_precondition_raises_before_error_handling(self):
+        """Test a failed precondition propagates instead of being logged."""
+        probe_body = MagicMock()
+
+        @coinbase_client._api_call(
+            "probe for {product_id}", precondition=coinbase_client._require_product_id
+        )
+        def probe(client, product_id):
+            probe_body(product_id)
+
+        with self.assertRaises(AssertionError):
+            probe(self.client, "")
+        probe_body.assert_not_called()
+        self.mock_logger_instance.error.assert_not_called()
+
+    def test_api_call_propagates_unhandled_exceptions(self):
+        """Test exceptions outside the handled set are re-raised unlogged."""
+
+        @coinbase_client._api_call("probe", exceptions=(ValueError,))
+        def probe(client):
+            raise KeyError("missing")
+
+        with self.assertRaises(KeyError):
+            probe(self.client)
+        self.mock_logger_instance.error.assert_not_called()
+
     # --- Test get_accounts ---
 
+    def test_get_accounts_follows_pagination_cursor(self):
+        """Test every page is fetched by following has_next/cursor."""
+        self.mock_rest_client_instance.get_accounts.side_effect = [
+            {"accounts": [{"uuid": "1"}], "has_next": True, "cursor": "c1"},
+            {"accounts": [{"uuid": "2"}], "has_next": True, "cursor": "c2"},
+            {"accounts": [{"uuid": "3"}], "has_next": False, "cursor": ""},
+        ]
+
+        result = self.client.get_accounts()
+
+        self.assertEqual([a["uuid"] for a in result], ["1", "2", "3"])
+        page_size = coinbase_client.ACCOUNTS_PAGE_SIZE
+        self.assertEqual(
+            self.mock_rest_client_instance.get_accounts.call_args_list,
+            [
+                call(limit=page_size, cursor=None),
+                call(limit=page_size, cursor="c1"),
+                call(limit=page_size, cursor="c2"),
+            ],
+        )
+
+    def test_get_accounts_stops_when_cursor_does_not_advance(self):
+        """Test a repeated cursor ends pagination instead of looping forever."""
+        self.mock_rest_client_instance.get_accounts.return_value = {
+            "accounts": [{"uuid": "1"}],
+            "has_next": True,
+            "cursor": "same",
+        }
+
+        result = self.client.get_accounts()
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(self.mock_rest_client_instance.get_accounts.call_count, 2)
+        self.mock_logger_instance.warning.assert_called_with(
+            "get_accounts pagination cursor did not advance."
+        )
+
     def test_get_accounts_no_client(self):
         """Test get_accounts returns None if the RESTClient is not initialized."""
         self.client.client = None  # Manually set client to None after initialization
@@ -234,7 +482,7 @@ class TestCoinbaseClient(unittest.TestCase):
             "Attempting to retrieve accounts."
         )
         self.mock_logger_instance.info.assert_called_with(
-            f"Successfully retrieved {len(mock_accounts)} accounts."
+            "Successfully retrieved %d accounts.", len(mock_accounts)
         )
         self.mock_rest_client_instance.get_accounts.assert_called_once()
 
@@ -248,9 +496,7 @@ class TestCoinbaseClient(unittest.TestCase):
         expected_log_message = (
             f"An error occurred in get_accounts: {self.mock_http_error}"
         )
-        self.mock_logger_instance.error.assert_called_once_with(
-            expected_log_message, exc_info=True
-        )
+        self.mock_logger_instance.error.assert_called_once_with(expected_log_message)
 
         # Test RequestException
         self.mock_logger_instance.reset_mock()
@@ -262,8 +508,18 @@ class TestCoinbaseClient(unittest.TestCase):
         expected_log_message = (
             f"An error occurred in get_accounts: {self.mock_request_exception}"
         )
+        self.mock_logger_instance.error.assert_called_once_with(expected_log_message)
+
+    def test_get_accounts_malformed_response_items_not_dicts(self):
+        """Test get_accounts rejects a page whose accounts are not dictionaries."""
+        self.mock_rest_client_instance.get_accounts.return_value = {
+            "accounts": ["not_a_dict"]
+        }
+        result = self.client.get_accounts()
+        self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
-            expected_log_message, exc_info=True
+            "An error occurred in get_accounts: Each item in 'accounts' should be a dictionary.",
+            exc_info=True,
         )
 
     def test_get_accounts_malformed_response_not_dict(self):
@@ -272,7 +528,7 @@ class TestCoinbaseClient(unittest.TestCase):
         result = self.client.get_accounts()
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
-            "An error occurred in get_accounts: Response was not a dictionary. Response: not_a_dict"
+            "An error occurred in get_accounts: get_accounts response should be a dictionary."
         )
 
     def test_get_accounts_malformed_response_no_accounts_key(self):
@@ -282,7 +538,7 @@ class TestCoinbaseClient(unittest.TestCase):
         result = self.client.get_accounts()
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
-            f"An error occurred in get_accounts: 'accounts' key must be a list. Response: {response_dict}"
+            "An error occurred in get_accounts: 'accounts' key missing in response."
         )
 
     def test_get_accounts_malformed_response_accounts_not_list(self):
@@ -292,7 +548,7 @@ class TestCoinbaseClient(unittest.TestCase):
         result = self.client.get_accounts()
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
-            f"An error occurred in get_accounts: 'accounts' key must be a list. Response: {response_dict}"
+            "An error occurred in get_accounts: 'accounts' must be a list."
         )
 
     def test_get_accounts_invalid_json_response(self):
@@ -302,7 +558,7 @@ class TestCoinbaseClient(unittest.TestCase):
         result = self.client.get_accounts()
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
-            f"An error occurred in get_accounts: Response was not a dictionary. Response: {invalid_json_string}"
+            "An error occurred in get_accounts: get_accounts response should be a dictionary."
         )
 
     # --- Test get_public_candles ---
@@ -353,7 +609,7 @@ class TestCoinbaseClient(unittest.TestCase):
             granularity="ONE_HOUR",
         )
         self.mock_logger_instance.info.assert_called_with(
-            "Successfully retrieved 1 candles for BTC-USD."
+            "Successfully retrieved %d candles for %s.", 1, "BTC-USD"
         )
 
     def test_get_public_candles_error_handling(self):
@@ -388,8 +644,7 @@ class TestCoinbaseClient(unittest.TestCase):
         )
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
-            "An error occurred in get_public_candles for BTC-USD: 'candles' key must be a list.",
-            exc_info=True,
+            "An error occurred in get_public_candles for BTC-USD: 'candles' must be a list.",
         )
 
     def test_get_public_candles_unsupported_granularity(self):
@@ -400,11 +655,25 @@ class TestCoinbaseClient(unittest.TestCase):
         )
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
-            "Unsupported granularity: INVALID_GRANULARITY"
+            "Unsupported granularity: %s", "INVALID_GRANULARITY"
         )
 
     # --- Test get_product ---
 
+    def test_get_public_candles_unsupported_granularity_with_window(self):
+        """Test an unknown granularity is rejected even with an explicit window."""
+        result = self.client.get_public_candles(
+            product_id="BTC-USD",
+            granularity="FORTNIGHT",
+            start="1672531200",
+            end="1672534800",
+        )
+        self.assertIsNone(result)
+        self.mock_rest_client_instance.get_public_candles.assert_not_called()
+        self.mock_logger_instance.error.assert_called_once_with(
+            "Unsupported granularity: %s", "FORTNIGHT"
+        )
+
     def test_get_product_no_client(self):
         """Test get_product returns None if the RESTClient is not initialized."""
         self.mock_logger_instance.reset_mock()
@@ -437,17 +706,15 @@ class TestCoinbaseClient(unittest.TestCase):
         # Ensure no retries were attempted for an unexpected error
         self.assertEqual(self.mock_rest_client_instance.get_product.call_count, 1)
 
-    @patch("trading.coinbase_client.time.sleep", return_value=None)
-    def test_get_product_error_handling_retry(self, mock_sleep):
-        """Test error handling and retry logic in get_product."""
+    def test_get_product_non_retryable_http_error(self):
+        """Test an HTTP error without a retryable status is not retried."""
         self.mock_rest_client_instance.get_product.side_effect = HTTPError("API Error")
 
         result = self.client.get_product(product_id="BTC-USD")
 
         self.assertIsNone(result)
-        self.assertEqual(self.mock_rest_client_instance.get_product.call_count, 3)
-        self.assertEqual(mock_sleep.call_count, 2)
-        self.mock_logger_instance.warning.assert_called()
+        self.assertEqual(self.mock_rest_client_instance.get_product.call_count, 1)
+        self.mock_sleep.assert_not_called()
         self.mock_logger_instance.error.assert_called_once()
 
     def test_limit_order_no_client(self):
@@ -490,7 +757,7 @@ class TestCoinbaseClient(unittest.TestCase):
         """Test successful placement of a limit order."""
         # Arrange
         mock_response = {"success": True, "order_id": "order-123"}
-        self.mock_rest_client_instance.limit_order.return_value = mock_response
+        self.mock_rest_client_instance.create_order.return_value = mock_response
 
         expected_order_config = {
             "limit_limit_gtc": {
@@ -508,42 +775,21 @@ class TestCoinbaseClient(unittest.TestCase):
         # Assert
         self.assertEqual(response, mock_response)
         self.mock_logger_instance.info.assert_called_with(
-            "Successfully placed buy order for BTC-USD. Order ID: order-123"
+            "Successfully placed %s order for %s. Order ID: %s",
+            "buy",
+            "BTC-USD",
+            "order-123",
         )
-        self.mock_rest_client_instance.limit_order.assert_called_once_with(
+        self.mock_rest_client_instance.create_order.assert_called_once_with(
             side="BUY",
             product_id="BTC-USD",
             client_order_id=ANY,
             order_configuration=expected_order_config,
         )
 
-    def test_get_product_zero_base_delay(self):
-        """Test get_product with zero base_delay, expecting an AssertionError."""
-        with self.assertRaises(AssertionError) as cm:
-            self.client.get_product(product_id="BTC-USD", base_delay=0)
-        self.assertEqual(str(cm.exception), "base_delay must be positive.")
-
-    def test_get_product_one_retry(self):
-        """Test get_product with max_retries=1 to ensure it's a valid case."""
-        mock_response = {"product_id": "BTC-USD", "price": "50000"}
-        self.mock_rest_client_instance.get_product.return_value = mock_response
-
-        response = self.client.get_product(product_id="BTC-USD", max_retries=1)
-
-        self.assertEqual(response, mock_response)
-        self.mock_rest_client_instance.get_product.assert_called_once_with(
-            product_id="BTC-USD"
-        )
-
-    def test_get_product_zero_retries(self):
-        """Test get_product with zero max_retries, expecting an AssertionError."""
-        with self.assertRaises(AssertionError) as cm:
-            self.client.get_product(product_id="BTC-USD", max_retries=0)
-        self.assertEqual(str(cm.exception), "max_retries must be positive.")
-
     def test_limit_order_failure(self):
         """Test failed placement of a limit order with failure_reason."""
-        self.mock_rest_client_instance.limit_order.return_value = {
+        self.mock_rest_client_instance.create_order.return_value = {
             "success": False,
             "failure_reason": "INSUFFICIENT_FUNDS",
         }
@@ -554,12 +800,15 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertFalse(response["success"])
         self.assertEqual(response["failure_reason"], "INSUFFICIENT_FUNDS")
         self.mock_logger_instance.error.assert_called_with(
-            "Failed to place buy order for BTC-USD. Reason: INSUFFICIENT_FUNDS"
+            "Failed to place %s order for %s. Reason: %s",
+            "buy",
+            "BTC-USD",
+            "INSUFFICIENT_FUNDS",
         )
 
     def test_limit_order_failure_with_error_response(self):
         """Test order failure with a detailed error_response."""
-        self.mock_rest_client_instance.limit_order.return_value = {
+        self.mock_rest_client_instance.create_order.return_value = {
             "success": False,
             "error_response": {"message": "Insufficient funds"},
         }
@@ -569,19 +818,25 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNotNone(response)
         self.assertFalse(response["success"])
         self.mock_logger_instance.error.assert_called_with(
-            "Failed to place buy order for BTC-USD. Reason: Insufficient funds"
+            "Failed to place %s order for %s. Reason: %s",
+            "buy",
+            "BTC-USD",
+            "Insufficient funds",
         )
 
     def test_limit_order_failure_unknown_error(self):
         """Test order failure with no specific reason given."""
-        self.mock_rest_client_instance.limit_order.return_value = {"success": False}
+        self.mock_rest_client_instance.create_order.return_value = {"success": False}
         response = self.client.limit_order(
             side="BUY", product_id="BTC-USD", base_size="1", limit_price="10000"
         )
         self.assertIsNotNone(response)
         self.assertFalse(response["success"])
         self.mock_logger_instance.error.assert_called_with(
-            "Failed to place buy order for BTC-USD. Reason: Unknown reason"
+            "Failed to place %s order for %s. Reason: %s",
+            "buy",
+            "BTC-USD",
+            "Unknown reason",
         )
 
         # ... rest of the code remains the same ...
@@ -592,7 +847,6 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
             f"An error occurred in get_order for {order_id}: get_order response should be a dictionary.",
-            exc_info=True,
         )
 
     def test_get_order_malformed_response_no_order_key(self):
@@ -603,7 +857,6 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
             f"An error occurred in get_order for {order_id}: 'order' key missing in response.",
-            exc_info=True,
         )
 
     def test_get_order_malformed_response_order_not_dict(self):
@@ -614,7 +867,6 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
             f"An error occurred in get_order for {order_id}: 'order' must be a dictionary.",
-            exc_info=True,
         )
 
     # --- Test cancel_orders ---
@@ -631,12 +883,19 @@ class TestCoinbaseClient(unittest.TestCase):
         )
 
     def test_cancel_orders_empty_order_ids(self):
-        """Test cancel_orders with an empty order_ids list."""
-        order_ids = []
-        result = self.client.cancel_orders(order_ids)
+        """Test cancel_orders returns an empty result without calling the API."""
+        result = self.client.cancel_orders([])
+        self.assertEqual(result, [])
+        self.mock_rest_client_instance.cancel_orders.assert_not_called()
+        self.mock_logger_instance.error.assert_not_called()
+
+    def test_cancel_orders_not_a_list(self):
+        """Test cancel_orders rejects order_ids that are not a list."""
+        result = self.client.cancel_orders("order-123")
         self.assertIsNone(result)
-        self.mock_logger_instance.error.assert_called_with(
-            "An error occurred in cancel_orders for []: order_ids must be a non-empty list.",
+        self.mock_rest_client_instance.cancel_orders.assert_not_called()
+        self.mock_logger_instance.error.assert_called_once_with(
+            "An error occurred in cancel_orders for order-123: order_ids must be a list.",
             exc_info=True,
         )
 
@@ -659,14 +918,70 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertTrue(result[0]["success"])
 
-        # Check for both the overall success message and the individual success message
         self.mock_logger_instance.info.assert_any_call(
-            f"Successfully processed cancel orders request for {order_ids}."
+            "Cancelled %d of %d order(s): %s", 1, 1, ["order-123"]
+        )
+        self.mock_logger_instance.error.assert_not_called()
+
+    def test_cancel_orders_deduplicates_ids(self):
+        """Test duplicate order IDs are sent only once, preserving order."""
+        self.mock_rest_client_instance.cancel_orders.return_value = {"results": []}
+
+        self.client.cancel_orders(order_ids=["b", "a", "b", "a", "c"])
+
+        self.mock_rest_client_instance.cancel_orders.assert_called_once_with(
+            order_ids=["b", "a", "c"]
+        )
+
+    def test_cancel_orders_splits_large_batches(self):
+        """Test more IDs than the batch limit are split and results merged."""
+        order_ids = [f"order-{i}" for i in range(250)]
+
+        def fake_cancel(order_ids):
+            return {"results": [{"success": True, "order_id": o} for o in order_ids]}
+
+        self.mock_rest_client_instance.cancel_orders.side_effect = fake_cancel
+
+        result = self.client.cancel_orders(order_ids=order_ids)
+
+        sent = [
+            c.kwargs["order_ids"]
+            for c in self.mock_rest_client_instance.cancel_orders.call_args_list
+        ]
+        # Three chunks are needed; they are balanced rather than 100/100/50.
+        self.assertEqual(sorted(len(chunk) for chunk in sent), [82, 84, 84])
+        self.assertEqual([r["order_id"] for r in result], order_ids)
+
+    def test_cancel_orders_keeps_results_of_chunks_that_succeeded(self):
+        """Test one failed chunk does not discard the other chunk's results."""
+        order_ids = [f"order-{i}" for i in range(150)]
+
+        def fake_cancel(order_ids):
+            if "order-0" in order_ids:
+                raise self.mock_http_error
+            return {"results": [{"success": True, "order_id": o} for o in order_ids]}
+
+        self.mock_rest_client_instance.cancel_orders.side_effect = fake_cancel
+
+        result = self.client.cancel_orders(order_ids=order_ids)
+
+        self.assertEqual([r["order_id"] for r in result], order_ids)
+        self.assertEqual([r["success"] for r in result], [False] * 75 + [True] * 75)
+        self.assertEqual(
+            result[0]["failure_reason"], coinbase_client.CANCEL_REQUEST_FAILED
         )
         self.mock_logger_instance.info.assert_any_call(
-            "Successfully cancelled order order-123."
+            "Cancelled %d of %d order(s): %s", 75, 150, order_ids[75:]
         )
 
+    def test_cancel_orders_returns_none_when_every_chunk_fails(self):
+        """Test a call whose requests all fail reports failure as before."""
+        self.mock_rest_client_instance.cancel_orders.side_effect = self.mock_http_error
+
+        result = self.client.cancel_orders([f"order-{i}" for i in range(150)])
+
+        self.assertIsNone(result)
+
     def test_cancel_orders_error_handling(self):
         """Test all error handling for cancel_orders."""
         order_ids = ["some-order-id"]
@@ -676,7 +991,6 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
             f"An error occurred in cancel_orders for {order_ids}: {self.mock_http_error}",
-            exc_info=True,
         )
 
         # Test RequestException
@@ -687,7 +1001,6 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
             f"An error occurred in cancel_orders for {order_ids}: {self.mock_request_exception}",
-            exc_info=True,
         )
 
         # Test Unexpected Error
@@ -707,7 +1020,6 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
             f"An error occurred in cancel_orders for {order_ids}: cancel_orders response should be a dictionary.",
-            exc_info=True,
         )
 
     def test_cancel_orders_malformed_response_no_results_key(self):
@@ -718,7 +1030,6 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
             f"An error occurred in cancel_orders for {order_ids}: 'results' key missing in response.",
-            exc_info=True,
         )
 
     def test_cancel_orders_malformed_response_results_not_list(self):
@@ -730,20 +1041,18 @@ class TestCoinbaseClient(unittest.TestCase):
         result = self.client.cancel_orders(order_ids)
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
-            f"An error occurred in cancel_orders for {order_ids}: 'results' key should be a list.",
-            exc_info=True,
+            f"An error occurred in cancel_orders for {order_ids}: 'results' must be a list.",
         )
 
     def test_limit_order_malformed_response_not_dict(self):
         """Test limit_order handles a response that is not a dictionary."""
-        self.mock_rest_client_instance.limit_order.return_value = "not_a_dict"
+        self.mock_rest_client_instance.create_order.return_value = "not_a_dict"
         result = self.client.limit_order(
             side="BUY", product_id="BTC-USD", base_size="1", limit_price="10000"
         )
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_with(
             "An error occurred in limit_order for BTC-USD: limit_order response should be a dictionary.",
-            exc_info=True,
         )
 
     def test_cancel_orders_failure_with_error_response(self):
@@ -760,7 +1069,7 @@ class TestCoinbaseClient(unittest.TestCase):
         self.mock_rest_client_instance.cancel_orders.return_value = response_data
         self.client.cancel_orders(order_ids=["order-456"])
         self.mock_logger_instance.error.assert_called_with(
-            "Failed to cancel order order-456. Reason: Insufficient funds"
+            "Failed to cancel %d order(s): %s", 1, "order-456 (Insufficient funds)"
         )
 
     def test_cancel_orders_failure_with_failure_reason(self):
@@ -777,7 +1086,7 @@ class TestCoinbaseClient(unittest.TestCase):
         self.mock_rest_client_instance.cancel_orders.return_value = response_data
         self.client.cancel_orders(order_ids=["order-456"])
         self.mock_logger_instance.error.assert_called_with(
-            "Failed to cancel order order-456. Reason: Order not found"
+            "Failed to cancel %d order(s): %s", 1, "order-456 (Order not found)"
         )
 
     def test_cancel_orders_failure_unknown_reason(self):
@@ -786,7 +1095,29 @@ class TestCoinbaseClient(unittest.TestCase):
         self.mock_rest_client_instance.cancel_orders.return_value = response_data
         self.client.cancel_orders(order_ids=["order-456"])
         self.mock_logger_instance.error.assert_called_with(
-            "Failed to cancel order order-456. Reason: Unknown reason"
+            "Failed to cancel %d order(s): %s", 1, "order-456 (Unknown reason)"
+        )
+
+    def test_cancel_orders_logs_all_failures_once(self):
+        """Test failures across chunks are reported in a single error line."""
+
+        def fake_cancel(order_ids):
+            return {
+                "results": [
+                    {"success": False, "order_id": o, "failure_reason": "GONE"}
+                    for o in order_ids
+                ]
+            }
+
+        self.mock_rest_client_instance.cancel_orders.side_effect = fake_cancel
+        order_ids = [f"o{i}" for i in range(150)]
+
+        self.client.cancel_orders(order_ids)
+
+        self.mock_logger_instance.error.assert_called_once_with(
+            "Failed to cancel %d order(s): %s",
+            150,
+            ", ".join(f"{o} (GONE)" for o in order_ids),
         )
 
     def test_cancel_orders_malformed_response_results_item_not_dict(self):
@@ -1005,6 +1336,160 @@ class TestCoinbaseClient(unittest.TestCase):
             self.assertEqual(int(kwargs.get("end")), expected_end_ts)
             self.assertEqual(int(kwargs.get("start")), expected_start_ts)
 
+    def test_iter_public_candles_pages_window_oldest_first(self):
+        """Test a long window is fetched page by page and yielded in order."""
+        hour = 3600
+        page = hour * coinbase_client.CANDLES_PAGE_SIZE
+        start = 1_700_000_000
+
+        def fake_candles(product_id, start, end, granularity):
+            # Newest-first, inclusive of both ends like the real API.
+            return {
+                "candles": [
+                    {"start": str(ts)} for ts in range(int(end), int(start) - 1, -hour)
+                ]
+            }
+
+        self.mock_rest_client_instance.get_public_candles.side_effect = fake_candles
+
+        candles = list(
+            self.client.iter_public_candles(
+                "BTC-USD", "ONE_HOUR", start, start + 2 * page + 10 * hour
+            )
+        )
+
+        starts = [int(c["start"]) for c in candles]
+        self.assertEqual(starts, list(range(start, start + 2 * page + 11 * hour, hour)))
+        windows = [
+            (c.kwargs["start"], c.kwargs["end"])
+            for c in self.mock_rest_client_instance.get_public_candles.call_args_list
+        ]
+        self.assertEqual(
+            windows,
+            [
+                (str(start), str(start + page)),
+                (str(start + page), str(start + 2 * page)),
+                (str(start + 2 * page), str(start + 2 * page + 10 * hour)),
+            ],
+        )
+
+    def test_iter_public_candles_bypasses_candle_cache(self):
+        """Test paged history is not kept in, or served from, the candle cache."""
+        self.mock_rest_client_instance.get_public_candles.return_value = {
+            "candles": [{"start": "1700000000"}]
+        }
+        start = 1_700_000_000
+        end = start + 2 * 3600 * coinbase_client.CANDLES_PAGE_SIZE
+
+        list(self.client.iter_public_candles("BTC-USD", "ONE_HOUR", start, end))
+        list(self.client.iter_public_candles("BTC-USD", "ONE_HOUR", start, end))
+
+        self.assertEqual(len(self.client._candles_caches["ONE_HOUR"]), 0)
+        self.assertEqual(
+            self.mock_rest_client_instance.get_public_candles.call_count, 4
+        )
+
+    def test_iter_public_candles_stops_on_failed_page(self):
+        """Test iteration ends with a warning when a page cannot be fetched."""
+        self.mock_rest_client_instance.get_public_candles.return_value = "bad"
+
+        candles = list(
+            self.client.iter_public_candles("BTC-USD", "ONE_HOUR", 1_700_000_000)
+        )
+
+        self.assertEqual(candles, [])
+        self.mock_logger_instance.warning.assert_called_once_with(
+            "Stopped iterating candles for %s at %d.", "BTC-USD", 1_700_000_000
+        )
+
+    def test_get_public_candles_np_returns_structured_array(self):
+        """Test candles are converted into contiguous typed columns."""
+        self.mock_rest_client_instance.get_public_candles.return_value = {
+            "candles": [
+                {
+                    "start": "1700000000",
+                    "low": "99.5",
+                    "high": "101",
+                    "open": "100",
+                    "close": "100.5",
+                    "volume": "12.25",
+                },
+                {
+                    "start": "1700000060",
+                    "low": "100",
+                    "high": "102",
+                    "open": "100.5",
+                    "close": "101.5",
+                    "volume": "3",
+                },
+            ]
+        }
+
+        result = self.client.get_public_candles_np("BTC-USD", "ONE_MINUTE")
+
+        self.assertEqual(result.dtype, coinbase_client.CANDLE_DTYPE)
+        self.assertEqual(result["start"].tolist(), [1700000000, 1700000060])
+        self.assertEqual(result["close"].tolist(), [100.5, 101.5])
+        self.assertEqual(result["volume"].tolist(), [12.25, 3.0])
+
+    def test_get_public_candles_columns_are_contiguous(self):
+        """Test each candle field is returned as its own contiguous array."""
+        self.mock_rest_client_instance.get_public_candles.return_value = {
+            "candles": [
+                {
+                    "start": "1700000000",
+                    "low": "99.5",
+                    "high": "101",
+                    "open": "100",
+                    "close": "100.5",
+                    "volume": "12.25",
+                },
+                {
+                    "start": "1700000060",
+                    "low": "100",
+                    "high": "102",
+                    "open": "100.5",
+                    "close": "101.5",
+                    "volume": "3",
+                },
+            ]
+        }
+
+        columns = self.client.get_public_candles_columns("BTC-USD", "ONE_MINUTE")
+
+        self.assertEqual(set(columns), set(coinbase_client.CANDLE_DTYPE.names))
+        self.assertEqual(columns["close"].tolist(), [100.5, 101.5])
+        self.assertEqual(columns["start"].dtype, "int64")
+        for column in columns.values():
+            self.assertTrue(column.flags["C_CONTIGUOUS"])
+
+    def test_get_public_candles_columns_propagates_failure(self):
+        """Test None is returned when the candles cannot be fetched."""
+        self.mock_rest_client_instance.get_public_candles.return_value = "bad"
+
+        self.assertIsNone(
+            self.client.get_public_candles_columns("BTC-USD", "ONE_MINUTE")
+        )
+
+    def test_get_public_candles_np_malformed_candle(self):
+        """Test a candle missing a field is logged and yields None."""
+        self.mock_rest_client_instance.get_public_candles.return_value = {
+            "candles": [{"start": "1700000000", "close": "100"}]
+        }
+
+        result = self.client.get_public_candles_np("BTC-USD", "ONE_MINUTE")
+
+        self.assertIsNone(result)
+        self.mock_logger_instance.error.assert_called_once_with(
+            "An error occurred in get_public_candles_np for BTC-USD: 'low'",
+        )
+
+    def test_get_public_candles_np_propagates_failure(self):
+        """Test None is returned when the underlying fetch fails."""
+        self.mock_rest_client_instance.get_public_candles.return_value = "bad"
+
+        self.assertIsNone(self.client.get_public_candles_np("BTC-USD", "ONE_MINUTE"))
+
     def test_get_public_candles_response_not_a_dict(self):
         """Test get_public_candles when the API response is not a dictionary."""
         self.mock_rest_client_instance.get_public_candles.return_value = "not a dict"
@@ -1018,8 +1503,7 @@ class TestCoinbaseClient(unittest.TestCase):
 
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
-            "An error occurred in get_public_candles for BTC-USD: Response was not a dictionary.",
-            exc_info=True,
+            "An error occurred in get_public_candles for BTC-USD: get_public_candles response should be a dictionary.",
         )
 
     def test_get_product_book_no_client(self):
@@ -1048,7 +1532,6 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
             "An error occurred in get_product_book for BTC-USD: get_product_book response should be a dictionary.",
-            exc_info=True,
         )
 
     def test_get_product_book_success(self):
@@ -1064,9 +1547,37 @@ class TestCoinbaseClient(unittest.TestCase):
             product_id="BTC-USD", limit=None
         )
         self.mock_logger_instance.info.assert_called_with(
-            "Successfully retrieved order book for BTC-USD."
+            "Successfully retrieved order book for %s.", "BTC-USD"
         )
 
+    def test_get_product_book_served_from_cache_within_ttl(self):
+        """Test a repeated book request for the same depth skips the API."""
+        pricebook = {"bids": [["100", "10"]], "asks": [["101", "10"]]}
+        self.mock_rest_client_instance.get_product_book.return_value = {
+            "pricebook": pricebook
+        }
+
+        first = self.client.get_product_book("BTC-USD", limit=10)
+        second = self.client.get_product_book("BTC-USD", limit=10)
+        self.client.get_product_book("BTC-USD", limit=50)
+
+        self.assertEqual(first, pricebook)
+        self.assertIs(second, first)
+        self.assertEqual(self.mock_rest_client_instance.get_product_book.call_count, 2)
+
+    def test_get_product_book_cache_disabled_with_zero_ttl(self):
+        """Test a zero ORDER_BOOK_CACHE_TTL_SECONDS fetches the book every time."""
+        self.mock_config_module.ORDER_BOOK_CACHE_TTL_SECONDS = 0.0
+        client = CoinbaseClient()
+        self.mock_rest_client_instance.get_product_book.return_value = {
+            "pricebook": {"bids": [], "asks": []}
+        }
+
+        client.get_product_book("BTC-USD")
+        client.get_product_book("BTC-USD")
+
+        self.assertEqual(self.mock_rest_client_instance.get_product_book.call_count, 2)
+
     def test_get_product_book_missing_pricebook_key(self):
         """Test get_product_book when 'pricebook' key is missing in the response."""
         mock_response = {"not_pricebook": {}}
@@ -1077,7 +1588,19 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
             "An error occurred in get_product_book for BTC-USD: 'pricebook' key missing in response.",
-            exc_info=True,
+        )
+
+    def test_get_product_book_pricebook_is_none(self):
+        """Test get_product_book treats a null 'pricebook' as a missing key."""
+        self.mock_rest_client_instance.get_product_book.return_value = {
+            "pricebook": None
+        }
+
+        result = self.client.get_product_book(product_id="BTC-USD")
+
+        self.assertIsNone(result)
+        self.mock_logger_instance.error.assert_called_once_with(
+            "An error occurred in get_product_book for BTC-USD: 'pricebook' key missing in response.",
         )
 
     def test_get_product_book_pricebook_not_a_dict(self):
@@ -1090,7 +1613,6 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_called_once_with(
             "An error occurred in get_product_book for BTC-USD: 'pricebook' must be a dictionary.",
-            exc_info=True,
         )
 
     # --- Test get_product ---
@@ -1108,15 +1630,15 @@ class TestCoinbaseClient(unittest.TestCase):
             product_id="BTC-USD"
         )
         self.mock_logger_instance.info.assert_called_once_with(
-            "Successfully retrieved product BTC-USD."
+            "Successfully retrieved product %s.", "BTC-USD"
         )
 
-    @patch("trading.coinbase_client.time.sleep")
-    def test_get_product_retry_logic(self, mock_sleep):
-        """Test the retry logic in get_product, including the sleep delay."""
+    @patch("trading.coinbase_client.random.uniform", return_value=0.0)
+    def test_get_product_retry_logic(self, _):
+        """Test a transient 5xx error is retried after a backoff delay."""
         mock_success_response = {"product_id": "BTC-USD", "price": "50000"}
         self.mock_rest_client_instance.get_product.side_effect = [
-            self.mock_http_error,
+            self.mock_server_error,
             mock_success_response,
         ]
 
@@ -1124,39 +1646,78 @@ class TestCoinbaseClient(unittest.TestCase):
 
         self.assertEqual(result, mock_success_response)
         self.assertEqual(self.mock_rest_client_instance.get_product.call_count, 2)
-        mock_sleep.assert_called_once_with(1)
+        self.mock_sleep.assert_called_once_with(0.5)
         self.mock_logger_instance.warning.assert_called_with(
-            f"Attempt 1 of 3 failed for get_product(BTC-USD). Error: {self.mock_http_error}"
+            "Attempt %d of %d failed: %s. Retrying in %.2fs.",
+            1,
+            6,
+            self.mock_server_error,
+            0.5,
         )
 
-    @patch("trading.coinbase_client.time.sleep")
-    def test_get_product_all_retries_fail(self, mock_sleep):
-        """Test get_product when all retry attempts fail."""
-        self.mock_rest_client_instance.get_product.side_effect = self.mock_http_error
+    @patch("trading.coinbase_client.random.uniform", return_value=0.0)
+    def test_get_product_all_retries_fail(self, _):
+        """Test get_product backs off exponentially and gives up after retries."""
+        self.mock_rest_client_instance.get_product.side_effect = self.mock_server_error
 
         result = self.client.get_product(product_id="BTC-USD")
 
         self.assertIsNone(result)
-        self.assertEqual(self.mock_rest_client_instance.get_product.call_count, 3)
-        mock_sleep.assert_has_calls([call(1), call(2)], any_order=False)
-
-        # Check warning log
-        expected_warning_calls = [
-            call(
-                f"Attempt 1 of 3 failed for get_product(BTC-USD). Error: {self.mock_http_error}"
-            ),
-            call(
-                f"Attempt 2 of 3 failed for get_product(BTC-USD). Error: {self.mock_http_error}"
-            ),
-        ]
-        self.mock_logger_instance.warning.assert_has_calls(
-            expected_warning_calls, any_order=False
+        self.assertEqual(self.mock_rest_client_instance.get_product.call_count, 6)
+        self.assertEqual(
+            self.mock_sleep.call_args_list,
+            [call(0.5), call(1.0), call(2.0), call(4.0), call(8.0)],
         )
-
-        # Check final error log
         self.mock_logger_instance.error.assert_called_once_with(
-            f"An error occurred in get_product for BTC-USD: {self.mock_http_error}",
-            exc_info=True,
+            f"An error occurred in get_product for BTC-USD: {self.mock_server_error}",
+        )
+
+    def test_call_with_retry_caps_delay_and_adds_jitter(self):
+        """Test the backoff delay is capped and jitter is added on top."""
+        fn = MagicMock(side_effect=[self.mock_request_exception, "ok"])
+        with patch(
+            "trading.coinbase_client.random.uniform", return_value=0.25
+        ) as mock_uniform:
+            result = self.client._call_with_retry(fn, base=0.5, cap=0.1)
+
+        self.assertEqual(result, "ok")
+        mock_uniform.assert_called_once_with(0, 0.5)
+        self.mock_sleep.assert_called_once_with(0.35)
+
+    @patch("trading.coinbase_client.random.uniform", return_value=0.0)
+    def test_call_with_retry_honors_retry_after(self, _):
+        """Test a Retry-After header lengthens the delay, bounded by the cap."""
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "3"
+        error = HTTPError("Too Many Requests", response=response)
+
+        fn = MagicMock(side_effect=[error, "ok"])
+        self.assertEqual(self.client._call_with_retry(fn, base=0.5), "ok")
+        self.mock_sleep.assert_called_once_with(3.0)
+
+        self.mock_sleep.reset_mock()
+        fn = MagicMock(side_effect=[error, "ok"])
+        self.assertEqual(self.client._call_with_retry(fn, base=0.5, cap=2.0), "ok")
+        self.mock_sleep.assert_called_once_with(2.0)
+
+    def test_retry_after_seconds_parsing(self):
+        """Test Retry-After is parsed from seconds or an HTTP-date."""
+        response = requests.Response()
+        error = HTTPError("Too Many Requests", response=response)
+        self.assertIsNone(coinbase_client._retry_after_seconds(error))
+
+        response.headers["Retry-After"] = "1.5"
+        self.assertEqual(coinbase_client._retry_after_seconds(error), 1.5)
+
+        response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+        self.assertEqual(coinbase_client._retry_after_seconds(error), 0.0)
+
+        response.headers["Retry-After"] = "soon"
+        self.assertIsNone(coinbase_client._retry_after_seconds(error))
+
+        self.assertIsNone(
+            coinbase_client._retry_after_seconds(HTTPError("no response"))
         )
 
     def test_get_product_empty_product_id(self):
@@ -1178,14 +1739,75 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_logger_instance.error.assert_any_call(
             "An error occurred in get_product for BTC-USD: get_product response should be a dictionary.",
-            exc_info=True,
+        )
+
+    def test_get_product_strips_rate_limit_fields(self):
+        """Test the SDK's rate-limit fields are not returned or cached."""
+        self.mock_rest_client_instance.get_product.return_value = {
+            "product_id": "BTC-USD",
+            "price": "50000",
+            "rate_limit_limit": "30",
+            "rate_limit_remaining": "29",
+            "rate_limit_reset": "1",
+        }
+
+        result = self.client.get_product("BTC-USD")
+
+        self.assertEqual(result, {"product_id": "BTC-USD", "price": "50000"})
+        self.assertEqual(self.client._product_cache.get("BTC-USD"), result)
+
+    def test_get_products_warms_product_cache(self):
+        """Test get_products keys results by id and serves later get_product calls."""
+        btc = {"product_id": "BTC-USD", "price": "50000"}
+        eth = {"product_id": "ETH-USD", "price": "3000"}
+        self.mock_rest_client_instance.get_products.return_value = {
+            "products": [btc, eth],
+            "num_products": 2,
+        }
+
+        result = self.client.get_products(["BTC-USD", "ETH-USD"])
+
+        self.assertEqual(result, {"BTC-USD": btc, "ETH-USD": eth})
+        self.mock_rest_client_instance.get_products.assert_called_once_with(
+            product_ids=["BTC-USD", "ETH-USD"]
+        )
+        self.assertEqual(self.client.get_product("ETH-USD"), eth)
+        self.mock_rest_client_instance.get_product.assert_not_called()
+
+    def test_get_products_requests_only_uncached_ids(self):
+        """Test fresh cached products are reused and only misses are fetched."""
+        btc = {"product_id": "BTC-USD", "price": "50000"}
+        eth = {"product_id": "ETH-USD", "price": "3000"}
+        self.client._product_cache.set("BTC-USD", btc)
+        self.mock_rest_client_instance.get_products.return_value = {"products": [eth]}
+
+        result = self.client.get_products(["BTC-USD", "ETH-USD", "ETH-USD"])
+
+        self.assertEqual(result, {"BTC-USD": btc, "ETH-USD": eth})
+        self.mock_rest_client_instance.get_products.assert_called_once_with(
+            product_ids=["ETH-USD"]
+        )
+
+        self.mock_rest_client_instance.get_products.reset_mock()
+        self.assertEqual(self.client.get_products(["ETH-USD"]), {"ETH-USD": eth})
+        self.mock_rest_client_instance.get_products.assert_not_called()
+
+    def test_get_products_missing_products_key(self):
+        """Test get_products logs and returns None if 'products' is missing."""
+        self.mock_rest_client_instance.get_products.return_value = {}
+
+        result = self.client.get_products(["BTC-USD"])
+
+        self.assertIsNone(result)
+        self.mock_logger_instance.error.assert_called_once_with(
+            "An error occurred in get_products for ['BTC-USD']: 'products' key missing in response."
         )
 
     def test_limit_order_buy_with_client_order_id(self):
         """Test limit_order_buy with a provided client_order_id."""
         custom_order_id = "my-custom-buy-order-id-123"
         mock_response = {"success": True, "order_id": "12345"}
-        self.mock_rest_client_instance.limit_order.return_value = mock_response
+        self.mock_rest_client_instance.create_order.return_value = mock_response
 
         result = self.client.limit_order_buy(
             product_id="BTC-USD",
@@ -1195,7 +1817,7 @@ class TestCoinbaseClient(unittest.TestCase):
         )
 
         self.assertEqual(result, mock_response)
-        self.mock_rest_client_instance.limit_order.assert_called_once_with(
+        self.mock_rest_client_instance.create_order.assert_called_once_with(
             side="BUY",
             client_order_id=custom_order_id,
             product_id="BTC-USD",
@@ -1212,7 +1834,7 @@ class TestCoinbaseClient(unittest.TestCase):
         """Test limit_order_sell with a provided client_order_id."""
         custom_order_id = "my-custom-sell-order-id-456"
         mock_response = {"success": True, "order_id": "67890"}
-        self.mock_rest_client_instance.limit_order.return_value = mock_response
+        self.mock_rest_client_instance.create_order.return_value = mock_response
 
         result = self.client.limit_order_sell(
             product_id="BTC-USD",
@@ -1222,7 +1844,7 @@ class TestCoinbaseClient(unittest.TestCase):
         )
 
         self.assertEqual(result, mock_response)
-        self.mock_rest_client_instance.limit_order.assert_called_once_with(
+        self.mock_rest_client_instance.create_order.assert_called_once_with(
             side="SELL",
             client_order_id=custom_order_id,
             product_id="BTC-USD",
@@ -1235,10 +1857,51 @@ class TestCoinbaseClient(unittest.TestCase):
             },
         )
 
+    def test_limit_order_rejects_invalid_amounts(self):
+        """Test non-positive or non-decimal sizes and prices are never sent."""
+        cases = [
+            ("base_size", "0", "base_size must be positive, got '0'."),
+            ("base_size", 0.5, "base_size must be a string, got float."),
+            ("limit_price", "abc", "limit_price must be a decimal string, got 'abc'."),
+            ("limit_price", "NaN", "limit_price must be positive, got 'NaN'."),
+        ]
+        for field, value, message in cases:
+            with self.subTest(field=field, value=value):
+                self.mock_logger_instance.reset_mock()
+                kwargs = {"base_size": "0.01", "limit_price": "50000", field: value}
+
+                result = self.client.limit_order(
+                    side="BUY", product_id="BTC-USD", **kwargs
+                )
+
+                self.assertIsNone(result)
+                self.mock_logger_instance.error.assert_called_once_with(
+                    f"An error occurred in limit_order for BTC-USD: {message}"
+                )
+        self.mock_rest_client_instance.create_order.assert_not_called()
+
+    def test_limit_order_lowercase_side_is_canonicalized(self):
+        """Test lower- and mixed-case sides are sent to the API upper-cased."""
+        self.mock_rest_client_instance.create_order.return_value = {
+            "success": True,
+            "order_id": "12345",
+        }
+
+        for side, expected in (("buy", "BUY"), ("Sell", "SELL")):
+            self.client.limit_order(
+                side=side,
+                product_id="BTC-USD",
+                base_size="0.01",
+                limit_price="50000",
+                client_order_id="cid",
+            )
+            _args, call_kwargs = self.mock_rest_client_instance.create_order.call_args
+            self.assertEqual(call_kwargs["side"], expected)
+
     def test_limit_order_buy_generates_client_order_id(self):
         """Test limit_order_buy generates a client_order_id if not provided."""
         mock_response = {"success": True, "order_id": "12345"}
-        self.mock_rest_client_instance.limit_order.return_value = mock_response
+        self.mock_rest_client_instance.create_order.return_value = mock_response
 
         # Call without client_order_id
         self.client.limit_order_buy(
@@ -1248,7 +1911,7 @@ class TestCoinbaseClient(unittest.TestCase):
         )
 
         # Inspect the arguments it was called with
-        _args, call_kwargs = self.mock_rest_client_instance.limit_order.call_args
+        _args, call_kwargs = self.mock_rest_client_instance.create_order.call_args
 
         # Assert that a client_order_id was generated and is a valid UUID string
         generated_id = call_kwargs.get("client_order_id")
@@ -1309,21 +1972,6 @@ class TestCoinbaseClient(unittest.TestCase):
         _args, kwargs = self.mock_rest_client_instance.get_public_candles.call_args
         self.assertEqual(kwargs["end"], str(int(end_time.timestamp())))
 
-    @patch("trading.coinbase_client.time.sleep")
-    def test_get_product_retry_logic_backoff(self, mock_sleep):
-        """Test the retry logic for get_product includes exponential backoff."""
-        self.mock_rest_client_instance.get_product.side_effect = [
-            self.mock_http_error,
-            self.mock_http_error,
-            {"product_id": "BTC-USD", "price": "50000"},
-        ]
-
-        self.client.get_product("BTC-USD", max_retries=3, base_delay=1)
-
-        self.assertEqual(self.mock_rest_client_instance.get_product.call_count, 3)
-        self.assertEqual(mock_sleep.call_count, 2)
-        mock_sleep.assert_has_calls([call(1), call(2)])
-
     def test_cancel_orders_failure_logs_reason(self):
         """Test that cancel_orders logs the specific failure reason."""
         mock_response = {
@@ -1340,15 +1988,12 @@ class TestCoinbaseClient(unittest.TestCase):
         self.client.cancel_orders(["order-id-1"])
 
         self.mock_logger_instance.error.assert_called_once_with(
-            "Failed to cancel order order-id-1. Reason: ORDER_NOT_FOUND"
+            "Failed to cancel %d order(s): %s", 1, "order-id-1 (ORDER_NOT_FOUND)"
         )
 
-
     def test_get_public_candles_one_minute_granularity_start_time(self):
         """Test get_public_candles calculates the start time correctly for ONE_MINUTE granularity."""
-        self.mock_rest_client_instance.get_public_candles.return_value = {
-            "candles": []
-        }
+        self.mock_rest_client_instance.get_public_candles.return_value = {"candles": []}
 
         # Mock current time to have a predictable value
         mock_now = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -1371,6 +2016,392 @@ class TestCoinbaseClient(unittest.TestCase):
         self.assertEqual(kwargs.get("product_id"), "BTC-USD")
         self.assertEqual(kwargs.get("granularity"), "ONE_MINUTE")
 
+    # --- Test response caching ---
+
+    def test_get_product_served_from_cache(self):
+        """Test a second get_product call is served without hitting the API."""
+        mock_response = {"product_id": "BTC-USD", "price": "50000"}
+        self.mock_rest_client_instance.get_product.return_value = mock_response
+
+        first = self.client.get_product("BTC-USD")
+        second = self.client.get_product("BTC-USD")
+
+        self.assertEqual(first, mock_response)
+        self.assertIs(second, first)
+        self.mock_rest_client_instance.get_product.assert_called_once()
+
+    @patch("trading.cache.time.monotonic")
+    def test_get_public_candles_cached_for_one_candle_period(self, mock_monotonic):
+        """Test identical candle requests are cached for one granularity period."""
+        mock_monotonic.return_value = 1000.0
+        self.mock_rest_client_instance.get_public_candles.return_value = {
+            "candles": [{"start": "1", "close": "2"}]
+        }
+        window = {"start": "1700000000", "end": "1700003600"}
+
+        first = self.client.get_public_candles("BTC-USD", "ONE_MINUTE", **window)
+        mock_monotonic.return_value = 1059.0
+        second = self.client.get_public_candles("BTC-USD", "ONE_MINUTE", **window)
+        self.assertIs(second, first)
+        self.mock_rest_client_instance.get_public_candles.assert_called_once()
+
+        # A different granularity or window is a separate entry.
+        self.client.get_public_candles("BTC-USD", "ONE_HOUR", **window)
+        self.client.get_public_candles("ETH-USD", "ONE_MINUTE", **window)
+        self.assertEqual(
+            self.mock_rest_client_instance.get_public_candles.call_count, 3
+        )
+
+        mock_monotonic.return_value = 1060.0
+        self.client.get_public_candles("BTC-USD", "ONE_MINUTE", **window)
+        self.assertEqual(
+            self.mock_rest_client_instance.get_public_candles.call_count, 4
+        )
+
+    @patch("trading.cache.time.monotonic", return_value=1000.0)
+    def test_get_public_candles_open_window_cached_per_candle_period(
+        self, _mock_monotonic
+    ):
+        """Test polls without an end time share a cache entry per candle period."""
+        self.mock_rest_client_instance.get_public_candles.return_value = {"candles": []}
+        period_start = datetime(2023, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+        now = {"dt": period_start + timedelta(seconds=5)}
+
+        class MockDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls.fromtimestamp(now["dt"].timestamp(), tz=tz)
+
+        with patch("trading.coinbase_client.datetime", MockDatetime):
+            self.client.get_public_candles("BTC-USD", "ONE_MINUTE")
+            now["dt"] = period_start + timedelta(seconds=59)
+            self.client.get_public_candles("BTC-USD", "ONE_MINUTE")
+            self.mock_rest_client_instance.get_public_candles.assert_called_once()
+            self.mock_logger_instance.debug.assert_any_call(
+                "Candle cache hit for %s.", "BTC-USD"
+            )
+
+            # The next candle period is a new entry even though the TTL has not
+            # elapsed.
+            now["dt"] = period_start + timedelta(seconds=60)
+            self.client.get_public_candles("BTC-USD", "ONE_MINUTE")
+            self.assertEqual(
+                self.mock_rest_client_instance.get_public_candles.call_count, 2
+            )
+
+    @patch("trading.cache.time.monotonic")
+    def test_get_public_candles_open_window_sees_forming_candle_update(
+        self, mock_monotonic
+    ):
+        """Test a later poll in the same period gets the updated current candle."""
+        self.mock_rest_client_instance.get_public_candles.side_effect = [
+            {"candles": [{"start": "1700000000", "close": "100"}]},
+            {"candles": [{"start": "1700000000", "close": "105"}]},
+        ]
+        with patch("trading.coinbase_client.datetime") as mock_datetime:
+            mock_datetime.fromtimestamp = datetime.fromtimestamp
+            mock_datetime.now.return_value = datetime.fromtimestamp(
+                1_700_000_010, tz=timezone.utc
+            )
+            mock_monotonic.return_value = 1000.0
+            first = self.client.get_public_candles("BTC-USD", "ONE_HOUR")
+
+            # A later poll inside the same hour, once the short TTL has passed.
+            mock_datetime.now.return_value = datetime.fromtimestamp(
+                1_700_000_100, tz=timezone.utc
+            )
+            mock_monotonic.return_value = (
+                1000.0 + coinbase_client.OPEN_CANDLES_CACHE_TTL_SECONDS
+            )
+            second = self.client.get_public_candles("BTC-USD", "ONE_HOUR")
+
+        self.assertEqual(first[0]["close"], "100")
+        self.assertEqual(second[0]["close"], "105")
+
+    def test_invalidate_candles_forces_refetch(self):
+        """Test invalidate_candles drops every cached candle window."""
+        self.mock_rest_client_instance.get_public_candles.return_value = {"candles": []}
+        window = {"start": "1700000000", "end": "1700003600"}
+        self.client.get_public_candles("BTC-USD", "ONE_HOUR", **window)
+        self.client.invalidate_candles()
+        self.client.get_public_candles("BTC-USD", "ONE_HOUR", **window)
+
+        self.assertEqual(
+            self.mock_rest_client_instance.get_public_candles.call_count, 2
+        )
+
+    def test_invalidate_product_forces_refetch(self):
+        """Test invalidate_product drops the cached product details."""
+        self.mock_rest_client_instance.get_product.return_value = {
+            "product_id": "BTC-USD"
+        }
+        self.client.get_product("BTC-USD")
+        self.client.invalidate_product("BTC-USD")
+        self.client.get_product("BTC-USD")
+
+        self.assertEqual(self.mock_rest_client_instance.get_product.call_count, 2)
+
+    def test_get_product_returns_stale_value_on_failure(self):
+        """Test get_product falls back to the last cached value when the API fails."""
+        mock_response = {"product_id": "BTC-USD"}
+        self.mock_rest_client_instance.get_product.return_value = mock_response
+        self.client.get_product("BTC-USD")
+        self.client._product_cache.ttl = 0
+
+        self.mock_rest_client_instance.get_product.side_effect = Exception("boom")
+        result = self.client.get_product("BTC-USD")
+
+        self.assertEqual(result, mock_response)
+        self.mock_logger_instance.warning.assert_called_with(
+            "Serving stale cached %s.", "product BTC-USD"
+        )
+
+    def test_get_accounts_served_from_cache_and_stale_on_failure(self):
+        """Test get_accounts caches results and serves them stale on failure."""
+        mock_accounts = [{"id": "1"}]
+        self.mock_rest_client_instance.get_accounts.return_value = {
+            "accounts": mock_accounts
+        }
+        self.assertEqual(self.client.get_accounts(), mock_accounts)
+        self.assertEqual(self.client.get_accounts(), mock_accounts)
+        self.mock_rest_client_instance.get_accounts.assert_called_once()
+
+        self.client.invalidate_accounts()
+        self.assertEqual(self.client.get_accounts(), mock_accounts)
+        self.assertEqual(self.mock_rest_client_instance.get_accounts.call_count, 2)
+
+        self.client._accounts_cache.ttl = 0
+        self.mock_rest_client_instance.get_accounts.side_effect = (
+            self.mock_request_exception
+        )
+        self.assertEqual(self.client.get_accounts(), mock_accounts)
+        self.mock_logger_instance.warning.assert_called_with(
+            "Serving stale cached %s.", "accounts"
+        )
+
+    # --- Test rate limiting ---
+
+    @patch("trading.coinbase_client.random.uniform", return_value=0.0)
+    def test_call_api_retries_on_429(self, _):
+        """Test a 429 response is retried with exponential backoff."""
+        rate_limited = MagicMock(status_code=429)
+        self.mock_rest_client_instance.get_order.side_effect = [
+            HTTPError("429 Too Many Requests", response=rate_limited),
+            HTTPError("429 Too Many Requests", response=rate_limited),
+            {"order": {"order_id": "o-1"}},
+        ]
+
+        result = self.client.get_order("o-1")
+
+        self.assertEqual(result, {"order_id": "o-1"})
+        self.assertEqual(self.mock_sleep.call_args_list, [call(0.5), call(1.0)])
+
+    def test_call_api_gives_up_after_max_429_retries(self):
+        """Test persistent 429s eventually surface as an error."""
+        rate_limited = MagicMock(status_code=429)
+        self.mock_rest_client_instance.get_order.side_effect = HTTPError(
+            "429 Too Many Requests", response=rate_limited
+        )
+
+        result = self.client.get_order("o-1")
+
+        self.assertIsNone(result)
+        self.assertEqual(self.mock_sleep.call_count, coinbase_client.RETRY_MAX_RETRIES)
+
+    @patch("trading.coinbase_client.random.uniform", return_value=0.0)
+    def test_circuit_breaker_skips_failing_endpoint(self, _):
+        """Test an endpoint that keeps failing is skipped while others still run."""
+        self.mock_rest_client_instance.get_order.side_effect = self.mock_server_error
+        for _attempt in range(4):
+            self.assertIsNone(self.client.get_order("o-1"))
+        calls_before = self.mock_rest_client_instance.get_order.call_count
+
+        self.assertIsNone(self.client.get_order("o-1"))
+        self.assertEqual(
+            self.mock_rest_client_instance.get_order.call_count, calls_before
+        )
+        self.assertIn(
+            "Circuit open for", str(self.mock_logger_instance.error.call_args)
+        )
+
+        # Other endpoints have their own breaker.
+        self.mock_rest_client_instance.get_product.return_value = {
+            "product_id": "BTC-USD"
+        }
+        self.assertEqual(self.client.get_product("BTC-USD"), {"product_id": "BTC-USD"})
+
+    def test_circuit_breaker_ignores_permanent_errors(self):
+        """Test non-retryable errors do not count against the endpoint."""
+        self.mock_rest_client_instance.get_order.side_effect = self.mock_http_error
+        for _attempt in range(5):
+            self.client.get_order("o-1")
+
+        self.assertEqual(self.mock_rest_client_instance.get_order.call_count, 5)
+
+    def test_circuit_breaker_ignores_malformed_payloads(self):
+        """Test payload errors do not count: the endpoint did answer."""
+        for error in (TypeError("bad payload"), KeyError("order")):
+            self.mock_rest_client_instance.get_order.side_effect = error
+            for _attempt in range(3):
+                self.client.get_order("o-1")
+
+        self.assertEqual(self.mock_rest_client_instance.get_order.call_count, 6)
+
+    def test_call_api_feeds_rate_limit_headers_to_limiter(self):
+        """Test the response's rate-limit fields are passed to the limiter."""
+        self.mock_rest_client_instance.get_order.return_value = {
+            "order": {"order_id": "o-1"},
+            "rate_limit_limit": "30",
+            "rate_limit_remaining": "3",
+            "rate_limit_reset": "1",
+        }
+        with patch.object(self.client, "_limiter") as mock_limiter:
+            self.client.get_order("o-1")
+
+        mock_limiter.acquire.assert_called_once()
+        mock_limiter.update_from_headers.assert_called_once_with("30", "3", "1")
+
+    # --- Test async fan-out ---
+
+    def test_aget_product_book_delegates_to_sync_method(self):
+        """Test that aget_product_book returns the sync method's result."""
+        with patch.object(
+            self.client, "get_product_book", return_value={"bids": []}
+        ) as mock_book:
+            result = asyncio.run(self.client.aget_product_book("BTC-USD", 10))
+
+        self.assertEqual(result, {"bids": []})
+        mock_book.assert_called_once_with("BTC-USD", 10)
+
+    def test_acancel_orders_delegates_to_sync_method(self):
+        """Test that acancel_orders returns the sync method's result."""
+        results = [{"success": True, "order_id": "order-1"}]
+        with patch.object(
+            self.client, "cancel_orders", return_value=results
+        ) as mock_cancel:
+            result = asyncio.run(self.client.acancel_orders(["order-1"]))
+
+        self.assertEqual(result, results)
+        mock_cancel.assert_called_once_with(["order-1"])
+
+    def test_gather_public_candles_maps_results_by_product(self):
+        """Test that gather_public_candles fetches every product and keys by id."""
+        candles_by_product = {"BTC-USD": [{"open": "1"}], "ETH-USD": None}
+
+        def fake_candles(product_id, granularity, start=None, end=None):
+            return candles_by_product[product_id]
+
+        with patch.object(
+            self.client, "get_public_candles", side_effect=fake_candles
+        ) as mock_candles:
+            result = asyncio.run(
+                self.client.gather_public_candles(
+                    ["BTC-USD", "ETH-USD"], "ONE_HOUR", max_concurrency=1
+                )
+            )
+
+        self.assertEqual(result, candles_by_product)
+        self.assertEqual(mock_candles.call_count, 2)
+
+    def test_gather_public_candles_invalid_concurrency(self):
+        """Test that a non-positive max_concurrency is rejected."""
+        with self.assertRaises(AssertionError) as cm:
+            asyncio.run(
+                self.client.gather_public_candles(
+                    ["BTC-USD"], "ONE_HOUR", max_concurrency=0
+                )
+            )
+        self.assertEqual(str(cm.exception), "max_concurrency must be positive.")
+
+    def test_gather_product_books_maps_results_by_product(self):
+        """Test that gather_product_books passes the limit and keys by id."""
+        books = {"BTC-USD": {"bids": []}, "ETH-USD": None}
+
+        with patch.object(
+            self.client,
+            "get_product_book",
+            side_effect=lambda product_id, limit: books[product_id],
+        ) as mock_book:
+            result = asyncio.run(
+                self.client.gather_product_books(["BTC-USD", "ETH-USD"], limit=5)
+            )
+
+        self.assertEqual(result, books)
+        mock_book.assert_has_calls(
+            [call("BTC-USD", 5), call("ETH-USD", 5)], any_order=True
+        )
+
+    def test_gather_orders_maps_results_by_order(self):
+        """Test that gather_orders fetches every order and keys by id."""
+        orders = {"order-1": {"status": "OPEN"}, "order-2": {"status": "FILLED"}}
+
+        with patch.object(
+            self.client, "get_order", side_effect=lambda order_id: orders[order_id]
+        ):
+            result = asyncio.run(
+                self.client.gather_orders(["order-1", "order-2"], max_concurrency=1)
+            )
+
+        self.assertEqual(result, orders)
+
+    def test_aget_order_runs_on_shared_executor(self):
+        """Test that async calls run on the dedicated I/O executor threads."""
+
+        def fake_get_order(order_id):
+            return {"order_id": order_id, "thread": threading.current_thread().name}
+
+        with patch.object(self.client, "get_order", side_effect=fake_get_order):
+            result = asyncio.run(self.client.aget_order("o-1"))
+
+        self.assertEqual(result["order_id"], "o-1")
+        self.assertTrue(result["thread"].startswith("coinbase-io"))
+
+    def test_gather_candles_uses_configured_granularity(self):
+        """Test gather_candles fetches every configured pair at its granularity."""
+        with patch.object(
+            self.client, "get_public_candles", return_value=[]
+        ) as mock_candles:
+            result = asyncio.run(self.client.gather_candles())
+
+        self.assertEqual(set(result), {"ETH-USD", "BTC-USD", "LTC-USD"})
+        for product_id, pair_config in real_config.TRADING_PAIRS.items():
+            mock_candles.assert_any_call(
+                product_id, pair_config["candle_granularity_api_name"], None, None
+            )
+
+    def test_gather_candles_rejects_unknown_pair(self):
+        """Test that products without a trading pair config are rejected."""
+        with self.assertRaises(AssertionError) as cm:
+            asyncio.run(self.client.gather_candles(["DOGE-USD"]))
+        self.assertEqual(
+            str(cm.exception), "DOGE-USD is not a configured trading pair."
+        )
+
+    def test_health_check_reports_each_endpoint(self):
+        """Test health_check probes accounts, candles and books for every pair."""
+        with patch.object(self.client, "get_accounts", return_value=[]), patch.object(
+            self.client,
+            "get_public_candles",
+            side_effect=lambda product_id, *args: (
+                None if product_id == "LTC-USD" else []
+            ),
+        ), patch.object(
+            self.client, "get_product_book", return_value={"bids": []}
+        ) as mock_book:
+            result = asyncio.run(self.client.health_check(["BTC-USD", "LTC-USD"]))
+
+        self.assertEqual(
+            result,
+            {
+                "accounts": True,
+                "candles:BTC-USD": True,
+                "book:BTC-USD": True,
+                "candles:LTC-USD": False,
+                "book:LTC-USD": True,
+            },
+        )
+        mock_book.assert_any_call("BTC-USD", 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -115,6 +115,22 @@ class TestConfig(unittest.TestCase):
         ):
             self._import_config()
 
+    @mock.patch("dotenv.load_dotenv")
+    @mock.patch.dict(
+        os.environ,
+        {"COINBASE_API_KEY": "test_key", "COINBASE_API_SECRET": "test_secret"},
+        clear=True,
+    )
+    def test_dotenv_skipped_when_keys_set(self, mock_load_dotenv):
+        """Test the .env file is only loaded when the API keys are missing."""
+        self._import_config()
+        mock_load_dotenv.assert_not_called()
+
+        del os.environ["COINBASE_API_SECRET"]
+        with self.assertRaises(AssertionError):
+            self._import_config()
+        mock_load_dotenv.assert_called_once_with()
+
     @mock.patch.dict(
         os.environ,
         {"COINBASE_API_KEY": "test_key", "COINBASE_API_SECRET": "test_secret"},
@@ -163,6 +179,22 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.CANDLE_GRANULARITY_SECONDS["FIFTEEN_MINUTE"], 900)
         self.assertEqual(config.CANDLE_GRANULARITY_SECONDS["ONE_DAY"], 86400)
 
+    @mock.patch.dict(
+        os.environ,
+        {"COINBASE_API_KEY": "test_key", "COINBASE_API_SECRET": "test_secret"},
+        clear=True,
+    )
+    def test_validate_config_rejects_invalid_pair(self):
+        """Test _validate_config asserts on a malformed trading pair."""
+        config = self._import_config()
+        config._validate_config(config.TRADING_PAIRS)  # The shipped config is valid.
+
+        bad_pair = dict(config.TRADING_PAIRS["ETH-USD"], rsi_period=0)
+        with self.assertRaisesRegex(
+            AssertionError, "rsi_period for ETH-USD must be a positive integer."
+        ):
+            config._validate_config({"ETH-USD": bad_pair})
+
     @mock.patch.dict(
         os.environ,
         {"COINBASE_API_KEY": "test_key", "COINBASE_API_SECRET": "test_secret"},
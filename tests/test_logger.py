@@ -3,6 +3,7 @@
 import os
 import sys
 import logging
+import logging.handlers
 import unittest
 import tempfile
 import shutil
@@ -62,17 +63,94 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(logger.name, logger_module.APP_LOGGER_NAME)
         self.assertEqual(logger.level, logging.DEBUG)
 
-        # Check that handlers are present
+        # Records go through a single queue handler to the real handlers.
+        self.assertEqual(len(logger.handlers), 1)
+        self.assertIsInstance(logger.handlers[0], logging.handlers.QueueHandler)
+        target_handlers = logger.handlers[0].listener.handlers
         self.assertTrue(
-            any(isinstance(h, logging.StreamHandler) for h in logger.handlers)
+            any(isinstance(h, logging.StreamHandler) for h in target_handlers)
         )
-        self.assertTrue(
-            any(isinstance(h, logging.FileHandler) for h in logger.handlers)
+        buffer_handler = next(
+            h for h in target_handlers if isinstance(h, logging.handlers.MemoryHandler)
+        )
+        self.assertEqual(buffer_handler.flushLevel, logging.ERROR)
+        self.assertIsInstance(
+            buffer_handler.target, logging.handlers.RotatingFileHandler
         )
 
         # Check that the log file was created
         self.assertTrue(os.path.isfile(self.log_file))
 
+    def test_debug_level_keeps_source_location(self):
+        """Test DEBUG logging captures and formats the caller's location."""
+        logger = logger_module.setup_logging(
+            level="DEBUG",
+            log_file=mock_config.LOG_FILE,
+            persistence_dir=mock_config.PERSISTENCE_DIR,
+        )
+        self.assertIsNotNone(logging._srcfile)
+        formatter = logger.handlers[0].listener.handlers[0].formatter
+        self.assertEqual(formatter._fmt, logger_module.DEBUG_LOG_FORMAT)
+
+    def test_info_level_skips_source_location(self):
+        """Test non-DEBUG logging skips the caller lookup and its format fields."""
+        logger = logger_module.setup_logging(
+            level="INFO",
+            log_file=mock_config.LOG_FILE,
+            persistence_dir=mock_config.PERSISTENCE_DIR,
+        )
+        self.assertIsNone(logging._srcfile)
+        self.assertFalse(logging.logThreads)
+        formatter = logger.handlers[0].listener.handlers[0].formatter
+        self.assertEqual(formatter._fmt, logger_module.LOG_FORMAT)
+
+        logger_module._reset_logger()
+        self.assertIsNotNone(logging._srcfile)
+        self.assertTrue(logging.logThreads)
+
+    def test_file_records_are_buffered_until_error(self):
+        """Test file writes are batched but an ERROR record flushes them."""
+        logger = logger_module.setup_logging(
+            level=mock_config.LOG_LEVEL,
+            log_file=mock_config.LOG_FILE,
+            persistence_dir=mock_config.PERSISTENCE_DIR,
+        )
+        listener = logger.handlers[0].listener
+        logger.info("buffered message")
+        listener.stop()  # Stopping waits until queued records are handled.
+        with open(self.log_file, "r") as f:
+            self.assertNotIn("buffered message", f.read())
+
+        listener.start()
+        logger.error("flushing message")
+        listener.stop()
+        with open(self.log_file, "r") as f:
+            content = f.read()
+        self.assertIn("buffered message", content)
+        self.assertIn("flushing message", content)
+        listener.start()
+
+    def test_reset_stops_listener_and_closes_handlers(self):
+        """Test closing the queue handler stops its listener and closes targets."""
+        logger = logger_module.setup_logging(
+            level=mock_config.LOG_LEVEL,
+            log_file=mock_config.LOG_FILE,
+            persistence_dir=mock_config.PERSISTENCE_DIR,
+        )
+        queue_handler = logger.handlers[0]
+        buffer_handler = next(
+            h
+            for h in queue_handler.listener.handlers
+            if isinstance(h, logging.handlers.MemoryHandler)
+        )
+        file_handler = buffer_handler.target
+
+        logger_module._reset_logger()
+
+        self.assertIsNone(queue_handler.listener)
+        self.assertIsNone(file_handler.stream)
+        self.assertEqual(logger.handlers, [])
+
     def test_get_logger_before_setup(self):
         """Test that get_logger raises an error if called before setup."""
         with self.assertRaisesRegex(RuntimeError, "Logger not initialized"):
@@ -87,6 +165,8 @@ class TestLogger(unittest.TestCase):
         )
         test_message = "This is a test message for file logging."
         logger.info(test_message)
+        # Resetting closes the queue handler, which drains it to the file.
+        logger_module._reset_logger()
 
         with open(self.log_file, "r") as f:
             content = f.read()
@@ -106,7 +186,9 @@ class TestLogger(unittest.TestCase):
             )
         self.assertIn("Failed to create log directory", str(cm.exception))
 
-    @patch("logging.FileHandler", side_effect=IOError("Permission denied"))
+    @patch(
+        "trading.logger.RotatingFileHandler", side_effect=IOError("Permission denied")
+    )
     def test_file_handler_creation_io_error(self, mock_file_handler):
         """Test behavior when creating the FileHandler raises an IOError."""
         # This call should handle the error gracefully and not raise an exception
@@ -118,8 +200,9 @@ class TestLogger(unittest.TestCase):
 
         # Verify that only the StreamHandler was added.
         app_logger = logger_module.get_logger()
-        self.assertEqual(len(app_logger.handlers), 1)
-        self.assertIsInstance(app_logger.handlers[0], logging.StreamHandler)
+        target_handlers = app_logger.handlers[0].listener.handlers
+        self.assertEqual(len(target_handlers), 1)
+        self.assertIsInstance(target_handlers[0], logging.StreamHandler)
 
 
 if __name__ == "__main__":
@@ -3,25 +3,27 @@
 import unittest
 import tempfile
 import shutil
-from unittest.mock import patch, call
+import signal
+from unittest.mock import ANY, patch, call
 
 # Import the module to be tested
 import main
+from trading import order_calculator, signal_analyzer, technical_analysis
 
 
 class TestMainModule(unittest.TestCase):
     """Tests for the main.py run_bot function."""
 
-    @patch("main.PersistenceManager")
-    @patch("main.coinbase_client.CoinbaseClient")
-    @patch("main.TradeManager")
+    @patch("trading.persistence.PersistenceManager")
+    @patch("trading.coinbase_client.CoinbaseClient")
+    @patch("trading.trade_manager.TradeManager")
     @patch("main.config")
-    @patch("main.get_logger")
+    @patch("main.setup_logging")
     @patch("main.sys.exit")
     def test_run_bot_success(
         self,
         mock_exit,
-        mock_get_logger,
+        mock_setup_logging,
         mock_config,
         mock_trade_manager,
         mock_persistence_manager,  # This is the CoinbaseClient mock
@@ -33,7 +35,7 @@ class TestMainModule(unittest.TestCase):
             mock_config.LOG_LEVEL = "INFO"
             mock_config.LOG_FILE = "test.log"
             mock_config.PERSISTENCE_DIR = tmp_dir
-        mock_logger = mock_get_logger.return_value
+        mock_logger = mock_setup_logging.return_value
         mock_client_instance = mock_persistence_manager.return_value
         mock_tm_instance = mock_trade_manager.return_value
         mock_pm_instance = mock_coinbase_client.return_value
@@ -46,28 +48,32 @@ class TestMainModule(unittest.TestCase):
         mock_trade_manager.assert_called_once_with(
             client=mock_client_instance,
             persistence_manager=mock_pm_instance,
-            ta_module=main.technical_analysis,
+            ta_module=technical_analysis,
             config_module=mock_config,
             logger=mock_logger,
-            signal_analyzer=main.signal_analyzer,
-            order_calculator=main.order_calculator,
+            signal_analyzer=signal_analyzer,
+            order_calculator=order_calculator,
         )
 
+        mock_client_instance.get_products.assert_called_once_with(
+            ["BTC-USD", "ETH-USD"]
+        )
         self.assertEqual(mock_tm_instance.process_asset_trade_cycle.call_count, 2)
         mock_tm_instance.process_asset_trade_cycle.assert_has_calls(
             [
                 call(asset_id="BTC-USD"),
                 call(asset_id="ETH-USD"),
-            ]
+            ],
+            any_order=True,
         )
         mock_exit.assert_not_called()
 
-    @patch("main.coinbase_client.CoinbaseClient")
+    @patch("trading.coinbase_client.CoinbaseClient")
     @patch("main.config")
-    @patch("main.get_logger")
+    @patch("main.setup_logging")
     @patch("main.sys.exit")
     def test_run_bot_client_initialization_failure(
-        self, mock_exit, mock_get_logger, mock_config, mock_coinbase_client
+        self, mock_exit, mock_setup_logging, mock_config, mock_coinbase_client
     ):
         """Test run_bot exits when CoinbaseClient initialization fails."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -75,27 +81,28 @@ class TestMainModule(unittest.TestCase):
             mock_config.LOG_LEVEL = "INFO"
             mock_config.LOG_FILE = "test.log"
             mock_config.PERSISTENCE_DIR = tmp_dir
-        mock_logger = mock_get_logger.return_value
+        mock_logger = mock_setup_logging.return_value
         error_message = "Invalid API keys"
         mock_coinbase_client.side_effect = RuntimeError(error_message)
 
         main.run_bot()
 
         mock_logger.critical.assert_called_once_with(
-            f"A critical error halted the bot: {error_message}",
+            "A critical error halted the bot: %s",
+            mock_coinbase_client.side_effect,
             exc_info=True,
         )
         mock_exit.assert_called_once_with(1)
 
-    @patch("main.coinbase_client.CoinbaseClient")
-    @patch("main.TradeManager")
+    @patch("trading.coinbase_client.CoinbaseClient")
+    @patch("trading.trade_manager.TradeManager")
     @patch("main.config")
-    @patch("main.get_logger")
+    @patch("main.setup_logging")
     @patch("main.sys.exit")
     def test_run_bot_asset_processing_error_continues(
         self,
         mock_exit,
-        mock_get_logger,
+        mock_setup_logging,
         mock_config,
         mock_trade_manager,
         mock_coinbase_client,
@@ -106,13 +113,18 @@ class TestMainModule(unittest.TestCase):
             mock_config.LOG_LEVEL = "INFO"
             mock_config.LOG_FILE = "test.log"
             mock_config.PERSISTENCE_DIR = tmp_dir
-        mock_logger = mock_get_logger.return_value
+        mock_logger = mock_setup_logging.return_value
         mock_tm_instance = mock_trade_manager.return_value
         error_message = "Test processing error"
-        mock_tm_instance.process_asset_trade_cycle.side_effect = [
-            Exception(error_message),
-            None,  # Success for the second asset
-        ]
+
+        def process_asset_trade_cycle(asset_id):
+            # Cycles run concurrently, so fail by asset rather than call order.
+            if asset_id == "BTC-USD":
+                raise Exception(error_message)
+
+        mock_tm_instance.process_asset_trade_cycle.side_effect = (
+            process_asset_trade_cycle
+        )
 
         main.run_bot()
 
@@ -120,11 +132,23 @@ class TestMainModule(unittest.TestCase):
         self.assertEqual(mock_tm_instance.process_asset_trade_cycle.call_count, 2)
 
         mock_logger.error.assert_called_once_with(
-            f"An unexpected error occurred while processing BTC-USD: {error_message}",
+            "An unexpected error occurred while processing %s: %s",
+            "BTC-USD",
+            ANY,
             exc_info=True,
         )
+        self.assertEqual(str(mock_logger.error.call_args.args[2]), error_message)
+        mock_logger.info.assert_any_call(
+            "Trade cycles complete: %d succeeded, %d failed.", 1, 1
+        )
         mock_exit.assert_not_called()
 
+    def test_exit_on_signal_raises_system_exit(self):
+        """Test a termination signal becomes a SystemExit with status 128+N."""
+        with self.assertRaises(SystemExit) as cm:
+            main._exit_on_signal(signal.SIGTERM, None)
+        self.assertEqual(cm.exception.code, 128 + signal.SIGTERM)
+
 
 if __name__ == "__main__":
     unittest.main()
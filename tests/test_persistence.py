@@ -2,6 +2,8 @@
 Unit tests for the persistence.py module.
 """
 
+import math
+import os
 import unittest
 import pytest
 from unittest.mock import mock_open, patch
@@ -23,11 +25,21 @@ def persistence_manager(mock_logger, tmp_path):
 class TestPersistenceManager:
     """Test suite for persistence functions, pytest-style."""
 
+    @patch("trading.persistence._fsync_directory")
+    @patch("trading.persistence.os.replace")
+    @patch("trading.persistence.os.fsync")
     @patch("trading.persistence.os.makedirs")
     @patch("builtins.open", new_callable=mock_open)
-    @patch("json.dump")
+    @patch("json.dumps", return_value='{"key": "value"}')
     def test_save_trade_state_success(
-        self, mock_json_dump, mock_file_open, mock_os_makedirs, persistence_manager
+        self,
+        mock_json_dumps,
+        mock_file_open,
+        mock_os_makedirs,
+        mock_fsync,
+        mock_replace,
+        mock_fsync_directory,
+        persistence_manager,
     ):
         """Test save_trade_state successfully saves data."""
         asset_id = "BTC-USD"
@@ -39,30 +51,31 @@ class TestPersistenceManager:
         mock_os_makedirs.assert_called_once_with(
             persistence_manager.persistence_dir, exist_ok=True
         )
-        mock_file_open.assert_called_once_with(
-            expected_file_path, "w", encoding="utf-8"
+        tmp_path = f"{expected_file_path}.tmp"
+        mock_file_open.assert_called_once_with(tmp_path, "w", encoding="utf-8")
+        mock_json_dumps.assert_called_once_with(state_data, indent=4, allow_nan=False)
+        mock_file_open().write.assert_called_once_with('{"key": "value"}')
+        mock_fsync.assert_called_once_with(mock_file_open().fileno())
+        mock_replace.assert_called_once_with(tmp_path, expected_file_path)
+        mock_fsync_directory.assert_called_once_with(
+            persistence_manager.persistence_dir
         )
-        mock_json_dump.assert_called_once_with(state_data, mock_file_open(), indent=4)
 
     @patch("trading.persistence.os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data='{"key": "value"}')
-    @patch("json.load")
+    @patch("builtins.open", new_callable=mock_open, read_data=b'{"key": "value"}')
     def test_load_trade_state_success(
-        self, mock_json_load, mock_file_open, mock_os_exists, persistence_manager
+        self, mock_file_open, mock_os_exists, persistence_manager
     ):
         """Test load_trade_state successfully loads data."""
         asset_id = "BTC-USD"
         expected_data = {"key": "value"}
-        mock_json_load.return_value = expected_data
         expected_file_path = persistence_manager._get_file_path(asset_id)
 
         loaded_data = persistence_manager.load_trade_state(asset_id)
 
         mock_os_exists.assert_called_once_with(expected_file_path)
-        mock_file_open.assert_called_once_with(
-            expected_file_path, "r", encoding="utf-8"
-        )
-        mock_json_load.assert_called_once_with(mock_file_open())
+        mock_file_open.assert_called_once_with(expected_file_path, "rb")
+        mock_file_open().read.assert_called_once_with()
         assert loaded_data == expected_data
 
     @patch("os.path.exists", return_value=False)
@@ -72,7 +85,7 @@ class TestPersistenceManager:
         mock_exists.assert_called_once()
 
     @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data="invalid json")
+    @patch("builtins.open", new_callable=mock_open, read_data=b"invalid json")
     def test_load_trade_state_json_decode_error(
         self, mock_file, mock_exists, persistence_manager
     ):
@@ -80,7 +93,7 @@ class TestPersistenceManager:
         assert persistence_manager.load_trade_state("BAD-JSON") == {}
 
     @patch("os.path.exists", return_value=True)
-    @patch("builtins.open", new_callable=mock_open, read_data='["not a dict"]')
+    @patch("builtins.open", new_callable=mock_open, read_data=b'["not a dict"]')
     def test_load_trade_state_corrupted_data_not_dict(
         self, mock_exists, mock_file, persistence_manager
     ):
@@ -494,7 +507,7 @@ def test_load_trade_state_empty_asset_id_raises_error(persistence_manager):
 def test_load_trade_state_json_decode_error_logs_traceback(persistence_manager):
     """Kill mutant #24: Test that JSONDecodeError on load logs with exc_info=True."""
     asset_id = "test-asset"
-    mock_file_content = "this is not valid json"
+    mock_file_content = b"this is not valid json"
 
     with patch("os.path.exists", return_value=True):
         with patch("builtins.open", mock_open(read_data=mock_file_content)):
@@ -675,5 +688,95 @@ def test_update_sell_order_stops_after_found(persistence_manager):
             mock_save.assert_called_once()
 
 
+def test_save_trade_state_failed_write_keeps_previous_state(persistence_manager):
+    """Test a write that fails before the rename leaves the old file intact."""
+    asset_id = "BTC-USD"
+    persistence_manager.save_trade_state(asset_id, {"key": "old"})
+
+    with patch("trading.persistence.os.fsync", side_effect=OSError("I/O error")):
+        with pytest.raises(IOError):
+            persistence_manager.save_trade_state(asset_id, {"key": "new"})
+
+    assert persistence_manager.load_trade_state(asset_id) == {"key": "old"}
+    file_path = persistence_manager._get_file_path(asset_id)
+    assert not os.path.exists(f"{file_path}.tmp")
+
+
+def test_save_trade_state_syncs_directory_after_rename(persistence_manager):
+    """Test the directory is synced after the state file is renamed into place."""
+    events = []
+    real_replace = os.replace
+    with patch(
+        "trading.persistence.os.replace",
+        side_effect=lambda src, dst: (events.append("replace"), real_replace(src, dst)),
+    ), patch(
+        "trading.persistence._fsync_directory",
+        side_effect=lambda directory: events.append(("fsync_dir", directory)),
+    ):
+        persistence_manager.save_trade_state("BTC-USD", {"key": "value"})
+
+    assert events == ["replace", ("fsync_dir", persistence_manager.persistence_dir)]
+
+
+def test_save_and_load_trade_state_round_trip(persistence_manager):
+    """Test whatever save_trade_state writes, load_trade_state reads back."""
+    asset_id = "BTC-USD"
+    state = {
+        "filled_buy_trade": {
+            "buy_order_id": "buy123",
+            "timestamp": 1700000000.5,
+            "buy_price": "50000.00",
+            "associated_sell_orders": [{"order_id": "sell1", "status": "open"}],
+        }
+    }
+    persistence_manager.save_trade_state(asset_id, state)
+    assert persistence_manager.load_trade_state(asset_id) == state
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_save_trade_state_rejects_non_finite_floats(persistence_manager, value):
+    """Test a state that could not be read back is refused, keeping the old one."""
+    asset_id = "BTC-USD"
+    persistence_manager.save_trade_state(asset_id, {"timestamp": 1.0})
+
+    with pytest.raises(
+        ValueError,
+        match=r"^state_data contains a non-finite number \(NaN or Infinity\)\.$",
+    ):
+        persistence_manager.save_trade_state(asset_id, {"timestamp": value})
+
+    assert persistence_manager.load_trade_state(asset_id) == {"timestamp": 1.0}
+    args, kwargs = persistence_manager.logger.error.call_args
+    assert args[0].startswith(f"Non-finite number in state_data for {asset_id}")
+    assert kwargs["exc_info"] is True
+
+
+def test_load_trade_state_reads_legacy_non_finite_floats(persistence_manager):
+    """Test files saved before NaN and Infinity were rejected still load."""
+    asset_id = "BTC-USD"
+    os.makedirs(persistence_manager.persistence_dir, exist_ok=True)
+    with open(persistence_manager._get_file_path(asset_id), "w") as f:
+        f.write('{"low": NaN, "high": Infinity, "price": 1.5}')
+
+    state = persistence_manager.load_trade_state(asset_id)
+
+    assert math.isnan(state["low"])
+    assert state["high"] == float("inf")
+    assert state["price"] == 1.5
+    persistence_manager.logger.error.assert_not_called()
+
+
+def test_load_trade_state_remembers_missing_file(persistence_manager):
+    """Test a missing state file is only checked for once, until a save."""
+    asset_id = "BTC-USD"
+    with patch("trading.persistence.os.path.exists", return_value=False) as exists:
+        assert persistence_manager.load_trade_state(asset_id) == {}
+        assert persistence_manager.load_trade_state(asset_id) == {}
+    exists.assert_called_once()
+
+    persistence_manager.save_trade_state(asset_id, {"key": "value"})
+    assert persistence_manager.load_trade_state(asset_id) == {"key": "value"}
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,86 @@
+"""Unit tests for the trading.rate_limiter module."""
+
+import unittest
+from unittest.mock import patch
+
+from trading.rate_limiter import TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for the TokenBucket class."""
+
+    @patch("trading.rate_limiter.time.sleep")
+    @patch("trading.rate_limiter.time.monotonic", return_value=100.0)
+    def test_acquire_within_capacity_does_not_wait(self, _, mock_sleep):
+        """Test requests within the burst capacity are not delayed."""
+        bucket = TokenBucket(rate=2.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        mock_sleep.assert_not_called()
+
+    @patch("trading.rate_limiter.time.sleep")
+    @patch("trading.rate_limiter.time.monotonic")
+    def test_acquire_waits_for_refill_when_empty(self, mock_monotonic, mock_sleep):
+        """Test an empty bucket sleeps until the next token is available."""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=2.0)
+        bucket.acquire()
+        bucket.acquire()
+
+        mock_sleep.side_effect = lambda delay: setattr(
+            mock_monotonic, "return_value", mock_monotonic.return_value + delay
+        )
+        waited = bucket.acquire()
+
+        self.assertAlmostEqual(waited, 0.5)
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_update_from_headers_shrinks_and_restores_rate(self):
+        """Test the rate drops when the budget is low and recovers when ample."""
+        bucket = TokenBucket(rate=30.0)
+
+        bucket.update_from_headers(limit="30", remaining="3", reset=None)
+        self.assertAlmostEqual(bucket.rate, 15.0)
+
+        bucket.update_from_headers(limit="30", remaining="0", reset=None)
+        self.assertEqual(bucket.rate, bucket.min_rate)
+
+        bucket.update_from_headers(limit="30", remaining="25", reset=None)
+        self.assertEqual(bucket.rate, 30.0)
+
+    def test_update_from_headers_ignores_missing_values(self):
+        """Test unusable header values leave the limiter untouched."""
+        bucket = TokenBucket(rate=10.0)
+        bucket.update_from_headers(limit=None, remaining="1", reset=None)
+        bucket.update_from_headers(limit="abc", remaining="1", reset=None)
+        bucket.update_from_headers(limit="0", remaining="1", reset=None)
+        self.assertEqual(bucket.rate, 10.0)
+
+    @patch("trading.rate_limiter.time.sleep")
+    @patch("trading.rate_limiter.time.monotonic")
+    def test_exhausted_budget_pauses_until_reset(self, mock_monotonic, mock_sleep):
+        """Test an exhausted budget blocks acquire until the reset time."""
+        mock_monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=10.0)
+        bucket.update_from_headers(limit="10", remaining="0", reset="2")
+
+        mock_sleep.side_effect = lambda delay: setattr(
+            mock_monotonic, "return_value", mock_monotonic.return_value + delay
+        )
+        waited = bucket.acquire()
+
+        self.assertGreaterEqual(waited, 2.0)
+        self.assertEqual(mock_sleep.call_args_list[0].args, (2.0,))
+
+    def test_invalid_arguments(self):
+        """Test invalid constructor arguments are rejected."""
+        with self.assertRaises(AssertionError):
+            TokenBucket(rate=0)
+        with self.assertRaises(AssertionError):
+            TokenBucket(rate=5.0, min_rate=10.0)
+        with self.assertRaises(AssertionError):
+            TokenBucket(rate=5.0, capacity=0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Unit tests for the scripts/smoke_client.py helper script."""
+
+import importlib.util
+import os
+import unittest
+from unittest.mock import patch
+
+from trading import logger
+
+SCRIPT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "scripts",
+    "smoke_client.py",
+)
+
+
+def _load_script():
+    """Imports the script as a module without running its __main__ block."""
+    spec = importlib.util.spec_from_file_location("smoke_client", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestSmokeClient(unittest.TestCase):
+    """Tests for the smoke_client main function."""
+
+    @patch("trading.coinbase_client.RESTClient")
+    def test_main_sets_up_logging_and_reports_success(self, mock_rest_client):
+        """Test main works in a fresh process where logging is not set up yet."""
+        smoke_client = _load_script()
+        logger._reset_logger()
+        rest_client = mock_rest_client.return_value
+        rest_client.get_accounts.return_value = {"accounts": [{"uuid": "1"}]}
+        rest_client.get_public_candles.return_value = {"candles": [{"open": "100"}]}
+        rest_client.get_product_book.return_value = {
+            "pricebook": {"bids": [["100", "10"]], "asks": [["101", "10"]]}
+        }
+
+        with patch("builtins.print") as mock_print:
+            exit_code = smoke_client.main()
+
+        self.assertEqual(exit_code, 0)
+        mock_rest_client.assert_called_once()
+        mock_print.assert_any_call("accounts: OK")
+
+    @patch("trading.coinbase_client.RESTClient")
+    def test_main_returns_failure_when_a_check_fails(self, mock_rest_client):
+        """Test main exits non-zero if any endpoint returns no data."""
+        smoke_client = _load_script()
+        mock_rest_client.return_value.get_accounts.side_effect = ValueError("bad")
+
+        with patch("builtins.print") as mock_print:
+            exit_code = smoke_client.main()
+
+        self.assertEqual(exit_code, 1)
+        mock_print.assert_any_call("accounts: FAILED")
+
+
+if __name__ == "__main__":
+    unittest.main()